@@ -1,6 +1,21 @@
+import asyncio
+import functools
+import logging
 import os
+import threading
+import weakref
 from abc import ABC, abstractmethod
-from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 __version__ = "0.1.0"
 __author__ = "Gbenga <adeyigbenga005@gmail.com>"
@@ -8,16 +23,115 @@ __author__ = "Gbenga <adeyigbenga005@gmail.com>"
 import httpx
 
 from pyquidax.exceptions import (
+    APIResponseException,
     UnsupportedHTTPMethodException,
     ConnectionException,
+    ForkException,
     MissingSecretKeyException,
 )
+from pyquidax.json_stream import aiter_json_items, iter_json_items
 from pyquidax.utils import HTTPMethod, APIResponse
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Connection pools, thread pools and locks do not survive `fork`: the child inherits
+# sockets the parent keeps using, threads that no longer run and locks that may be held
+# forever. Wrappers notice they run in another process and replace what they inherited.
+# Objects shared by several wrappers, e.g. the connection pool of `QuidaxClient`, get a
+# single replacement per process, so they stay shared.
+_fork_lock = threading.Lock()
+_fork_replacements: "weakref.WeakKeyDictionary[Any, Any]" = weakref.WeakKeyDictionary()
+_fork_factories: "weakref.WeakKeyDictionary[Any, Callable[[], Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+# Objects created by a wrapper or a pool for its own use. That owner closes their
+# replacements, while the replacements of objects injected by the caller are closed by
+# the wrappers using them.
+_fork_owned: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+
+def _reset_fork_state():
+    global _fork_lock
+    _fork_lock = threading.Lock()
+    _fork_replacements.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_fork_state)
+
+
+def register_fork_factory(shared: T, factory: Callable[[], T]):
+    """Registers how to recreate an object shared by several wrappers, e.g. an
+    `httpx.Client`, in a forked process. Objects that are not registered are recreated
+    by the factory of the first wrapper that needs them.
+
+    `factory` is kept as long as `shared` is alive, so it must not reference `shared`
+    nor its owner.
+    """
+    _fork_factories[shared] = factory
+
+
+def _replace_inherited(
+    inherited: T, factory: Optional[Callable[[], T]] = None
+) -> Optional[T]:
+    """Returns the object replacing `inherited` in the current process, creating it on
+    first use with its registered factory or else `factory`. Returns None if it has
+    neither."""
+    with _fork_lock:
+        replacement = _fork_replacements.get(inherited)
+        if replacement is None:
+            registered = _fork_factories.get(inherited) or factory
+            if registered is None:
+                return None
+            replacement = _fork_replacements[inherited] = registered()
+            _fork_factories[replacement] = registered
+            if inherited in _fork_owned:
+                _fork_owned.add(replacement)
+        return replacement
+
+
+def _create_http_client(keepalive_expiry: float) -> httpx.Client:
+    http_client = httpx.Client(limits=httpx.Limits(keepalive_expiry=keepalive_expiry))
+    register_fork_factory(
+        http_client, functools.partial(_create_http_client, keepalive_expiry)
+    )
+    _fork_owned.add(http_client)
+    return http_client
+
+
+def _replace_http_client(
+    inherited: T, owned: bool, factory: Callable[[], T]
+) -> Tuple[Optional[T], bool]:
+    """Returns the http client replacing `inherited` in the current process and
+    whether the caller owns it.
+
+    A client injected by the caller may be configured in ways a default one is not, so
+    it is only recreated by the factory registered for it, and None is returned when
+    there is none.
+    """
+    if owned:
+        return _replace_inherited(inherited, factory), True
+    replacement = _replace_inherited(inherited)
+    return replacement, replacement is not None and inherited not in _fork_owned
+
+
+def _forked_http_client_error() -> ForkException:
+    return ForkException(
+        "The http client given to this wrapper was created in the parent process and "
+        "cannot be used after a fork. Register how to recreate it with "
+        "`register_fork_factory(http_client, factory)` before forking."
+    )
+
 
 class AbstractAPIWrapper(ABC):
     ENV_SECRET_KEY_NAME = "QUIDAX_SECRET_KEY"
     API_VERSION = "v1"
+    KEEPALIVE_EXPIRY = 60.0
+    # The user whose details warm-up requests fetch. Wrappers acting for a sub-account
+    # set it to its id, so they only need access to that sub-account.
+    user_id = "me"
 
     def __init__(self, secret_key: Optional[str] = None):
         self._token = secret_key
@@ -33,6 +147,10 @@ class AbstractAPIWrapper(ABC):
     def base_url(self) -> str:
         return f"https://www.quidax.com/api/{self.API_VERSION}"
 
+    @property
+    def _warmup_url(self) -> str:
+        return f"{self.base_url}/users/{self.user_id}"
+
     @property
     def headers(self):
         return {
@@ -72,16 +190,175 @@ class AbstractAPIWrapper(ABC):
             status=str(response_body.get("status")),
             message=response_body.get("message"),
             data=response_body.get("data"),
+            meta=response_body.get("meta"),
+        )
+
+    def _raise_for_streamed_response(self, response: httpx.Response):
+        raise APIResponseException(
+            f"Request failed with status code {response.status_code}",
+            response=self._parse_response(response),
         )
 
 
 class BaseAPIWrapper(AbstractAPIWrapper):
-    def __init__(self, secret_key: Optional[str] = None):
+    def __init__(
+        self,
+        secret_key: Optional[str] = None,
+        http_client: Optional[httpx.Client] = None,
+    ):
         """
         Args:
             secret_key: Your Quidax secret key.
+            http_client: An optional `httpx.Client` whose connection pool is used to
+                send requests, e.g. to share one pool between several wrappers. When
+                omitted, a client is created on the first request and closed by `close`.
+                To use the wrapper after a `fork`, register how to recreate it with
+                `register_fork_factory`.
         """
         super().__init__(secret_key)
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        # A wrapper whose `http_client` this one uses instead of its own, e.g. the
+        # `QuidaxClient` of a binding.
+        self._http_client_owner: Optional["BaseAPIWrapper"] = None
+        self._fork_error: Optional[ForkException] = None
+        self._http_client_lock = threading.Lock()
+        self._keepalive_stopped: Optional[threading.Event] = None
+        self._keepalive_thread: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+
+    def _check_fork(self):
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._after_fork()
+
+    def _after_fork(self):
+        """Replaces the state inherited from the parent process. The inherited
+        connections are dropped without being closed, as closing them would disrupt
+        the parent's."""
+        self._http_client_lock = threading.Lock()
+        self._keepalive_stopped = None
+        self._keepalive_thread = None
+        if self._http_client is not None:
+            self._http_client, self._owns_http_client = _replace_http_client(
+                self._http_client, self._owns_http_client, self._create_http_client
+            )
+            if self._http_client is None:
+                self._fork_error = _forked_http_client_error()
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """The `httpx.Client` keeping connections to Quidax alive between requests.
+
+        In a process forked after it was created, a new one is created on first use.
+
+        Raises:
+            ForkException: If the client was given to the wrapper, the process was
+                forked and no factory was registered for it with
+                `register_fork_factory`.
+        """
+        self._check_fork()
+        if self._http_client_owner is not None:
+            return self._http_client_owner.http_client
+        if self._http_client is None:
+            if self._fork_error is not None:
+                raise self._fork_error
+            with self._http_client_lock:
+                if self._http_client is None:
+                    self._http_client = self._create_http_client()
+        return self._http_client
+
+    def _create_http_client(self) -> httpx.Client:
+        return _create_http_client(self.KEEPALIVE_EXPIRY)
+
+    def warmup(self, connections: int = 1) -> int:
+        """Opens connections to Quidax ahead of time, so the next requests skip the
+        DNS lookup and the TCP and TLS handshakes.
+
+        Each connection is opened by a lightweight authenticated request, all of them
+        being sent at once so the pool holds `connections` distinct connections.
+
+        Args:
+            connections: The number of connections to open.
+
+        Returns:
+            The number of requests that succeeded.
+        """
+        http_client = self.http_client
+
+        def ping() -> bool:
+            try:
+                http_client.get(self._warmup_url, headers=self.headers)
+            except httpx.HTTPError as error:
+                logger.warning("Warming up a connection failed: %r", error)
+                return False
+            except RuntimeError:
+                # httpx raises it when the client was closed meanwhile, e.g. by
+                # `close` while the keep-alive thread was warming up.
+                if http_client.is_closed:
+                    return False
+                raise
+            return True
+
+        if connections == 1:
+            return int(ping())
+        with ThreadPoolExecutor(
+            max_workers=connections, thread_name_prefix="pyquidax-warmup"
+        ) as executor:
+            return sum(executor.map(lambda _: ping(), range(connections)))
+
+    def start_keepalive(self, interval: float = 30.0, connections: int = 1):
+        """Warms up connections now and then every `interval` seconds on a background
+        daemon thread, so idle connections are not closed. `interval` should be
+        shorter than the idle timeout of the server and than `KEEPALIVE_EXPIRY`.
+
+        Args:
+            interval: The number of seconds between two rounds of warm-up requests.
+            connections: The number of connections to keep open.
+        """
+        if self._keepalive_stopped is not None:
+            return
+        stopped = self._keepalive_stopped = threading.Event()
+
+        def run():
+            while not stopped.is_set():
+                self.warmup(connections)
+                stopped.wait(interval)
+
+        self._keepalive_thread = threading.Thread(
+            target=run, name="pyquidax-keepalive", daemon=True
+        )
+        self._keepalive_thread.start()
+
+    def stop_keepalive(self, timeout: Optional[float] = 5.0):
+        """Stops the keep-alive thread started by `start_keepalive` and waits for it
+        to exit.
+
+        Args:
+            timeout: The longest number of seconds to wait for a warm-up in flight to
+                finish. Waits forever if None.
+        """
+        if self._keepalive_stopped is not None:
+            self._keepalive_stopped.set()
+            self._keepalive_stopped = None
+        thread, self._keepalive_thread = self._keepalive_thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def close(self):
+        """Stops the keep-alive thread, waiting for a warm-up in flight, and closes the
+        connections of the http client, if this wrapper created it."""
+        self._check_fork()
+        self.stop_keepalive()
+        if self._owns_http_client and self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     def _api_call(
         self,
@@ -94,14 +371,15 @@ class BaseAPIWrapper(AbstractAPIWrapper):
             method=method,
             data=data,
         )
+        http_client = self.http_client
         http_methods_mapping = {
-            HTTPMethod.GET: httpx.get,
-            HTTPMethod.POST: httpx.post,
-            HTTPMethod.PUT: httpx.put,
-            HTTPMethod.PATCH: httpx.patch,
-            HTTPMethod.DELETE: httpx.delete,
-            HTTPMethod.OPTIONS: httpx.options,
-            HTTPMethod.HEAD: httpx.head,
+            HTTPMethod.GET: http_client.get,
+            HTTPMethod.POST: http_client.post,
+            HTTPMethod.PUT: http_client.put,
+            HTTPMethod.PATCH: http_client.patch,
+            HTTPMethod.DELETE: http_client.delete,
+            HTTPMethod.OPTIONS: http_client.options,
+            HTTPMethod.HEAD: http_client.head,
         }
         http_method_callable = http_methods_mapping.get(method)
         if not http_method_callable:
@@ -118,10 +396,161 @@ class BaseAPIWrapper(AbstractAPIWrapper):
             raise ConnectionException("Server refused to respond")
         return self._parse_response(response)
 
+    def _stream_api_call(
+        self, url: str, method: HTTPMethod = HTTPMethod.GET, key: str = "data"
+    ) -> Iterator:
+        """Sends a request and yields the items of the `key` array of the response
+        body as it is downloaded, instead of loading the whole body in memory.
+
+        Raises:
+            APIResponseException: If the response status code is not 200.
+        """
+        http_method_call_kwargs = self._parse_call_kwargs(url=url, method=method)
+        try:
+            with self.http_client.stream(
+                method.value, **http_method_call_kwargs
+            ) as response:
+                if response.status_code != 200:
+                    response.read()
+                    self._raise_for_streamed_response(response)
+                yield from iter_json_items(response.iter_bytes(), key)
+        except httpx.ConnectError:
+            raise ConnectionException(
+                "Unable to connect to server. Please ensure you have an internet connection"
+            )
+        except httpx.ConnectTimeout:
+            raise ConnectionException("Server refused to respond")
+
 
 class BaseAsyncAPIWrapper(AbstractAPIWrapper):
-    def __init__(self, secret_key: Optional[str] = None):
+    def __init__(
+        self,
+        secret_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        """
+        Args:
+            secret_key: Your Quidax secret key.
+            http_client: An optional `httpx.AsyncClient` whose connection pool is used
+                to send requests. It must only be used from one event loop. When
+                omitted, a client is created for each event loop on its first request.
+                To use the wrapper after a `fork`, register how to recreate it with
+                `register_fork_factory`.
+        """
         super().__init__(secret_key)
+        self._http_client = http_client
+        self._owns_http_client = False
+        self._fork_error: Optional[ForkException] = None
+        # An `httpx.AsyncClient` is bound to the event loop its connections were
+        # opened in, so each loop gets its own pool.
+        self._http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._keepalive_task: Optional[asyncio.Task] = None
+        self._pid = os.getpid()
+
+    def _check_fork(self):
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._after_fork()
+
+    def _after_fork(self):
+        """Replaces the state inherited from the parent process. See
+        `BaseAPIWrapper._after_fork`."""
+        self._keepalive_task = None
+        # The dict may be shared with other wrappers, which then see it emptied too.
+        self._http_clients.clear()
+        if self._http_client is not None:
+            self._http_client, self._owns_http_client = _replace_http_client(
+                self._http_client, False, self._create_http_client
+            )
+            if self._http_client is None:
+                self._fork_error = _forked_http_client_error()
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """The `httpx.AsyncClient` of the running event loop, keeping connections to
+        Quidax alive between requests.
+
+        In a process forked after it was created, a new one is created on first use.
+
+        Raises:
+            ForkException: If the client was given to the wrapper, the process was
+                forked and no factory was registered for it with
+                `register_fork_factory`.
+        """
+        self._check_fork()
+        if self._http_client is not None:
+            return self._http_client
+        if self._fork_error is not None:
+            raise self._fork_error
+        loop = asyncio.get_running_loop()
+        http_client = self._http_clients.get(loop)
+        if http_client is None or http_client.is_closed:
+            http_client = self._http_clients[loop] = self._create_http_client()
+        return http_client
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            limits=httpx.Limits(keepalive_expiry=self.KEEPALIVE_EXPIRY)
+        )
+
+    async def warmup(self, connections: int = 1) -> int:
+        """Opens connections to Quidax ahead of time. See `BaseAPIWrapper.warmup`."""
+        http_client = self.http_client
+
+        async def ping() -> bool:
+            try:
+                await http_client.get(self._warmup_url, headers=self.headers)
+            except httpx.HTTPError as error:
+                logger.warning("Warming up a connection failed: %r", error)
+                return False
+            return True
+
+        return sum(await asyncio.gather(*(ping() for _ in range(connections))))
+
+    def start_keepalive(
+        self, interval: float = 30.0, connections: int = 1
+    ) -> asyncio.Task:
+        """Warms up connections now and then every `interval` seconds on a task of the
+        running event loop. See `BaseAPIWrapper.start_keepalive`."""
+        if self._keepalive_task is None or self._keepalive_task.done():
+
+            async def run():
+                while True:
+                    await self.warmup(connections)
+                    await asyncio.sleep(interval)
+
+            self._keepalive_task = asyncio.get_running_loop().create_task(run())
+        return self._keepalive_task
+
+    async def stop_keepalive(self):
+        """Cancels the keep-alive task and waits for it to finish."""
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+            try:
+                await self._keepalive_task
+            except asyncio.CancelledError:
+                pass
+            self._keepalive_task = None
+
+    async def aclose(self):
+        """Stops the keep-alive task and closes the connections opened in the running
+        event loop, unless the http client was provided."""
+        self._check_fork()
+        await self.stop_keepalive()
+        if self._owns_http_client:
+            await self._http_client.aclose()
+        elif self._http_client is None:
+            http_client = self._http_clients.pop(asyncio.get_running_loop(), None)
+            if http_client is not None:
+                await http_client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
 
     async def _api_call(
         self,
@@ -134,18 +563,38 @@ class BaseAsyncAPIWrapper(AbstractAPIWrapper):
             method=method,
             data=data,
         )
-        async with httpx.AsyncClient() as client:
-            http_method_callable = getattr(client, method.value.lower(), None)
-            if not http_method_callable:
-                raise UnsupportedHTTPMethodException(
-                    f"{method} is not a supported HTTP method"
-                )
-            try:
-                response = await http_method_callable(**http_method_call_kwargs)
-            except httpx.ConnectError:
-                raise ConnectionException(
-                    "Unable to connect to server. Please ensure you have an internet connection"
-                )
-            except httpx.ConnectTimeout:
-                raise ConnectionException("Server refused to respond")
-            return self._parse_response(response)
+        http_method_callable = getattr(self.http_client, method.value.lower(), None)
+        if not http_method_callable:
+            raise UnsupportedHTTPMethodException(
+                f"{method} is not a supported HTTP method"
+            )
+        try:
+            response = await http_method_callable(**http_method_call_kwargs)
+        except httpx.ConnectError:
+            raise ConnectionException(
+                "Unable to connect to server. Please ensure you have an internet connection"
+            )
+        except httpx.ConnectTimeout:
+            raise ConnectionException("Server refused to respond")
+        return self._parse_response(response)
+
+    async def _stream_api_call(
+        self, url: str, method: HTTPMethod = HTTPMethod.GET, key: str = "data"
+    ) -> AsyncIterator:
+        """An async version of `BaseAPIWrapper._stream_api_call`."""
+        http_method_call_kwargs = self._parse_call_kwargs(url=url, method=method)
+        try:
+            async with self.http_client.stream(
+                method.value, **http_method_call_kwargs
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    self._raise_for_streamed_response(response)
+                async for item in aiter_json_items(response.aiter_bytes(), key):
+                    yield item
+        except httpx.ConnectError:
+            raise ConnectionException(
+                "Unable to connect to server. Please ensure you have an internet connection"
+            )
+        except httpx.ConnectTimeout:
+            raise ConnectionException("Server refused to respond")
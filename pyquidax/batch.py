@@ -0,0 +1,132 @@
+import asyncio
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from pyquidax.exceptions import ConnectionException
+
+DEFAULT_MAX_WORKERS = 10
+DEFAULT_FATAL_ERRORS = (ConnectionException,)
+
+
+@dataclass
+class BatchResult:
+    """A dataclass holding the outcome of one call of a batch.
+
+    `value` is what the call returned, usually an `APIResponse`, and `error` is the
+    exception it raised, if any.
+    """
+
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> Any:
+        """Returns `value`, or raises `error` if the call failed."""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+def capture(function: Callable[[], Any]) -> BatchResult:
+    """Calls `function` and returns its outcome as a `BatchResult`."""
+    try:
+        return BatchResult(value=function())
+    except Exception as error:
+        return BatchResult(error=error)
+
+
+async def acapture(function: Callable[[], Awaitable[Any]]) -> BatchResult:
+    """An async version of `capture`."""
+    try:
+        return BatchResult(value=await function())
+    except Exception as error:
+        return BatchResult(error=error)
+
+
+def run_batch(
+    executor: Executor, calls: Iterable[Callable[[], Any]]
+) -> List[BatchResult]:
+    """Runs every call on `executor` concurrently and waits for all of them.
+
+    Returns:
+        A `BatchResult` per call, in the order of `calls`. A call raising an exception
+        does not affect the others.
+    """
+    futures = [executor.submit(capture, call) for call in calls]
+    return [future.result() for future in futures]
+
+
+async def _acall(
+    index: int,
+    function: Callable[[], Awaitable[Any]],
+    timeout: Optional[float],
+    fatal: Tuple[Type[BaseException], ...],
+) -> Tuple[int, BatchResult]:
+    try:
+        return index, BatchResult(value=await asyncio.wait_for(function(), timeout))
+    except fatal:
+        raise
+    except Exception as error:
+        return index, BatchResult(error=error)
+
+
+async def stream_batch(
+    calls: Iterable[Callable[[], Awaitable[Any]]],
+    concurrency: int = DEFAULT_MAX_WORKERS,
+    timeout: Optional[float] = None,
+    fatal: Tuple[Type[BaseException], ...] = DEFAULT_FATAL_ERRORS,
+) -> AsyncIterator[Tuple[int, BatchResult]]:
+    """Runs async calls with at most `concurrency` of them in flight and yields their
+    results as they complete.
+
+    Calls are started lazily, so `calls` may be a generator of any length. When a call
+    raises one of the `fatal` exceptions, the calls in flight are cancelled, the others
+    are never started and the exception is raised.
+
+    Args:
+        calls: Callables taking no arguments and returning an awaitable.
+        concurrency: The maximum number of calls in flight.
+        timeout: The number of seconds after which a call is cancelled and reported
+            with an `asyncio.TimeoutError`.
+        fatal: The exceptions aborting the whole batch.
+
+    Returns:
+        An async iterator over `(index, BatchResult)` tuples, `index` being the position
+        of the call in `calls`.
+    """
+    if concurrency < 1:
+        raise ValueError("`concurrency` must be at least `1`")
+    calls = enumerate(calls)
+    pending = set()
+    try:
+        while True:
+            for index, call in calls:
+                pending.add(asyncio.ensure_future(_acall(index, call, timeout, fatal)))
+                if len(pending) >= concurrency:
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
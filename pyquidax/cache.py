@@ -0,0 +1,109 @@
+import time
+from bisect import bisect_right
+from threading import Lock
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from pyquidax.utils import APIResponse, Currency, CurrencyPair, Kind
+
+
+class QuoteCache:
+    """A short-lived, in-memory cache for `QuidaxClient.quotes` responses.
+
+    Volumes are grouped into bands so that requests for slightly different volumes
+    on the same market, unit and kind share a cached quote. A cached response is the
+    quote for the first volume requested in its band, so bands should be narrow
+    enough for that approximation to be acceptable.
+
+    Pass an instance to `QuidaxClient` or `AsyncQuidaxClient` to enable it, e.g.
+    `QuidaxClient(quote_cache=QuoteCache(ttl=0.5, bands=[0.1, 1, 10]))`.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 1.0,
+        bands: Sequence[float] = (),
+        max_staleness: Optional[Dict[CurrencyPair, float]] = None,
+        max_size: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            ttl: How long, in seconds, a quote is served from the cache.
+            bands: Ascending volume boundaries. Volumes between two consecutive
+                boundaries share a cache entry, and volumes outside the first and last
+                boundaries are never cached. If empty, only identical volumes share
+                an entry.
+            max_staleness: Per-market limits, in seconds, that override `ttl` when
+                they are shorter, e.g. for volatile markets.
+            max_size: The number of entries after which expired entries are evicted.
+            clock: A monotonic clock returning seconds, mostly useful for testing.
+        """
+        if ttl <= 0:
+            raise ValueError("`ttl` must be greater than `0`")
+        self.ttl = ttl
+        self.bands = sorted(bands)
+        self.max_staleness = dict(max_staleness or {})
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: Dict[Tuple, Tuple[float, APIResponse]] = {}
+        self._lock = Lock()
+
+    def _key(
+        self, market: CurrencyPair, unit: Currency, kind: Kind, volume: float
+    ) -> Optional[Tuple]:
+        if not self.bands:
+            return market, unit, kind, volume
+        if not self.bands[0] <= volume <= self.bands[-1]:
+            # The outer bands would be unbounded, sharing one quote across any size.
+            return None
+        return market, unit, kind, bisect_right(self.bands, volume)
+
+    def _ttl_for(self, market: CurrencyPair) -> float:
+        return min(self.ttl, self.max_staleness.get(market, self.ttl))
+
+    def get(
+        self, market: CurrencyPair, unit: Currency, kind: Kind, volume: float
+    ) -> Optional[APIResponse]:
+        """Returns the cached quote for the volume's band if it has not expired."""
+        key = self._key(market, unit, kind, volume)
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, response = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                return None
+            return response
+
+    def set(
+        self,
+        market: CurrencyPair,
+        unit: Currency,
+        kind: Kind,
+        volume: float,
+        response: APIResponse,
+    ):
+        """Caches a successful quote for the volume's band, if it falls in one."""
+        key = self._key(market, unit, kind, volume)
+        if response.status_code != 200 or key is None:
+            return
+        now = self._clock()
+        with self._lock:
+            if len(self._entries) >= self.max_size:
+                self._evict(now)
+            self._entries[key] = (now + self._ttl_for(market), response)
+
+    def _evict(self, now: float):
+        self._entries = {
+            key: entry for key, entry in self._entries.items() if entry[0] > now
+        }
+        while len(self._entries) >= self.max_size:
+            self._entries.pop(next(iter(self._entries)))
+
+    def clear(self):
+        """Removes every cached quote."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from pyquidax.tape import Trade
+from pyquidax.utils import CurrencyPair, Period
+
+
+@dataclass
+class Candle:
+    """A dataclass representing an OHLCV candle of a market.
+
+    `period` is in minutes like the `period` of `MarketClient.get_k_line` and
+    `timestamp` is the opening time of the candle in seconds since the Unix epoch.
+    """
+
+    pair: str
+    period: int
+    timestamp: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+    def as_k_line(self) -> list:
+        """Returns the candle as a `[timestamp, open, high, low, close, volume]` row,
+        the format of `MarketClient.get_k_line`."""
+        return [self.timestamp, self.open, self.high, self.low, self.close, self.volume]
+
+
+class CandleBuilder:
+    """Builds OHLCV candles incrementally from public trades, e.g. the trades emitted by
+    `TradeTape`, for several periods at once.
+
+    Each trade updates the in-progress candle of every period in constant time. A
+    candle is emitted once a trade of a later candle arrives, or when `flush` is called
+    after its period ended. Trades older than the in-progress candle are ignored and
+    periods without trades produce no candle.
+
+    Usage:
+        builder = CandleBuilder(periods=[1, 5, 15])
+        for candle in builder.feed(TradeTape(client.trades, [CurrencyPair.BTC_NGN])):
+            ...
+    """
+
+    def __init__(self, periods: Sequence[Period] = (1,)):
+        """
+        Args:
+            periods: The candle periods, in minutes, to build.
+        """
+        if not periods:
+            raise ValueError("At least one period is required")
+        self.periods = tuple(periods)
+        self._candles: Dict[Tuple[str, int], Candle] = {}
+        self._closed_until: Dict[Tuple[str, int], int] = {}
+
+    def update(self, trade: Trade) -> List[Candle]:
+        """Adds a trade to the in-progress candles of its market.
+
+        Returns:
+            The candles closed by this trade.
+        """
+        closed = []
+        for period in self.periods:
+            seconds = period * 60
+            timestamp = int(trade.timestamp // seconds * seconds)
+            key = (trade.pair, period)
+            candle = self._candles.get(key)
+            if candle is not None and candle.timestamp == timestamp:
+                if trade.price > candle.high:
+                    candle.high = trade.price
+                elif trade.price < candle.low:
+                    candle.low = trade.price
+                candle.close = trade.price
+                candle.volume += trade.volume
+                continue
+            if timestamp < self._closed_until.get(key, timestamp):
+                continue
+            if candle is not None:
+                if timestamp < candle.timestamp:
+                    continue
+                closed.append(candle)
+                self._closed_until[key] = candle.timestamp + seconds
+            self._candles[key] = Candle(
+                pair=trade.pair,
+                period=period,
+                timestamp=timestamp,
+                open=trade.price,
+                high=trade.price,
+                low=trade.price,
+                close=trade.price,
+                volume=trade.volume,
+            )
+        return closed
+
+    def feed(self, trades: Iterable[Trade]) -> Iterator[Candle]:
+        """Adds each trade in `trades` and yields candles as they close."""
+        for trade in trades:
+            yield from self.update(trade)
+
+    def flush(self, now: float) -> List[Candle]:
+        """Closes the in-progress candles whose period ended before `now`.
+
+        Args:
+            now: The current time in seconds since the Unix epoch.
+
+        Returns:
+            The candles that were closed.
+        """
+        closed = [
+            candle
+            for candle in self._candles.values()
+            if candle.timestamp + candle.period * 60 <= now
+        ]
+        for candle in closed:
+            key = (candle.pair, candle.period)
+            del self._candles[key]
+            self._closed_until[key] = candle.timestamp + candle.period * 60
+        return closed
+
+    def current(
+        self, pair: Union[CurrencyPair, str], period: Period
+    ) -> Optional[Candle]:
+        """Returns the in-progress candle of a market for a period, if any."""
+        pair = pair.value if isinstance(pair, CurrencyPair) else pair
+        return self._candles.get((pair, period))
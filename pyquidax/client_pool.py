@@ -0,0 +1,327 @@
+import asyncio
+import functools
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Dict, Generic, Optional, TypeVar
+
+import httpx
+
+from pyquidax.base import (
+    AbstractAPIWrapper,
+    _fork_owned,
+    _forked_http_client_error,
+    _replace_http_client,
+    _replace_inherited,
+    register_fork_factory,
+)
+from pyquidax.batch import DEFAULT_MAX_WORKERS
+from pyquidax.cache import QuoteCache
+from pyquidax.quidax import AsyncQuidaxClient, QuidaxClient
+from pyquidax.rate_limit import RateLimiter
+from pyquidax.registry import MarketRegistry
+
+DEFAULT_MAX_CLIENTS = 1024
+
+C = TypeVar("C", QuidaxClient, AsyncQuidaxClient)
+
+
+def _cookieless_jar() -> CookieJar:
+    # The connections are shared by every secret key, so no cookie set in response to
+    # one tenant's request may be sent with another's.
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+def _pool_limits(max_connections: int) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections,
+        keepalive_expiry=AbstractAPIWrapper.KEEPALIVE_EXPIRY,
+    )
+
+
+def _create_pool_http_client(max_connections: int) -> httpx.Client:
+    http_client = httpx.Client(
+        limits=_pool_limits(max_connections), cookies=_cookieless_jar()
+    )
+    # The clients of the pool recreate it with the same settings after a fork.
+    register_fork_factory(
+        http_client, functools.partial(_create_pool_http_client, max_connections)
+    )
+    _fork_owned.add(http_client)
+    return http_client
+
+
+class _ClientPool(Generic[C]):
+    def __init__(
+        self,
+        quote_cache: Optional[QuoteCache],
+        market_registry: Optional[MarketRegistry],
+        max_clients: int,
+        rate: Optional[float],
+        period: float,
+        burst: Optional[int],
+    ):
+        self.quote_cache = quote_cache
+        self.market_registry = market_registry
+        self.max_clients = max_clients
+        self.rate = rate
+        self.period = period
+        self.burst = burst
+        self._clients: "OrderedDict[str, C]" = OrderedDict()
+        self._rate_limiters: Dict[str, RateLimiter] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def _check_fork(self):
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._after_fork()
+
+    def _after_fork(self):
+        self._lock = threading.Lock()
+        for limiter in self._rate_limiters.values():
+            limiter._lock = threading.Lock()
+
+    def _create_client(self, secret_key: str) -> C:
+        raise NotImplementedError
+
+    def client(self, secret_key: str) -> C:
+        """Returns the client of a secret key, creating it on first use.
+
+        Clients only hold the secret key and references to the shared resources of the
+        pool, so they need not be closed. The least recently used ones are dropped past
+        `max_clients` and created again when needed.
+        """
+        self._check_fork()
+        with self._lock:
+            client = self._clients.get(secret_key)
+            if client is not None:
+                self._clients.move_to_end(secret_key)
+                return client
+            client = self._clients[secret_key] = self._create_client(secret_key)
+            if len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+            return client
+
+    def rate_limiter(self, secret_key: str) -> Optional[RateLimiter]:
+        """Returns the `RateLimiter` of a secret key, or `None` if the pool was created
+        without a `rate`. Each key has its own, since Quidax limits each key separately.
+        """
+        if self.rate is None:
+            return None
+        self._check_fork()
+        with self._lock:
+            limiter = self._rate_limiters.get(secret_key)
+            if limiter is None:
+                limiter = self._rate_limiters[secret_key] = RateLimiter(
+                    self.rate, self.period, self.burst
+                )
+            return limiter
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, secret_key: str) -> bool:
+        return secret_key in self._clients
+
+
+class QuidaxClientPool(_ClientPool[QuidaxClient]):
+    """Issues a `QuidaxClient` per secret key, all of them sharing one connection pool,
+    one thread pool for `batch` and `map`, and the optional quote cache and market
+    registry, so a process can serve thousands of keys.
+
+    Requests are only tied to a key by their authorization header. Cookies are never
+    stored, so nothing else is shared between keys, and each key gets its own
+    `RateLimiter`.
+
+    Usage:
+        with QuidaxClientPool(max_connections=50, rate=10) as pool:
+            client = pool.client(secret_key)
+            client.orders.create_many(orders, rate_limiter=pool.rate_limiter(secret_key))
+    """
+
+    def __init__(
+        self,
+        quote_cache: Optional[QuoteCache] = None,
+        market_registry: Optional[MarketRegistry] = None,
+        http_client: Optional[httpx.Client] = None,
+        max_connections: int = 100,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+        rate: Optional[float] = None,
+        period: float = 1.0,
+        burst: Optional[int] = None,
+    ):
+        """
+        Args:
+            quote_cache: An optional `QuoteCache` shared by every client.
+            market_registry: An optional `MarketRegistry` shared by every client.
+            http_client: An optional `httpx.Client` whose connection pool is shared by
+                every client. One keeping at most `max_connections` connections and
+                storing no cookies is created when omitted. To use the pool after a
+                `fork`, register how to recreate it with `register_fork_factory`.
+            max_connections: The size of the connection pool created by the pool.
+            max_workers: The number of threads the `batch` and `map` calls of every
+                client share.
+            max_clients: The number of clients kept before the least recently used are
+                dropped.
+            rate: The number of requests allowed every `period` by the `RateLimiter`
+                of each key. No limiter is created when omitted.
+            period: The length of the period of `rate` in seconds.
+            burst: The number of requests each key can send at once. Defaults to `rate`.
+        """
+        super().__init__(quote_cache, market_registry, max_clients, rate, period, burst)
+        self.max_connections = max_connections
+        self.max_workers = max_workers
+        self._owns_http_client = http_client is None
+        self._http_client = http_client or self._create_http_client()
+        self._fork_error = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """The `httpx.Client` shared by every client of the pool.
+
+        Raises:
+            ForkException: If the client was given to the pool, the process was forked
+                and no factory was registered for it with `register_fork_factory`.
+        """
+        self._check_fork()
+        if self._http_client is None:
+            raise self._fork_error
+        return self._http_client
+
+    def _create_http_client(self) -> httpx.Client:
+        return _create_pool_http_client(self.max_connections)
+
+    def _create_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="pyquidax-batch"
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Called under `self._lock`, by `_create_client`.
+        if self._executor is None:
+            self._executor = self._create_executor()
+        return self._executor
+
+    def _after_fork(self):
+        super()._after_fork()
+        if self._http_client is not None:
+            self._http_client, self._owns_http_client = _replace_http_client(
+                self._http_client, self._owns_http_client, self._create_http_client
+            )
+            if self._http_client is None:
+                self._fork_error = _forked_http_client_error()
+        if self._executor is not None:
+            self._executor = _replace_inherited(self._executor, self._create_executor)
+
+    def _create_client(self, secret_key: str) -> QuidaxClient:
+        return QuidaxClient(
+            secret_key,
+            quote_cache=self.quote_cache,
+            http_client=self.http_client,
+            max_workers=self.max_workers,
+            market_registry=self.market_registry,
+            executor=self._get_executor(),
+        )
+
+    def close(self):
+        """Shuts down the shared thread pool and closes the shared connections, if the
+        pool created them. The clients it issued must not be used afterwards."""
+        self._check_fork()
+        with self._lock:
+            self._clients.clear()
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        if self._owns_http_client and self._http_client is not None:
+            self._http_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class AsyncQuidaxClientPool(_ClientPool[AsyncQuidaxClient]):
+    """An async version of `QuidaxClientPool` issuing `AsyncQuidaxClient` objects.
+
+    Every client shares the connection pool the pool opens for each event loop.
+
+    Usage:
+        async with AsyncQuidaxClientPool(max_connections=50) as pool:
+            response = await pool.client(secret_key).orders.get(order_id)
+    """
+
+    def __init__(
+        self,
+        quote_cache: Optional[QuoteCache] = None,
+        market_registry: Optional[MarketRegistry] = None,
+        max_connections: int = 100,
+        max_concurrency: int = DEFAULT_MAX_WORKERS,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+        rate: Optional[float] = None,
+        period: float = 1.0,
+        burst: Optional[int] = None,
+    ):
+        """
+        Args:
+            quote_cache: An optional `QuoteCache` shared by every client.
+            market_registry: An optional `MarketRegistry` shared by every client.
+            max_connections: The size of the connection pool of each event loop.
+            max_concurrency: The default number of calls the `as_completed`, `batch`
+                and `map` methods of each client keep in flight.
+            max_clients: The number of clients kept before the least recently used are
+                dropped.
+            rate: The number of requests allowed every `period` by the `RateLimiter`
+                of each key. No limiter is created when omitted.
+            period: The length of the period of `rate` in seconds.
+            burst: The number of requests each key can send at once. Defaults to `rate`.
+        """
+        super().__init__(quote_cache, market_registry, max_clients, rate, period, burst)
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self._http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            limits=_pool_limits(self.max_connections), cookies=_cookieless_jar()
+        )
+
+    def _create_client(self, secret_key: str) -> AsyncQuidaxClient:
+        client = AsyncQuidaxClient(
+            secret_key,
+            quote_cache=self.quote_cache,
+            max_concurrency=self.max_concurrency,
+            market_registry=self.market_registry,
+        )
+        client._share_http_clients(self._http_clients, self._create_http_client)
+        return client
+
+    def _after_fork(self):
+        super()._after_fork()
+        self._http_clients.clear()
+
+    async def aclose(self):
+        """Closes the connections opened in the running event loop. The clients the
+        pool issued must not be used in it afterwards."""
+        self._check_fork()
+        with self._lock:
+            self._clients.clear()
+        http_client = self._http_clients.pop(asyncio.get_running_loop(), None)
+        if http_client is not None:
+            await http_client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
@@ -1,4 +1,7 @@
+from typing import AsyncIterator, Iterator, Optional
+
 from pyquidax.base import BaseAPIWrapper, BaseAsyncAPIWrapper
+from pyquidax.pagination import DEFAULT_PER_PAGE, apaginate, paginate
 from pyquidax.utils import (
     TransactionState,
     Currency,
@@ -10,9 +13,13 @@ from pyquidax.utils import (
 class DepositClient(BaseAPIWrapper):
     """A wrapper that enables authenticated users to fetch crypto or fiat deposits"""
 
-    def all(self):
+    def all(self, page: Optional[int] = None, per_page: Optional[int] = None):
         """Fetch all deposits made by sub-users.
 
+        Args:
+            page: The page of results to fetch, starting at 1.
+            per_page: The number of results per page.
+
         Returns:
             APIResponse, which is a dataclass containing the response gotten from Quidax servers.
             `APIResponse.status_code` (int) is the http status code of the response.
@@ -21,11 +28,76 @@ class DepositClient(BaseAPIWrapper):
             `APIResponse.data` (dict | None) is the data returned by Quidax as a result of the
             request sent.
         """
-        return self._api_call(
-            url=f"{self.base_url}/users/deposits/all", method=HTTPMethod.GET
+        query_params = (
+            ("page", page),
+            ("per_page", per_page),
+        )
+        url = append_query_parameters(
+            f"{self.base_url}/users/deposits/all", query_params
+        )
+        return self._api_call(url=url, method=HTTPMethod.GET)
+
+    def iter_all(
+        self,
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> Iterator[dict]:
+        """Iterates over every deposit made by sub-users.
+
+        Pages are fetched as needed, the next one while the current one is consumed,
+        and deposits are yielded one at a time so the full history is never held
+        in memory.
+
+        Args:
+            per_page: The number of deposits fetched per request.
+
+        Returns:
+            An iterator over the deposits, as dicts returned by Quidax.
+
+        Raises:
+            APIResponseException: If a page could not be fetched.
+        """
+        return paginate(
+            lambda page: self.all(page=page, per_page=per_page), per_page=per_page
+        )
+
+    def stream_all(
+        self,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """Streams the deposits as the response is downloaded.
+
+        Unlike `all`, which loads the whole response in memory, the `data` array is
+        parsed incrementally and deposits are yielded one at a time, so peak memory stays
+        flat however long the history is.
+
+        Args:
+            page: The page of results to fetch, starting at 1.
+            per_page: The number of results per page.
+
+        Returns:
+            An iterator over the deposits, as dicts returned by Quidax.
+
+        Raises:
+            APIResponseException: If the request failed.
+        """
+        query_params = (
+            ("page", page),
+            ("per_page", per_page),
         )
+        url = append_query_parameters(
+            f"{self.base_url}/users/deposits/all", query_params
+        )
+        return self._stream_api_call(url=url, method=HTTPMethod.GET)
 
-    def get_by_user(self, user_id: str, currency: Currency, state: TransactionState):
+    def get_by_user(
+        self,
+        user_id: str,
+        currency: Currency,
+        state: TransactionState,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+    ):
         """Fetches all deposits tethered to an authenticated account.
 
         Args:
@@ -33,6 +105,8 @@ class DepositClient(BaseAPIWrapper):
                 use the user_id if fetching for Sub-account linked to the authenticated user.
             currency: Currency.ETHEREUM, Currency.BITCOIN_CASH etc
             state: TransactionState.DONE. TransactionState.CHECKED, Transaction.PROCESSING etc
+            page: The page of results to fetch, starting at 1.
+            per_page: The number of results per page.
 
         Returns:
             APIResponse, which is a dataclass containing the response gotten from Quidax servers.
@@ -45,12 +119,47 @@ class DepositClient(BaseAPIWrapper):
         query_params = (
             ("currency", currency),
             ("state", state),
+            ("page", page),
+            ("per_page", per_page),
         )
         url = append_query_parameters(
             f"{self.base_url}/users/{user_id}/deposits", query_params
         )
         return self._api_call(url=url, method=HTTPMethod.GET)
 
+    def iter_by_user(
+        self,
+        user_id: str,
+        currency: Currency,
+        state: TransactionState,
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> Iterator[dict]:
+        """Iterates over every deposit tethered to an authenticated account.
+
+        Pages are fetched as needed, the next one while the current one is consumed,
+        and deposits are yielded one at a time so the full history is never held
+        in memory.
+
+        Args:
+            user_id: The User ID. Use 'me' if fetching wallets of main authenticated user,
+                use the user_id if fetching for Sub-account linked to the authenticated user.
+            currency: Currency.ETHEREUM, Currency.BITCOIN_CASH etc
+            state: TransactionState.DONE. TransactionState.CHECKED, Transaction.PROCESSING etc
+            per_page: The number of deposits fetched per request.
+
+        Returns:
+            An iterator over the deposits, as dicts returned by Quidax.
+
+        Raises:
+            APIResponseException: If a page could not be fetched.
+        """
+        return paginate(
+            lambda page: self.get_by_user(
+                user_id, currency, state, page=page, per_page=per_page
+            ),
+            per_page=per_page,
+        )
+
     def get_by_id(self, deposit_id: str, user_id: str = "me"):
         """Fetches details of a deposits
 
@@ -76,9 +185,13 @@ class DepositClient(BaseAPIWrapper):
 class AsyncDepositClient(BaseAsyncAPIWrapper):
     """An async wrapper that enables authenticated users to fetch crypto or fiat deposits"""
 
-    async def all(self):
+    async def all(self, page: Optional[int] = None, per_page: Optional[int] = None):
         """Fetch all deposits made by sub-users.
 
+        Args:
+            page: The page of results to fetch, starting at 1.
+            per_page: The number of results per page.
+
         Returns:
             APIResponse, which is a dataclass containing the response gotten from Quidax servers.
             `APIResponse.status_code` (int) is the http status code of the response.
@@ -88,12 +201,75 @@ class AsyncDepositClient(BaseAsyncAPIWrapper):
             request sent.
         """
 
-        return await self._api_call(
-            url=f"{self.base_url}/users/deposits/all", method=HTTPMethod.GET
+        query_params = (
+            ("page", page),
+            ("per_page", per_page),
+        )
+        url = append_query_parameters(
+            f"{self.base_url}/users/deposits/all", query_params
+        )
+        return await self._api_call(url=url, method=HTTPMethod.GET)
+
+    def iter_all(
+        self,
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> AsyncIterator[dict]:
+        """Iterates over every deposit made by sub-users.
+
+        Pages are fetched as needed, the next one while the current one is consumed,
+        and deposits are yielded one at a time so the full history is never held
+        in memory.
+
+        Args:
+            per_page: The number of deposits fetched per request.
+
+        Returns:
+            An iterator over the deposits, as dicts returned by Quidax.
+
+        Raises:
+            APIResponseException: If a page could not be fetched.
+        """
+        return apaginate(
+            lambda page: self.all(page=page, per_page=per_page), per_page=per_page
+        )
+
+    def stream_all(
+        self,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+    ) -> AsyncIterator[dict]:
+        """Streams the deposits as the response is downloaded.
+
+        Unlike `all`, which loads the whole response in memory, the `data` array is
+        parsed incrementally and deposits are yielded one at a time, so peak memory stays
+        flat however long the history is.
+
+        Args:
+            page: The page of results to fetch, starting at 1.
+            per_page: The number of results per page.
+
+        Returns:
+            An async iterator over the deposits, as dicts returned by Quidax.
+
+        Raises:
+            APIResponseException: If the request failed.
+        """
+        query_params = (
+            ("page", page),
+            ("per_page", per_page),
         )
+        url = append_query_parameters(
+            f"{self.base_url}/users/deposits/all", query_params
+        )
+        return self._stream_api_call(url=url, method=HTTPMethod.GET)
 
     async def get_by_user(
-        self, user_id: str, currency: Currency, state: TransactionState
+        self,
+        user_id: str,
+        currency: Currency,
+        state: TransactionState,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
     ):
         """Fetches all deposits tethered to an authenticated account.
 
@@ -102,6 +278,8 @@ class AsyncDepositClient(BaseAsyncAPIWrapper):
                 use the user_id if fetching for Sub-account linked to the authenticated user.
             currency: Currency.ETHEREUM, Currency.BITCOIN_CASH etc
             state: TransactionState.DONE. TransactionState.CHECKED, Transaction.PROCESSING etc
+            page: The page of results to fetch, starting at 1.
+            per_page: The number of results per page.
 
         Returns:
             APIResponse, which is a dataclass containing the response gotten from Quidax servers.
@@ -115,12 +293,47 @@ class AsyncDepositClient(BaseAsyncAPIWrapper):
         query_params = (
             ("currency", currency),
             ("state", state),
+            ("page", page),
+            ("per_page", per_page),
         )
         url = append_query_parameters(
             f"{self.base_url}/users/{user_id}/deposits", query_params
         )
         return await self._api_call(url=url, method=HTTPMethod.GET)
 
+    def iter_by_user(
+        self,
+        user_id: str,
+        currency: Currency,
+        state: TransactionState,
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> AsyncIterator[dict]:
+        """Iterates over every deposit tethered to an authenticated account.
+
+        Pages are fetched as needed, the next one while the current one is consumed,
+        and deposits are yielded one at a time so the full history is never held
+        in memory.
+
+        Args:
+            user_id: The User ID. Use 'me' if fetching wallets of main authenticated user,
+                use the user_id if fetching for Sub-account linked to the authenticated user.
+            currency: Currency.ETHEREUM, Currency.BITCOIN_CASH etc
+            state: TransactionState.DONE. TransactionState.CHECKED, Transaction.PROCESSING etc
+            per_page: The number of deposits fetched per request.
+
+        Returns:
+            An iterator over the deposits, as dicts returned by Quidax.
+
+        Raises:
+            APIResponseException: If a page could not be fetched.
+        """
+        return apaginate(
+            lambda page: self.get_by_user(
+                user_id, currency, state, page=page, per_page=per_page
+            ),
+            per_page=per_page,
+        )
+
     async def get_by_id(self, deposit_id: str, user_id: str = "me"):
         """Fetches details of a deposits
 
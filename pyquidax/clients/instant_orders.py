@@ -1,27 +1,117 @@
-from typing import Literal, Optional
+import math
+import time
+from typing import AsyncIterator, Iterator, Literal, Optional, Union
 
 from pyquidax.base import BaseAPIWrapper, BaseAsyncAPIWrapper
+from pyquidax.exceptions import (
+    APIResponseException,
+    QuoteDeadlineExceededException,
+    SlippageExceededException,
+)
+from pyquidax.fixed import Fixed
+from pyquidax.pagination import DEFAULT_PER_PAGE, apaginate, paginate
+from pyquidax.registry import MarketRegistry
 from pyquidax.utils import (
+    APIResponse,
     CurrencyPair,
     OrderState,
     append_query_parameters,
     HTTPMethod,
     Currency,
     OrderType,
+    parse_amount,
 )
 
 
+def _succeeded(response: APIResponse) -> bool:
+    return 200 <= response.status_code < 300
+
+
+def _quoted_price(response: APIResponse, action: str) -> float:
+    if not _succeeded(response):
+        raise APIResponseException(
+            f"{action} failed with status code {response.status_code}: "
+            f"{response.message}",
+            response=response,
+        )
+    price = parse_amount((response.data or {}).get("price"))
+    if not math.isfinite(price):
+        raise APIResponseException(
+            f"{action} returned no valid price: {(response.data or {}).get('price')!r}",
+            response=response,
+        )
+    return price
+
+
+def _quote_expired(response: APIResponse) -> bool:
+    # Quidax rejects the confirmation of an order whose quote expired with a client
+    # error saying so. Any other failure is not fixed by requoting.
+    if not 400 <= response.status_code < 500:
+        return False
+    text = f"{response.message or ''} {response.data or ''}".lower()
+    return "expire" in text
+
+
+def _check_confirmation(confirmation: APIResponse, order_id: str):
+    if not _quote_expired(confirmation):
+        raise APIResponseException(
+            f"Confirming instant order {order_id} failed with status code "
+            f"{confirmation.status_code}: {confirmation.message}",
+            response=confirmation,
+        )
+
+
+def _check_deadline(
+    expires_at: float, deadline: float, order_id: str, confirmation: APIResponse
+):
+    if time.monotonic() >= expires_at:
+        raise QuoteDeadlineExceededException(
+            f"Instant order {order_id} was not confirmed after {deadline} seconds and "
+            f"is left unconfirmed: {confirmation.message}",
+            response=confirmation,
+            order_id=order_id,
+        )
+
+
+def _check_slippage(
+    type: OrderType,
+    reference: float,
+    price: float,
+    max_slippage: float,
+    order_id: str,
+    response: APIResponse,
+):
+    if type == OrderType.BUY:
+        exceeded = price > reference * (1 + max_slippage)
+    else:
+        exceeded = price < reference * (1 - max_slippage)
+    if exceeded:
+        raise SlippageExceededException(
+            f"The requoted price {price} of instant order {order_id} is more than "
+            f"{max_slippage:.2%} away from the first quote {reference}, the order is "
+            "left unconfirmed",
+            response=response,
+            order_id=order_id,
+        )
+
+
 class InstantOrderClient(BaseAPIWrapper):
     """A wrapper that enables authenticated
     users to buy and sell cryptocurrencies at the current market price.
     """
 
+    # When set, volumes are validated and rounded to the rules of their market before
+    # being sent. See `MarketRegistry`.
+    registry: Optional[MarketRegistry] = None
+
     def all(
         self,
         pair: Optional[CurrencyPair] = None,
         state: Optional[OrderState] = None,
         order_by: Literal["asc", "desc"] = "asc",
         user_id: str = "me",
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
     ):
         """Fetches all instant orders, that have previously executed by you or your authenticated users.
 
@@ -33,6 +123,8 @@ class InstantOrderClient(BaseAPIWrapper):
             user_id: The User ID. Use 'me'
             if fetching wallets of main authenticated user, use the user_id if fetching
                 for Sub-account linked to the authenticated user.
+            page: The page of results to fetch, starting at 1.
+            per_page: The number of results per page.
 
         Returns:
             APIResponse, which is a dataclass containing the response gotten from Quidax servers.
@@ -42,7 +134,13 @@ class InstantOrderClient(BaseAPIWrapper):
             `APIResponse.data` (dict | None) is the data returned by Quidax as a result of the
             request sent.
         """
-        query_params = (("market", pair), ("state", state), ("order_by", order_by))
+        query_params = (
+            ("market", pair),
+            ("state", state),
+            ("order_by", order_by),
+            ("page", page),
+            ("per_page", per_page),
+        )
         url = append_query_parameters(
             f"{self.base_url}/users/{user_id}/instant_orders", query_params
         )
@@ -51,6 +149,42 @@ class InstantOrderClient(BaseAPIWrapper):
             method=HTTPMethod.GET,
         )
 
+    def iter_all(
+        self,
+        pair: Optional[CurrencyPair] = None,
+        state: Optional[OrderState] = None,
+        order_by: Literal["asc", "desc"] = "asc",
+        user_id: str = "me",
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> Iterator[dict]:
+        """Iterates over every instant order executed by you or your authenticated users.
+
+        Pages are fetched as needed, the next one while the current one is consumed,
+        and instant orders are yielded one at a time so the full history is never held
+        in memory.
+
+        Args:
+            pair: CurrencyPair.BTN_USDT, CurrencyPair.LTC_NGN etc.
+            state: OrderState.DONE, OrderState.CONFIRM, OrderState.CANCEL, OrderState.WAIT.
+                Defaults to done if not specified.
+            order_by: The Order in which you retrieve result either ascending or descending order
+            user_id: The User ID. Use 'me' if fetching for the main authenticated user,
+                use the user_id if fetching for Sub-account linked to the authenticated user.
+            per_page: The number of instant orders fetched per request.
+
+        Returns:
+            An iterator over the instant orders, as dicts returned by Quidax.
+
+        Raises:
+            APIResponseException: If a page could not be fetched.
+        """
+        return paginate(
+            lambda page: self.all(
+                pair, state, order_by, user_id, page=page, per_page=per_page
+            ),
+            per_page=per_page,
+        )
+
     def get(self, id: str, user_id: str = "me"):
         """Fetch detail of an instant order
 
@@ -78,8 +212,8 @@ class InstantOrderClient(BaseAPIWrapper):
         bid: Currency,
         ask: Currency,
         type: OrderType,
-        volume: int,
-        unit: int,
+        volume: Union[int, float, str, Fixed],
+        unit: Currency,
         user_id: str = "me",
     ):
         """Create Instant Order
@@ -101,12 +235,18 @@ class InstantOrderClient(BaseAPIWrapper):
             `APIResponse.message` (str | None) is the message of the response.
             `APIResponse.data` (dict | None) is the data returned by Quidax as a result of the
             request sent.
+
+        Raises:
+            InvalidOrderException: If the client has a `registry` and the volume breaks
+                the rules of the market. Nothing is sent then.
         """
+        if self.registry is not None:
+            volume = self.registry.prepare_instant_order(bid, ask, volume, unit)
         data = {
             "bid": bid,
             "ask": ask,
             "type": type,
-            "volume": volume,
+            "volume": str(volume) if isinstance(volume, Fixed) else volume,
             "unit": unit,
         }
         return self._api_call(
@@ -158,18 +298,83 @@ class InstantOrderClient(BaseAPIWrapper):
             method=HTTPMethod.POST,
         )
 
+    def execute(
+        self,
+        bid: Currency,
+        ask: Currency,
+        type: OrderType,
+        volume: Union[int, float, str, Fixed],
+        unit: Currency,
+        max_slippage: float = 0.01,
+        deadline: float = 10.0,
+        user_id: str = "me",
+    ) -> APIResponse:
+        """Creates an instant order and confirms it, requoting it when its quote
+        expired before the confirmation.
+
+        The order is confirmed right after being created, which takes two round trips
+        when the quote is still valid. When the confirmation is rejected because the
+        quote expired, the order is requoted and confirmed again right away, as long as
+        the new price is within `max_slippage` of the first quote and the deadline has
+        not passed. Any other rejection is raised at once.
+
+        Quidax offers no way to cancel an instant order, so an order given up on is
+        left unconfirmed and its id is set as the `order_id` of the exception raised.
+
+        Args:
+            bid: Currency.BITCON. Currency.NAIRA etc.
+            ask: Currency.BINANCE_COIN, Currency.PANCAKE_SWAP etc.
+            type: OrderType.BUY or OrderType.SELL
+            volume: Used if unit is in bid currency.
+            unit: The unit in which the order will be estimated.
+            max_slippage: The largest adverse change of price accepted when requoting,
+                as a fraction of the first quote, e.g. 0.01 for 1%.
+            deadline: The number of seconds after which no more requote is attempted.
+            user_id: The User ID. Use 'me' for the main authenticated user,
+                use the user_id if fetching for Subaccount linked to the authenticated user.
+
+        Returns:
+            The `APIResponse` of the confirmation of the order.
+
+        Raises:
+            APIResponseException: If the order could not be created, confirmed or
+                requoted, or a quote had no valid price.
+            SlippageExceededException: If a requoted price exceeded `max_slippage`.
+            QuoteDeadlineExceededException: A `TimeoutError` raised if the order was not
+                confirmed before the deadline.
+        """
+        expires_at = time.monotonic() + deadline
+        response = self.create(bid, ask, type, volume, unit, user_id=user_id)
+        reference = _quoted_price(response, "Creating the instant order")
+        order_id = response.data["id"]
+        while True:
+            confirmation = self.confirm(order_id, user_id)
+            if _succeeded(confirmation):
+                return confirmation
+            _check_confirmation(confirmation, order_id)
+            _check_deadline(expires_at, deadline, order_id, confirmation)
+            response = self.requote(order_id, user_id)
+            price = _quoted_price(response, "Requoting the instant order")
+            _check_slippage(type, reference, price, max_slippage, order_id, response)
+
 
 class AsyncInstantOrderClient(BaseAsyncAPIWrapper):
     """An async wrapper that enables authenticated
     users to buy and sell cryptocurrencies at the current market price.
     """
 
+    # When set, volumes are validated and rounded to the rules of their market before
+    # being sent. See `MarketRegistry`.
+    registry: Optional[MarketRegistry] = None
+
     async def all(
         self,
         pair: Optional[CurrencyPair] = None,
         state: Optional[OrderState] = None,
         order_by: Literal["asc", "desc"] = "asc",
         user_id: str = "me",
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
     ):
         """Fetches all instant orders, that have previously executed by you or your authenticated users.
 
@@ -180,6 +385,8 @@ class AsyncInstantOrderClient(BaseAsyncAPIWrapper):
             order_by: The Order in which you retrieve a result either ascending or descending order
             user_id: The User ID. Use 'me' if fetching wallets of the main authenticated user,
                 use the user_id if fetching for Sub-account linked to the authenticated user.
+            page: The page of results to fetch, starting at 1.
+            per_page: The number of results per page.
 
         Returns:
             APIResponse, which is a dataclass containing the response gotten from Quidax servers.
@@ -189,7 +396,13 @@ class AsyncInstantOrderClient(BaseAsyncAPIWrapper):
             `APIResponse.data` (dict | None) is the data returned by Quidax as a result of the
             request sent.
         """
-        query_params = (("market", pair), ("state", state), ("order_by", order_by))
+        query_params = (
+            ("market", pair),
+            ("state", state),
+            ("order_by", order_by),
+            ("page", page),
+            ("per_page", per_page),
+        )
         url = append_query_parameters(
             f"{self.base_url}/users/{user_id}/instant_orders", query_params
         )
@@ -198,6 +411,42 @@ class AsyncInstantOrderClient(BaseAsyncAPIWrapper):
             method=HTTPMethod.GET,
         )
 
+    def iter_all(
+        self,
+        pair: Optional[CurrencyPair] = None,
+        state: Optional[OrderState] = None,
+        order_by: Literal["asc", "desc"] = "asc",
+        user_id: str = "me",
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> AsyncIterator[dict]:
+        """Iterates over every instant order executed by you or your authenticated users.
+
+        Pages are fetched as needed, the next one while the current one is consumed,
+        and instant orders are yielded one at a time so the full history is never held
+        in memory.
+
+        Args:
+            pair: CurrencyPair.BTN_USDT, CurrencyPair.LTC_NGN etc.
+            state: OrderState.DONE, OrderState.CONFIRM, OrderState.CANCEL, OrderState.WAIT.
+                Defaults to done if not specified.
+            order_by: The Order in which you retrieve result either ascending or descending order
+            user_id: The User ID. Use 'me' if fetching for the main authenticated user,
+                use the user_id if fetching for Sub-account linked to the authenticated user.
+            per_page: The number of instant orders fetched per request.
+
+        Returns:
+            An iterator over the instant orders, as dicts returned by Quidax.
+
+        Raises:
+            APIResponseException: If a page could not be fetched.
+        """
+        return apaginate(
+            lambda page: self.all(
+                pair, state, order_by, user_id, page=page, per_page=per_page
+            ),
+            per_page=per_page,
+        )
+
     async def get(self, id: str, user_id: str = "me"):
         """Fetch detail of an instant order
 
@@ -225,8 +474,8 @@ class AsyncInstantOrderClient(BaseAsyncAPIWrapper):
         bid: Currency,
         ask: Currency,
         type: OrderType,
-        volume: int,
-        unit: int,
+        volume: Union[int, float, str, Fixed],
+        unit: Currency,
         user_id: str = "me",
     ):
         """Create Instant Order
@@ -248,12 +497,18 @@ class AsyncInstantOrderClient(BaseAsyncAPIWrapper):
             `APIResponse.message` (str | None) is the message of the response.
             `APIResponse.data` (dict | None) is the data returned by Quidax as a result of the
             request sent.
+
+        Raises:
+            InvalidOrderException: If the client has a `registry` and the volume breaks
+                the rules of the market. Nothing is sent then.
         """
+        if self.registry is not None:
+            volume = self.registry.prepare_instant_order(bid, ask, volume, unit)
         data = {
             "bid": bid,
             "ask": ask,
             "type": type,
-            "volume": volume,
+            "volume": str(volume) if isinstance(volume, Fixed) else volume,
             "unit": unit,
         }
         return await self._api_call(
@@ -305,3 +560,62 @@ class AsyncInstantOrderClient(BaseAsyncAPIWrapper):
             url=f"{self.base_url}/users/{user_id}/instant_orders/{id}/requote",
             method=HTTPMethod.POST,
         )
+
+    async def execute(
+        self,
+        bid: Currency,
+        ask: Currency,
+        type: OrderType,
+        volume: Union[int, float, str, Fixed],
+        unit: Currency,
+        max_slippage: float = 0.01,
+        deadline: float = 10.0,
+        user_id: str = "me",
+    ) -> APIResponse:
+        """Creates an instant order and confirms it, requoting it when its quote
+        expired before the confirmation.
+
+        The order is confirmed right after being created, which takes two round trips
+        when the quote is still valid. When the confirmation is rejected because the
+        quote expired, the order is requoted and confirmed again right away, as long as
+        the new price is within `max_slippage` of the first quote and the deadline has
+        not passed. Any other rejection is raised at once.
+
+        Quidax offers no way to cancel an instant order, so an order given up on is
+        left unconfirmed and its id is set as the `order_id` of the exception raised.
+
+        Args:
+            bid: Currency.BITCON. Currency.NAIRA etc.
+            ask: Currency.BINANCE_COIN, Currency.PANCAKE_SWAP etc.
+            type: OrderType.BUY or OrderType.SELL
+            volume: Used if unit is in bid currency.
+            unit: The unit in which the order will be estimated.
+            max_slippage: The largest adverse change of price accepted when requoting,
+                as a fraction of the first quote, e.g. 0.01 for 1%.
+            deadline: The number of seconds after which no more requote is attempted.
+            user_id: The User ID. Use 'me' for the main authenticated user,
+                use the user_id if fetching for Subaccount linked to the authenticated user.
+
+        Returns:
+            The `APIResponse` of the confirmation of the order.
+
+        Raises:
+            APIResponseException: If the order could not be created, confirmed or
+                requoted, or a quote had no valid price.
+            SlippageExceededException: If a requoted price exceeded `max_slippage`.
+            QuoteDeadlineExceededException: A `TimeoutError` raised if the order was not
+                confirmed before the deadline.
+        """
+        expires_at = time.monotonic() + deadline
+        response = await self.create(bid, ask, type, volume, unit, user_id=user_id)
+        reference = _quoted_price(response, "Creating the instant order")
+        order_id = response.data["id"]
+        while True:
+            confirmation = await self.confirm(order_id, user_id)
+            if _succeeded(confirmation):
+                return confirmation
+            _check_confirmation(confirmation, order_id)
+            _check_deadline(expires_at, deadline, order_id, confirmation)
+            response = await self.requote(order_id, user_id)
+            price = _quoted_price(response, "Requoting the instant order")
+            _check_slippage(type, reference, price, max_slippage, order_id, response)
@@ -1,18 +1,231 @@
-from typing import Literal
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import (
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+import httpx
 
 from pyquidax.base import BaseAPIWrapper, BaseAsyncAPIWrapper
+from pyquidax.batch import BatchResult, acapture, capture, run_batch, stream_batch
+from pyquidax.exceptions import (
+    APIResponseException,
+    ConnectionException,
+    InvalidOrderException,
+)
+from pyquidax.fixed import Fixed
+from pyquidax.pagination import DEFAULT_PER_PAGE, apaginate, paginate
+from pyquidax.rate_limit import RateLimiter
+from pyquidax.registry import MarketRegistry, PairSymbol
 from pyquidax.utils import (
+    APIResponse,
     HTTPMethod,
+    OrderState,
     OrderType,
     CurrencyPair,
     TransactionState,
     append_query_parameters,
+    parse_amount,
 )
 
+DEFAULT_MAX_CONCURRENT_ORDERS = 20
+DEFAULT_CANCEL_RETRIES = 2
+
+
+def _amount_error(name: str, value, message: str) -> Optional[str]:
+    try:
+        amount = parse_amount(value)
+    except (TypeError, ValueError):
+        return f"invalid {name} {value!r}"
+    return None if amount > 0 else message
+
+
+@dataclass
+class OrderRequest:
+    """A dataclass describing an order to place with `OrderClient.create_many`.
+
+    Its fields are the arguments of `OrderClient.create`; `price` is ignored by market
+    orders.
+    """
+
+    pair: Union[CurrencyPair, str]
+    type: OrderType
+    volume: Union[int, float, Fixed]
+    price: Optional[Union[int, float, Fixed]] = None
+    ord_type: Literal["limit", "market"] = "limit"
+
+    def _known_pair(self, registry: Optional[MarketRegistry]) -> bool:
+        pair = self.pair
+        if isinstance(pair, CurrencyPair):
+            return True
+        if not isinstance(pair, str):
+            return False
+        if registry is not None and pair in registry:
+            return True
+        if isinstance(pair, PairSymbol) and pair.base is not None:
+            return True
+        try:
+            CurrencyPair(pair)
+        except ValueError:
+            return False
+        return True
+
+    def errors(self, registry: Optional[MarketRegistry] = None) -> List[str]:
+        """Returns what is wrong with the order, if anything.
+
+        Markets missing from `CurrencyPair` are accepted when `registry` lists them, or
+        when `pair` is a `PairSymbol` of a market its registry knows.
+        """
+        errors = []
+        if not self._known_pair(registry):
+            errors.append(f"unknown pair {self.pair!r}")
+        if self.type not in (OrderType.BUY, OrderType.SELL):
+            errors.append(f"unknown type {self.type!r}")
+        if self.ord_type not in ("limit", "market"):
+            errors.append(f"unknown ord_type {self.ord_type!r}")
+        volume_error = _amount_error(
+            "volume", self.volume, "volume must be greater than 0"
+        )
+        if volume_error is not None:
+            errors.append(volume_error)
+        if self.ord_type == "limit":
+            price_error = _amount_error(
+                "price", self.price, "limit orders need a price greater than 0"
+            )
+            if price_error is not None:
+                errors.append(price_error)
+        return errors
+
+
+def _order_requests(
+    orders: Sequence[Union[OrderRequest, dict]],
+    registry: Optional[MarketRegistry] = None,
+) -> List[OrderRequest]:
+    requests: List[OrderRequest] = []
+    errors: Dict[int, List[str]] = {}
+    for index, order in enumerate(orders):
+        if not isinstance(order, OrderRequest):
+            try:
+                order = OrderRequest(**order)
+            except TypeError as error:
+                errors[index] = [f"invalid order {order!r}: {error}"]
+                continue
+        requests.append(order)
+        order_errors = order.errors(registry)
+        if not order_errors and registry is not None:
+            order_errors = registry.order_errors(
+                order.pair, order.type, order.price, order.volume, order.ord_type
+            )
+        if order_errors:
+            errors[index] = order_errors
+    if errors:
+        details = "; ".join(
+            f"order {index}: {', '.join(messages)}"
+            for index, messages in errors.items()
+        )
+        raise InvalidOrderException(
+            f"{len(errors)} invalid order(s), none were placed: {details}",
+            errors=errors,
+        )
+    return requests
+
+
+@dataclass
+class CancelSummary:
+    """A dataclass summarizing the outcome of `OrderClient.cancel_all`.
+
+    `cancelled` holds the ids of the orders that were cancelled and `failed` maps the
+    id of every order that could not be cancelled to the last exception raised.
+    """
+
+    cancelled: List[str] = field(default_factory=list)
+    failed: Dict[str, BaseException] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    @classmethod
+    def from_results(
+        cls, ids: Sequence[str], results: Sequence[BatchResult]
+    ) -> "CancelSummary":
+        summary = cls()
+        for order_id, result in zip(ids, results):
+            if result.ok:
+                summary.cancelled.append(order_id)
+            else:
+                summary.failed[order_id] = result.error
+        return summary
+
+
+@dataclass
+class AmendResult:
+    """A dataclass holding the outcome of `OrderClient.amend`.
+
+    `cancel` is the result of cancelling the original order and `create` the result of
+    placing its replacement, or None if the replacement was not placed because the
+    original order could not be confirmed as cancelled.
+    """
+
+    cancel: BatchResult
+    create: Optional[BatchResult] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the original order was cancelled and its replacement placed."""
+        return self.cancel.ok and self.create is not None and self.create.ok
+
+
+def _pair_and_side(order: dict) -> Tuple[str, str]:
+    market = order.get("market")
+    pair = market.get("id") if isinstance(market, dict) else market
+    return pair, order.get("side")
+
+
+def _cancel_confirmed(response: APIResponse) -> bool:
+    state = (response.data or {}).get("state")
+    if state == OrderState.DONE:
+        raise APIResponseException(
+            "The order was filled before it could be cancelled", response=response
+        )
+    return state == OrderState.CANCEL
+
+
+def _raise_for_status(response: APIResponse, action: str) -> APIResponse:
+    if not 200 <= response.status_code < 300:
+        raise APIResponseException(
+            f"{action} failed with status code {response.status_code}: "
+            f"{response.message}",
+            response=response,
+        )
+    return response
+
+
+def _is_retriable(error: Exception) -> bool:
+    if isinstance(error, (ConnectionException, httpx.TimeoutException)):
+        return True
+    return isinstance(error, APIResponseException) and (
+        error.response.status_code >= 500 or error.response.status_code == 429
+    )
+
 
 class OrderClient(BaseAPIWrapper):
     """A wrapper that enables authenticated users to post bids (buy orders) and asks (sell orders) bids"""
 
+    # When set, orders are validated and rounded to the rules of their market before
+    # being sent. See `MarketRegistry`.
+    registry: Optional[MarketRegistry] = None
+
     def create(
         self,
         pair: CurrencyPair,
@@ -27,8 +240,8 @@ class OrderClient(BaseAPIWrapper):
         Args:
             pair: CurrencyPair.XRP_NGN, CurrencyPair.DOGE_USDT etc.
             type: OrderType.BUY, OrderType.SELL
-            price: The price of the order
-            volume: Volume of assets
+            price: The price of the order. `Fixed` amounts are sent exactly.
+            volume: Volume of assets. `Fixed` amounts are sent exactly.
             ord_type: The order type either Literal["limit", "market"]
             user_id: The User ID. Use 'me' for main authenticated user,
                 use the user_id of Sub-account linked to the authenticated user for performing activity for subaccount.
@@ -40,13 +253,21 @@ class OrderClient(BaseAPIWrapper):
             `APIResponse.message` (str | None) is the message of the response.
             `APIResponse.data` (dict | None) is the data returned by Quidax as a result of the
             request sent.
+
+        Raises:
+            InvalidOrderException: If the client has a `registry` and the order breaks
+                the rules of its market. Nothing is sent then.
         """
+        if self.registry is not None:
+            price, volume = self.registry.prepare_order(
+                pair, type, price, volume, ord_type
+            )
         data = {
             "market": pair,
             "side": type,
             "ord_type": ord_type,
-            "price": price,
-            "volume": volume,
+            "price": str(price) if isinstance(price, Fixed) else price,
+            "volume": str(volume) if isinstance(volume, Fixed) else volume,
         }
         if ord_type == "market":
             data.pop("price")
@@ -56,12 +277,73 @@ class OrderClient(BaseAPIWrapper):
             data=data,
         )
 
+    def create_many(
+        self,
+        orders: Sequence[Union[OrderRequest, dict]],
+        user_id: str = "me",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_ORDERS,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> List[BatchResult]:
+        """Places many orders concurrently, e.g. the levels of a ladder.
+
+        Every order is validated before any is sent, so an invalid ladder is never
+        partially placed. The orders are then sent at once, up to `max_concurrency` at
+        a time and paced by `rate_limiter`, which makes placing a ladder take about one
+        round trip.
+
+        Usage:
+            results = client.orders.create_many(
+                [
+                    OrderRequest(CurrencyPair.BTC_NGN, OrderType.BUY, 1, price=price)
+                    for price in prices
+                ]
+            )
+            failed = [result for result in results if not result.ok]
+
+        Args:
+            orders: `OrderRequest` objects, or dicts of their fields.
+            user_id: The User ID. Use 'me' for main authenticated user,
+                use the user_id of Sub-account linked to the authenticated user for performing activity for subaccount.
+            max_concurrency: The maximum number of orders being placed at once.
+            rate_limiter: An optional `RateLimiter` every order waits for before being
+                sent. Share it between calls to stay under the limits of the API.
+
+        Returns:
+            A `BatchResult` per order, in the order of `orders`. `BatchResult.value` is the
+            `APIResponse` of a placed order and `BatchResult.error` the exception raised
+            for an order that failed, an `APIResponseException` holding the response if
+            Quidax rejected it.
+
+        Raises:
+            InvalidOrderException: If any order is invalid. No order is placed then.
+        """
+        orders = _order_requests(orders, self.registry)
+
+        def place(order: OrderRequest) -> APIResponse:
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            return _raise_for_status(
+                self.create(**asdict(order), user_id=user_id), "Placing the order"
+            )
+
+        if not orders:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(orders)),
+            thread_name_prefix="pyquidax-orders",
+        ) as executor:
+            return run_batch(
+                executor, [lambda order=order: place(order) for order in orders]
+            )
+
     def all(
         self,
         pair: CurrencyPair,
         state: TransactionState,
         order_by: Literal["asc", "desc"] = "asc",
         user_id: str = "me",
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
     ):
         """Fetch all orders tethered to the authenticated user
 
@@ -71,6 +353,8 @@ class OrderClient(BaseAPIWrapper):
             order_by: The Order in which you retrieve data either ascending or desending order
             user_id: The User ID. Use 'me' if fetching wallets of main authenticated user,
                 use the user_id if fetching for Sub-account linked to the authenticated user
+            page: The page of results to fetch, starting at 1.
+            per_page: The number of results per page.
 
         Returns:
             APIResponse, which is a dataclass containing the response gotten from Quidax servers.
@@ -84,12 +368,49 @@ class OrderClient(BaseAPIWrapper):
             ("market", pair),
             ("state", state),
             ("order_by", order_by),
+            ("page", page),
+            ("per_page", per_page),
         )
         url = append_query_parameters(
             f"{self.base_url}/users/{user_id}/orders", query_params
         )
         return self._api_call(url=url, method=HTTPMethod.GET)
 
+    def iter_all(
+        self,
+        pair: CurrencyPair,
+        state: TransactionState,
+        order_by: Literal["asc", "desc"] = "asc",
+        user_id: str = "me",
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> Iterator[dict]:
+        """Iterates over every order tethered to the authenticated user.
+
+        Pages are fetched as needed, the next one while the current one is consumed,
+        and orders are yielded one at a time so the full history is never held
+        in memory.
+
+        Args:
+            pair: CurrencyPair.DASH_USDT, CurrencyPair.AFEN_USDT, CurrencyPair.BLS_USDT etc
+            state: TransactionState.CHECKED,TransactionState.REJECTED etc
+            order_by: The Order in which you retrieve data either ascending or desending order
+            user_id: The User ID. Use 'me' if fetching wallets of main authenticated user,
+                use the user_id if fetching for Sub-account linked to the authenticated user
+            per_page: The number of orders fetched per request.
+
+        Returns:
+            An iterator over the orders, as dicts returned by Quidax.
+
+        Raises:
+            APIResponseException: If a page could not be fetched.
+        """
+        return paginate(
+            lambda page: self.all(
+                pair, state, order_by, user_id, page=page, per_page=per_page
+            ),
+            per_page=per_page,
+        )
+
     def get(self, id: str, user_id: str = "me"):
         """Fetch order details for the authenticated user
 
@@ -132,10 +453,153 @@ class OrderClient(BaseAPIWrapper):
             method=HTTPMethod.POST,
         )
 
+    def cancel_all(
+        self,
+        pair: Optional[CurrencyPair] = None,
+        user_id: str = "me",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_ORDERS,
+        retries: int = DEFAULT_CANCEL_RETRIES,
+        retry_delay: float = 0.1,
+    ) -> CancelSummary:
+        """Cancels every open order, of one market or of all of them.
+
+        The ids of the open orders are collected first, fetching pages as needed, then
+        the orders are cancelled concurrently, up to `max_concurrency` at a time.
+        Cancellations failing with a connection error, a timeout, a rate limit or a
+        server error are retried with an exponential backoff.
+
+        Args:
+            pair: The market whose orders are cancelled. Every market when omitted.
+            user_id: The User ID. Use 'me' for main authenticated user,
+                use the user_id of Sub-account linked to the authenticated user for performing activity for subaccount.
+            max_concurrency: The maximum number of orders being cancelled at once.
+            retries: How many times a failed cancellation is retried.
+            retry_delay: The delay in seconds before the first retry, doubled after
+                each attempt.
+
+        Returns:
+            A `CancelSummary` of the cancelled orders and of those that failed.
+
+        Raises:
+            APIResponseException: If the open orders could not be fetched.
+        """
+        ids = [
+            str(order["id"])
+            for order in self.iter_all(pair, OrderState.WAIT, user_id=user_id)
+        ]
+
+        def cancel(order_id: str) -> APIResponse:
+            for attempt in range(retries + 1):
+                try:
+                    return _raise_for_status(
+                        self.cancel(order_id, user_id), "Cancelling the order"
+                    )
+                except Exception as error:
+                    if attempt == retries or not _is_retriable(error):
+                        raise
+                    time.sleep(retry_delay * 2**attempt)
+
+        if not ids:
+            return CancelSummary()
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(ids)),
+            thread_name_prefix="pyquidax-orders",
+        ) as executor:
+            results = run_batch(
+                executor,
+                [lambda order_id=order_id: cancel(order_id) for order_id in ids],
+            )
+        return CancelSummary.from_results(ids, results)
+
+    def amend(
+        self,
+        id: str,
+        price: int,
+        volume: int,
+        pair: Optional[CurrencyPair] = None,
+        type: Optional[OrderType] = None,
+        user_id: str = "me",
+        safe: bool = False,
+        confirm_timeout: float = 5.0,
+        poll_interval: float = 0.2,
+    ) -> AmendResult:
+        """Reprices an order by cancelling it and placing a replacement.
+
+        By default, the cancellation and the replacement are sent concurrently, which
+        takes one round trip instead of two, at the risk of both orders being live for a
+        moment or, if the cancellation fails, for good. In safe mode, the replacement is
+        only placed once the original order is confirmed cancelled, polling it until
+        its state is `cancel`; it is not placed if the order was filled meanwhile.
+
+        Args:
+            id: The id of the order to amend.
+            price: The price of the replacement order.
+            volume: The volume of the replacement order.
+            pair: The market of the order. When omitted with `type`, the order is
+                fetched first, costing a round trip.
+            type: The side of the order, OrderType.BUY or OrderType.SELL.
+            user_id: The User ID. Use 'me' for main authenticated user,
+                use the user_id of Sub-account linked to the authenticated user for performing activity for subaccount.
+            safe: Whether to wait for the cancellation to be confirmed before placing
+                the replacement.
+            confirm_timeout: In safe mode, how many seconds to wait for the confirmation.
+            poll_interval: In safe mode, the number of seconds between two polls.
+
+        Returns:
+            An `AmendResult` holding the outcome of the cancellation and of the
+            replacement. `AmendResult.ok` is True when both succeeded.
+
+        Raises:
+            APIResponseException: If the order had to be fetched and could not be.
+        """
+        if pair is None or type is None:
+            order = _raise_for_status(self.get(id, user_id), "Fetching the order").data
+            pair, type = _pair_and_side(order)
+
+        def cancel() -> APIResponse:
+            return _raise_for_status(self.cancel(id, user_id), "Cancelling the order")
+
+        def create() -> APIResponse:
+            return _raise_for_status(
+                self.create(pair, type, price, volume, user_id=user_id),
+                "Placing the order",
+            )
+
+        if not safe:
+            with ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="pyquidax-orders"
+            ) as executor:
+                cancel_result, create_result = run_batch(executor, [cancel, create])
+            return AmendResult(cancel=cancel_result, create=create_result)
+
+        def confirmed_cancel() -> APIResponse:
+            cancel()
+            deadline = time.monotonic() + confirm_timeout
+            while True:
+                response = _raise_for_status(
+                    self.get(id, user_id), "Fetching the order"
+                )
+                if _cancel_confirmed(response):
+                    return response
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"Order {id} was not cancelled after {confirm_timeout} seconds"
+                    )
+                time.sleep(poll_interval)
+
+        cancel_result = capture(confirmed_cancel)
+        if not cancel_result.ok:
+            return AmendResult(cancel=cancel_result)
+        return AmendResult(cancel=cancel_result, create=capture(create))
+
 
 class AsyncOrderClient(BaseAsyncAPIWrapper):
     """An async wrapper that enables authenticated users to post bids (buy orders) and asks (sell orders) bids"""
 
+    # When set, orders are validated and rounded to the rules of their market before
+    # being sent. See `MarketRegistry`.
+    registry: Optional[MarketRegistry] = None
+
     async def create(
         self,
         pair: CurrencyPair,
@@ -150,8 +614,8 @@ class AsyncOrderClient(BaseAsyncAPIWrapper):
         Args:
             pair: CurrencyPair.XRP_NGN, CurrencyPair.DOGE_USDT etc.
             type: OrderType.BUY, OrderType.SELL
-            price: The price of the order
-            volume: Volume of assets
+            price: The price of the order. `Fixed` amounts are sent exactly.
+            volume: Volume of assets. `Fixed` amounts are sent exactly.
             ord_type: The Order type either Literal["limit", "market"]
             user_id: The User ID. Use 'me' for main authenticated user,
                 use the user_id of Sub-account linked to the authenticated user for performing activity for subaccount.
@@ -163,13 +627,21 @@ class AsyncOrderClient(BaseAsyncAPIWrapper):
             `APIResponse.message` (str | None) is the message of the response.
             `APIResponse.data` (dict | None) is the data returned by Quidax as a result of the
             request sent.
+
+        Raises:
+            InvalidOrderException: If the client has a `registry` and the order breaks
+                the rules of its market. Nothing is sent then.
         """
+        if self.registry is not None:
+            price, volume = self.registry.prepare_order(
+                pair, type, price, volume, ord_type
+            )
         data = {
             "market": pair,
             "side": type,
             "ord_type": ord_type,
-            "price": price,
-            "volume": volume,
+            "price": str(price) if isinstance(price, Fixed) else price,
+            "volume": str(volume) if isinstance(volume, Fixed) else volume,
         }
         if ord_type == "market":
             data.pop("price")
@@ -179,12 +651,64 @@ class AsyncOrderClient(BaseAsyncAPIWrapper):
             data=data,
         )
 
+    async def create_many(
+        self,
+        orders: Sequence[Union[OrderRequest, dict]],
+        user_id: str = "me",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_ORDERS,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> List[BatchResult]:
+        """Places many orders concurrently, e.g. the levels of a ladder.
+
+        Every order is validated before any is sent, so an invalid ladder is never
+        partially placed. The orders are then sent at once, up to `max_concurrency` at
+        a time and paced by `rate_limiter`, which makes placing a ladder take about one
+        round trip.
+
+        Args:
+            orders: `OrderRequest` objects, or dicts of their fields.
+            user_id: The User ID. Use 'me' for main authenticated user,
+                use the user_id of Sub-account linked to the authenticated user for performing activity for subaccount.
+            max_concurrency: The maximum number of orders being placed at once.
+            rate_limiter: An optional `RateLimiter` every order waits for before being
+                sent. Share it between calls to stay under the limits of the API.
+
+        Returns:
+            A `BatchResult` per order, in the order of `orders`. `BatchResult.value` is the
+            `APIResponse` of a placed order and `BatchResult.error` the exception raised
+            for an order that failed, an `APIResponseException` holding the response if
+            Quidax rejected it.
+
+        Raises:
+            InvalidOrderException: If any order is invalid. No order is placed then.
+        """
+        orders = _order_requests(orders, self.registry)
+
+        async def place(order: OrderRequest) -> APIResponse:
+            if rate_limiter is not None:
+                await rate_limiter.aacquire()
+            return _raise_for_status(
+                await self.create(**asdict(order), user_id=user_id),
+                "Placing the order",
+            )
+
+        results = [None] * len(orders)
+        async for index, result in stream_batch(
+            [lambda order=order: place(order) for order in orders],
+            concurrency=max_concurrency,
+            fatal=(),
+        ):
+            results[index] = result
+        return results
+
     async def all(
         self,
         pair: CurrencyPair,
         state: TransactionState,
         order_by: Literal["asc", "desc"] = "asc",
         user_id: str = "me",
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
     ):
         """Fetch all orders tethered to the authenticated user
 
@@ -194,6 +718,8 @@ class AsyncOrderClient(BaseAsyncAPIWrapper):
             order_by: The Order in which you retrieve data either ascending or desending order
             user_id: The User ID. Use 'me' if fetching wallets of main authenticated user,
                 use the user_id if fetching for Sub-account linked to the authenticated user
+            page: The page of results to fetch, starting at 1.
+            per_page: The number of results per page.
 
         Returns:
             APIResponse, which is a dataclass containing the response gotten from Quidax servers.
@@ -207,12 +733,49 @@ class AsyncOrderClient(BaseAsyncAPIWrapper):
             ("market", pair),
             ("state", state),
             ("order_by", order_by),
+            ("page", page),
+            ("per_page", per_page),
         )
         url = append_query_parameters(
             f"{self.base_url}/users/{user_id}/orders", query_params
         )
         return await self._api_call(url=url, method=HTTPMethod.GET)
 
+    def iter_all(
+        self,
+        pair: CurrencyPair,
+        state: TransactionState,
+        order_by: Literal["asc", "desc"] = "asc",
+        user_id: str = "me",
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> AsyncIterator[dict]:
+        """Iterates over every order tethered to the authenticated user.
+
+        Pages are fetched as needed, the next one while the current one is consumed,
+        and orders are yielded one at a time so the full history is never held
+        in memory.
+
+        Args:
+            pair: CurrencyPair.DASH_USDT, CurrencyPair.AFEN_USDT, CurrencyPair.BLS_USDT etc
+            state: TransactionState.CHECKED,TransactionState.REJECTED etc
+            order_by: The Order in which you retrieve data either ascending or desending order
+            user_id: The User ID. Use 'me' if fetching wallets of main authenticated user,
+                use the user_id if fetching for Sub-account linked to the authenticated user
+            per_page: The number of orders fetched per request.
+
+        Returns:
+            An iterator over the orders, as dicts returned by Quidax.
+
+        Raises:
+            APIResponseException: If a page could not be fetched.
+        """
+        return apaginate(
+            lambda page: self.all(
+                pair, state, order_by, user_id, page=page, per_page=per_page
+            ),
+            per_page=per_page,
+        )
+
     async def get(self, id: str, user_id: str = "me"):
         """Fetch order details for the authenticated user
 
@@ -253,3 +816,142 @@ class AsyncOrderClient(BaseAsyncAPIWrapper):
             url=f"{self.base_url}/users/{user_id}/orders/{id}/cancel",
             method=HTTPMethod.POST,
         )
+
+    async def cancel_all(
+        self,
+        pair: Optional[CurrencyPair] = None,
+        user_id: str = "me",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_ORDERS,
+        retries: int = DEFAULT_CANCEL_RETRIES,
+        retry_delay: float = 0.1,
+    ) -> CancelSummary:
+        """Cancels every open order, of one market or of all of them.
+
+        The ids of the open orders are collected first, fetching pages as needed, then
+        the orders are cancelled concurrently, up to `max_concurrency` at a time.
+        Cancellations failing with a connection error, a timeout, a rate limit or a
+        server error are retried with an exponential backoff.
+
+        Args:
+            pair: The market whose orders are cancelled. Every market when omitted.
+            user_id: The User ID. Use 'me' for main authenticated user,
+                use the user_id of Sub-account linked to the authenticated user for performing activity for subaccount.
+            max_concurrency: The maximum number of orders being cancelled at once.
+            retries: How many times a failed cancellation is retried.
+            retry_delay: The delay in seconds before the first retry, doubled after
+                each attempt.
+
+        Returns:
+            A `CancelSummary` of the cancelled orders and of those that failed.
+
+        Raises:
+            APIResponseException: If the open orders could not be fetched.
+        """
+        ids = [
+            str(order["id"])
+            async for order in self.iter_all(pair, OrderState.WAIT, user_id=user_id)
+        ]
+
+        async def cancel(order_id: str) -> APIResponse:
+            for attempt in range(retries + 1):
+                try:
+                    return _raise_for_status(
+                        await self.cancel(order_id, user_id), "Cancelling the order"
+                    )
+                except Exception as error:
+                    if attempt == retries or not _is_retriable(error):
+                        raise
+                    await asyncio.sleep(retry_delay * 2**attempt)
+
+        results = [None] * len(ids)
+        async for index, result in stream_batch(
+            [lambda order_id=order_id: cancel(order_id) for order_id in ids],
+            concurrency=max_concurrency,
+            fatal=(),
+        ):
+            results[index] = result
+        return CancelSummary.from_results(ids, results)
+
+    async def amend(
+        self,
+        id: str,
+        price: int,
+        volume: int,
+        pair: Optional[CurrencyPair] = None,
+        type: Optional[OrderType] = None,
+        user_id: str = "me",
+        safe: bool = False,
+        confirm_timeout: float = 5.0,
+        poll_interval: float = 0.2,
+    ) -> AmendResult:
+        """Reprices an order by cancelling it and placing a replacement.
+
+        By default, the cancellation and the replacement are sent concurrently, which
+        takes one round trip instead of two, at the risk of both orders being live for a
+        moment or, if the cancellation fails, for good. In safe mode, the replacement is
+        only placed once the original order is confirmed cancelled, polling it until
+        its state is `cancel`; it is not placed if the order was filled meanwhile.
+
+        Args:
+            id: The id of the order to amend.
+            price: The price of the replacement order.
+            volume: The volume of the replacement order.
+            pair: The market of the order. When omitted with `type`, the order is
+                fetched first, costing a round trip.
+            type: The side of the order, OrderType.BUY or OrderType.SELL.
+            user_id: The User ID. Use 'me' for main authenticated user,
+                use the user_id of Sub-account linked to the authenticated user for performing activity for subaccount.
+            safe: Whether to wait for the cancellation to be confirmed before placing
+                the replacement.
+            confirm_timeout: In safe mode, how many seconds to wait for the confirmation.
+            poll_interval: In safe mode, the number of seconds between two polls.
+
+        Returns:
+            An `AmendResult` holding the outcome of the cancellation and of the
+            replacement. `AmendResult.ok` is True when both succeeded.
+
+        Raises:
+            APIResponseException: If the order had to be fetched and could not be.
+        """
+        if pair is None or type is None:
+            order = _raise_for_status(
+                await self.get(id, user_id), "Fetching the order"
+            ).data
+            pair, type = _pair_and_side(order)
+
+        async def cancel() -> APIResponse:
+            return _raise_for_status(
+                await self.cancel(id, user_id), "Cancelling the order"
+            )
+
+        async def create() -> APIResponse:
+            return _raise_for_status(
+                await self.create(pair, type, price, volume, user_id=user_id),
+                "Placing the order",
+            )
+
+        if not safe:
+            cancel_result, create_result = await asyncio.gather(
+                acapture(cancel), acapture(create)
+            )
+            return AmendResult(cancel=cancel_result, create=create_result)
+
+        async def confirmed_cancel() -> APIResponse:
+            await cancel()
+            deadline = time.monotonic() + confirm_timeout
+            while True:
+                response = _raise_for_status(
+                    await self.get(id, user_id), "Fetching the order"
+                )
+                if _cancel_confirmed(response):
+                    return response
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"Order {id} was not cancelled after {confirm_timeout} seconds"
+                    )
+                await asyncio.sleep(poll_interval)
+
+        cancel_result = await acapture(confirmed_cancel)
+        if not cancel_result.ok:
+            return AmendResult(cancel=cancel_result)
+        return AmendResult(cancel=cancel_result, create=await acapture(create))
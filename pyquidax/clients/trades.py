@@ -1,17 +1,27 @@
+from typing import AsyncIterator, Iterator, Optional
+
 from pyquidax.base import BaseAPIWrapper, BaseAsyncAPIWrapper
-from pyquidax.utils import CurrencyPair, HTTPMethod
+from pyquidax.pagination import DEFAULT_PER_PAGE, apaginate, paginate
+from pyquidax.utils import CurrencyPair, HTTPMethod, append_query_parameters
 
 
 class TradeClient(BaseAPIWrapper):
     """A Wrapper that fetch trades for the authenticated user"""
 
-    def all(self, user_id: str):
+    def all(
+        self,
+        user_id: str,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+    ):
         """Fetch trades for the authenticated user or a sub account
 
 
         Args:
             user_id: The User ID. Use 'me' if fetching wallets of main authenticated user,
                 use the user_id if fetching for Sub-account linked to the authenticated user.
+            page: The page of results to fetch, starting at 1.
+            per_page: The number of results per page.
 
         Returns:
             APIResponse, which is a dataclass containing the response gotten from Quidax servers.
@@ -21,11 +31,78 @@ class TradeClient(BaseAPIWrapper):
             `APIResponse.data` (dict | None) is the data returned by Quidax as a result of the
             request sent.
         """
+        query_params = (
+            ("page", page),
+            ("per_page", per_page),
+        )
+        url = append_query_parameters(
+            f"{self.base_url}/users/{user_id}/trades", query_params
+        )
         return self._api_call(
-            url=f"{self.base_url}/users/{user_id}/trades",
+            url=url,
             method=HTTPMethod.GET,
         )
 
+    def iter_all(
+        self,
+        user_id: str,
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> Iterator[dict]:
+        """Iterates over every trade of the authenticated user or a sub account.
+
+        Pages are fetched as needed, the next one while the current one is consumed,
+        and trades are yielded one at a time so the full history is never held
+        in memory.
+
+        Args:
+            user_id: The User ID. Use 'me' if fetching wallets of main authenticated user,
+                use the user_id if fetching for Sub-account linked to the authenticated user.
+            per_page: The number of trades fetched per request.
+
+        Returns:
+            An iterator over the trades, as dicts returned by Quidax.
+
+        Raises:
+            APIResponseException: If a page could not be fetched.
+        """
+        return paginate(
+            lambda page: self.all(user_id, page=page, per_page=per_page),
+            per_page=per_page,
+        )
+
+    def stream_all(
+        self,
+        user_id: str,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """Streams the trades as the response is downloaded.
+
+        Unlike `all`, which loads the whole response in memory, the `data` array is
+        parsed incrementally and trades are yielded one at a time, so peak memory stays
+        flat however long the history is.
+
+        Args:
+            user_id: The User ID. Use 'me' if fetching wallets of main authenticated user,
+                use the user_id if fetching for Sub-account linked to the authenticated user.
+            page: The page of results to fetch, starting at 1.
+            per_page: The number of results per page.
+
+        Returns:
+            An iterator over the trades, as dicts returned by Quidax.
+
+        Raises:
+            APIResponseException: If the request failed.
+        """
+        query_params = (
+            ("page", page),
+            ("per_page", per_page),
+        )
+        url = append_query_parameters(
+            f"{self.base_url}/users/{user_id}/trades", query_params
+        )
+        return self._stream_api_call(url=url, method=HTTPMethod.GET)
+
     def get(self, pair: CurrencyPair):
         """Fetch recent trades for a given market pair
 
@@ -49,13 +126,20 @@ class TradeClient(BaseAPIWrapper):
 class AsyncTradeClient(BaseAsyncAPIWrapper):
     """An async Wrapper that fetch trades for the authenticated user"""
 
-    async def all(self, user_id: str):
+    async def all(
+        self,
+        user_id: str,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+    ):
         """Fetch trades for the authenticated user or a sub account
 
 
         Args:
             user_id: The User ID. Use 'me' if fetching wallets of main authenticated user,
                 use the user_id if fetching for Sub-account linked to the authenticated user.
+            page: The page of results to fetch, starting at 1.
+            per_page: The number of results per page.
 
         Returns:
             APIResponse, which is a dataclass containing the response gotten from Quidax servers.
@@ -65,11 +149,78 @@ class AsyncTradeClient(BaseAsyncAPIWrapper):
             `APIResponse.data` (dict | None) is the data returned by Quidax as a result of the
             request sent.
         """
+        query_params = (
+            ("page", page),
+            ("per_page", per_page),
+        )
+        url = append_query_parameters(
+            f"{self.base_url}/users/{user_id}/trades", query_params
+        )
         return await self._api_call(
-            url=f"{self.base_url}/users/{user_id}/trades",
+            url=url,
             method=HTTPMethod.GET,
         )
 
+    def iter_all(
+        self,
+        user_id: str,
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> AsyncIterator[dict]:
+        """Iterates over every trade of the authenticated user or a sub account.
+
+        Pages are fetched as needed, the next one while the current one is consumed,
+        and trades are yielded one at a time so the full history is never held
+        in memory.
+
+        Args:
+            user_id: The User ID. Use 'me' if fetching wallets of main authenticated user,
+                use the user_id if fetching for Sub-account linked to the authenticated user.
+            per_page: The number of trades fetched per request.
+
+        Returns:
+            An iterator over the trades, as dicts returned by Quidax.
+
+        Raises:
+            APIResponseException: If a page could not be fetched.
+        """
+        return apaginate(
+            lambda page: self.all(user_id, page=page, per_page=per_page),
+            per_page=per_page,
+        )
+
+    def stream_all(
+        self,
+        user_id: str,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+    ) -> AsyncIterator[dict]:
+        """Streams the trades as the response is downloaded.
+
+        Unlike `all`, which loads the whole response in memory, the `data` array is
+        parsed incrementally and trades are yielded one at a time, so peak memory stays
+        flat however long the history is.
+
+        Args:
+            user_id: The User ID. Use 'me' if fetching wallets of main authenticated user,
+                use the user_id if fetching for Sub-account linked to the authenticated user.
+            page: The page of results to fetch, starting at 1.
+            per_page: The number of results per page.
+
+        Returns:
+            An async iterator over the trades, as dicts returned by Quidax.
+
+        Raises:
+            APIResponseException: If the request failed.
+        """
+        query_params = (
+            ("page", page),
+            ("per_page", per_page),
+        )
+        url = append_query_parameters(
+            f"{self.base_url}/users/{user_id}/trades", query_params
+        )
+        return self._stream_api_call(url=url, method=HTTPMethod.GET)
+
     async def get(self, pair: CurrencyPair):
         """Fetch recent trades for a given market pair
 
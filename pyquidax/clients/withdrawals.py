@@ -1,13 +1,28 @@
 from decimal import Decimal
+from typing import AsyncIterator, Iterator, Optional, Union
 
 from pyquidax.base import BaseAPIWrapper, BaseAsyncAPIWrapper
-from pyquidax.utils import Currency, TransactionState, HTTPMethod
+from pyquidax.fixed import Fixed
+from pyquidax.pagination import DEFAULT_PER_PAGE, apaginate, paginate
+from pyquidax.utils import (
+    Currency,
+    TransactionState,
+    HTTPMethod,
+    append_query_parameters,
+)
 
 
 class WithdrawalClient(BaseAPIWrapper):
     """A wrapper that enables authenticated users to send cryptocurrency to internal or external wallets"""
 
-    def all(self, user_id: str, currency: Currency, state: TransactionState):
+    def all(
+        self,
+        user_id: str,
+        currency: Currency,
+        state: TransactionState,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+    ):
         """Fetch all withdrawals related to the authenticated user.
 
         Args:
@@ -15,6 +30,8 @@ class WithdrawalClient(BaseAPIWrapper):
                 use the user_id if fetching for Sub-account linked to the authenticated user.
             currency: Currency.TRON, Currency.BITCOIN etc
             state: TransactionState.SUBMITTED, TransactionState.SUBMITTING etc
+            page: The page of results to fetch, starting at 1.
+            per_page: The number of results per page.
 
         Returns:
              APIResponse, which is a dataclass containing the response gotten from Quidax servers.
@@ -24,9 +41,48 @@ class WithdrawalClient(BaseAPIWrapper):
             `APIResponse.data` (dict | None) is the data returned by Quidax as a result of the
             request sent.
         """
-        return self._api_call(
-            url=f"{self.base_url}/users/{user_id}/withdrawals?currency={currency}&state={state}",
-            method=HTTPMethod.GET,
+        query_params = (
+            ("currency", currency),
+            ("state", state),
+            ("page", page),
+            ("per_page", per_page),
+        )
+        url = append_query_parameters(
+            f"{self.base_url}/users/{user_id}/withdrawals", query_params
+        )
+        return self._api_call(url=url, method=HTTPMethod.GET)
+
+    def iter_all(
+        self,
+        user_id: str,
+        currency: Currency,
+        state: TransactionState,
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> Iterator[dict]:
+        """Iterates over every withdrawal related to the authenticated user.
+
+        Pages are fetched as needed, the next one while the current one is consumed,
+        and withdrawals are yielded one at a time so the full history is never held
+        in memory.
+
+        Args:
+            user_id: The User ID. Use 'me' if fetching wallets of main authenticated user,
+                use the user_id if fetching for Sub-account linked to the authenticated user.
+            currency: Currency.TRON, Currency.BITCOIN etc
+            state: TransactionState.SUBMITTED, TransactionState.SUBMITTING etc
+            per_page: The number of withdrawals fetched per request.
+
+        Returns:
+            An iterator over the withdrawals, as dicts returned by Quidax.
+
+        Raises:
+            APIResponseException: If a page could not be fetched.
+        """
+        return paginate(
+            lambda page: self.all(
+                user_id, currency, state, page=page, per_page=per_page
+            ),
+            per_page=per_page,
         )
 
     def get(self, user_id: str, withdrawal_id: str):
@@ -54,7 +110,7 @@ class WithdrawalClient(BaseAPIWrapper):
         self,
         user_id: str,
         currency: Currency,
-        amount: Decimal,
+        amount: Union[Decimal, Fixed],
         fund_uid: str,
         transaction_note: str,
         narration: str,
@@ -116,7 +172,14 @@ class WithdrawalClient(BaseAPIWrapper):
 class AsyncWithdrawalClient(BaseAsyncAPIWrapper):
     """An Async wrapper that enables authenticated users to send cryptocurrency to internal or external wallets"""
 
-    async def all(self, user_id: str, currency: Currency, state: TransactionState):
+    async def all(
+        self,
+        user_id: str,
+        currency: Currency,
+        state: TransactionState,
+        page: Optional[int] = None,
+        per_page: Optional[int] = None,
+    ):
         """Fetch all withdrawals related to the authenticated user.
 
         Args:
@@ -124,6 +187,8 @@ class AsyncWithdrawalClient(BaseAsyncAPIWrapper):
                 use the user_id if fetching for Sub-account linked to the authenticated user.
             currency: Currency.TRON, Currency.BITCOIN etc
             state: TransactionState.SUBMITTED, TransactionState.SUBMITTING etc
+            page: The page of results to fetch, starting at 1.
+            per_page: The number of results per page.
 
         Returns:
             APIResponse, which is a dataclass containing the response gotten from Quidax servers.
@@ -133,9 +198,48 @@ class AsyncWithdrawalClient(BaseAsyncAPIWrapper):
             `APIResponse.data` (dict | None) is the data returned by Quidax as a result of the
             request sent.
         """
-        return await self._api_call(
-            url=f"{self.base_url}/users/{user_id}/withdrawals?currency={currency}&state={state}",
-            method=HTTPMethod.GET,
+        query_params = (
+            ("currency", currency),
+            ("state", state),
+            ("page", page),
+            ("per_page", per_page),
+        )
+        url = append_query_parameters(
+            f"{self.base_url}/users/{user_id}/withdrawals", query_params
+        )
+        return await self._api_call(url=url, method=HTTPMethod.GET)
+
+    def iter_all(
+        self,
+        user_id: str,
+        currency: Currency,
+        state: TransactionState,
+        per_page: int = DEFAULT_PER_PAGE,
+    ) -> AsyncIterator[dict]:
+        """Iterates over every withdrawal related to the authenticated user.
+
+        Pages are fetched as needed, the next one while the current one is consumed,
+        and withdrawals are yielded one at a time so the full history is never held
+        in memory.
+
+        Args:
+            user_id: The User ID. Use 'me' if fetching wallets of main authenticated user,
+                use the user_id if fetching for Sub-account linked to the authenticated user.
+            currency: Currency.TRON, Currency.BITCOIN etc
+            state: TransactionState.SUBMITTED, TransactionState.SUBMITTING etc
+            per_page: The number of withdrawals fetched per request.
+
+        Returns:
+            An iterator over the withdrawals, as dicts returned by Quidax.
+
+        Raises:
+            APIResponseException: If a page could not be fetched.
+        """
+        return apaginate(
+            lambda page: self.all(
+                user_id, currency, state, page=page, per_page=per_page
+            ),
+            per_page=per_page,
         )
 
     async def get(self, user_id: str, withdrawal_id: str):
@@ -162,7 +266,7 @@ class AsyncWithdrawalClient(BaseAsyncAPIWrapper):
         self,
         user_id: str,
         currency: Currency,
-        amount: Decimal,
+        amount: Union[Decimal, Fixed],
         fund_uid: str,
         transaction_note: str,
         narration: str,
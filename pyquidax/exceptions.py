@@ -8,3 +8,36 @@ class UnsupportedHTTPMethodException(Exception):
 
 class ConnectionException(Exception):
     ...
+
+
+class StreamException(Exception):
+    ...
+
+
+class ForkException(RuntimeError):
+    ...
+
+
+class APIResponseException(Exception):
+    def __init__(self, message: str, response=None):
+        super().__init__(message)
+        self.response = response
+
+
+class InvalidOrderException(ValueError):
+    def __init__(self, message: str, errors=None):
+        super().__init__(message)
+        self.errors = errors or {}
+
+
+class SlippageExceededException(APIResponseException):
+    def __init__(self, message: str, response=None, order_id=None):
+        super().__init__(message, response)
+        self.order_id = order_id
+
+
+class QuoteDeadlineExceededException(TimeoutError):
+    def __init__(self, message: str, response=None, order_id=None):
+        super().__init__(message)
+        self.response = response
+        self.order_id = order_id
@@ -0,0 +1,256 @@
+import re
+from decimal import Decimal
+from fractions import Fraction
+from typing import Optional, Union
+
+Number = Union[int, float, Decimal, str, "Fixed"]
+
+_POWERS_OF_TEN = [10**places for places in range(40)]
+# `int` and `Decimal` also accept underscores between digits and non-ASCII digits, so
+# amounts are checked against these before being converted.
+_DECIMAL = r"[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)"
+_PLAIN_AMOUNT = re.compile(_DECIMAL)
+_EXPONENT_AMOUNT = re.compile(_DECIMAL + r"[eE][+-]?[0-9]+")
+
+
+def _power_of_ten(places: int) -> int:
+    if places < len(_POWERS_OF_TEN):
+        return _POWERS_OF_TEN[places]
+    return 10**places
+
+
+def _round_half_even(units: int, divisor: int) -> int:
+    quotient, remainder = divmod(units, divisor)
+    doubled = 2 * remainder
+    if doubled > divisor or (doubled == divisor and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+def parse_fixed(text: str, places: Optional[int] = None) -> "Fixed":
+    """Parses an amount returned by Quidax, e.g. `"0.00120000"`, without going through
+    `Decimal` or `float`.
+
+    Args:
+        text: A decimal string, optionally signed. Exponents e.g. `"1e-05"` are
+            accepted too, at the cost of a slower path.
+        places: The number of decimal places of the result. The places of `text` are
+            kept when omitted, and extra digits are rounded half to even otherwise.
+
+    Raises:
+        ValueError: If `text` is not a finite decimal number.
+    """
+    stripped = text.strip()
+    if not _PLAIN_AMOUNT.fullmatch(stripped):
+        if not _EXPONENT_AMOUNT.fullmatch(stripped):
+            raise ValueError(f"{text!r} is not a valid amount")
+        return Fixed.from_decimal(Decimal(stripped), places)
+    whole, _, fraction = stripped.partition(".")
+    digits = len(fraction)
+    scale = digits if places is None else places
+    # `int` takes the sign of `whole` along.
+    if digits <= scale:
+        units = int(whole + fraction) * _power_of_ten(scale - digits)
+    else:
+        units = _round_half_even(int(whole + fraction), _power_of_ten(digits - scale))
+    return Fixed(units, scale)
+
+
+class Fixed:
+    """An exact decimal amount stored as an integer number of units of
+    `10 ** -places`, e.g. `Fixed(12345, 2)` is `123.45`.
+
+    Amounts with different places can be mixed; results have the largest of their
+    places, and products the sum of them. Use a market's `MarketInfo.price_places` and
+    `MarketInfo.volume_places` as `places`. Hot loops over amounts of a single market
+    are fastest working on `units` directly, which are plain `int`s.
+
+    `str` returns the amount with all its places, which is how Quidax expects amounts
+    to be sent.
+    """
+
+    __slots__ = ("units", "places")
+
+    def __init__(self, units: int, places: int = 0):
+        self.units = units
+        self.places = places
+
+    @classmethod
+    def parse(
+        cls, value: Union[Number, dict, None], places: Optional[int] = None
+    ) -> "Fixed":
+        """Converts a string, number or amount object returned by Quidax, e.g.
+        `{"unit": "btc", "amount": "0.5"}`, to a `Fixed`.
+
+        Floats are converted from their shortest representation, e.g. `0.1` is exactly
+        `Fixed(1, 1)`.
+
+        Raises:
+            ValueError: If the value is missing or not a finite number.
+        """
+        if isinstance(value, dict):
+            value = value.get("amount")
+        if isinstance(value, Fixed):
+            return value if places is None else value.rescale(places)
+        if isinstance(value, str):
+            return parse_fixed(value, places)
+        if isinstance(value, bool) or value is None:
+            raise ValueError(f"{value!r} is not a valid amount")
+        if isinstance(value, int):
+            return cls(value * _power_of_ten(places or 0), places or 0)
+        if isinstance(value, float):
+            return parse_fixed(repr(value), places)
+        if isinstance(value, Decimal):
+            return cls.from_decimal(value, places)
+        raise TypeError(f"Cannot convert {type(value).__name__} to an amount")
+
+    @classmethod
+    def from_decimal(cls, value: Decimal, places: Optional[int] = None) -> "Fixed":
+        if not value.is_finite():
+            raise ValueError(f"{value} is not a valid amount")
+        sign, digits, exponent = value.as_tuple()
+        units = int("".join(map(str, digits)) or "0")
+        if sign:
+            units = -units
+        if exponent >= 0:
+            units *= _power_of_ten(exponent)
+            exponent = 0
+        fixed = cls(units, -exponent)
+        return fixed if places is None else fixed.rescale(places)
+
+    def rescale(self, places: int) -> "Fixed":
+        """Returns the amount with `places` decimal places, rounded half to even."""
+        if places == self.places:
+            return self
+        if places > self.places:
+            return Fixed(self.units * _power_of_ten(places - self.places), places)
+        return Fixed(
+            _round_half_even(self.units, _power_of_ten(self.places - places)), places
+        )
+
+    def to_decimal(self) -> Decimal:
+        return Decimal(self.units).scaleb(-self.places)
+
+    def _aligned(self, other) -> Optional[tuple]:
+        if isinstance(other, int) and not isinstance(other, bool):
+            other = Fixed(other)
+        elif not isinstance(other, Fixed):
+            return None
+        if self.places == other.places:
+            return self.units, other.units, self.places
+        if self.places > other.places:
+            scale = _power_of_ten(self.places - other.places)
+            return self.units, other.units * scale, self.places
+        scale = _power_of_ten(other.places - self.places)
+        return self.units * scale, other.units, other.places
+
+    def __add__(self, other):
+        if type(other) is Fixed and other.places == self.places:
+            return Fixed(self.units + other.units, self.places)
+        aligned = self._aligned(other)
+        if aligned is None:
+            return NotImplemented
+        return Fixed(aligned[0] + aligned[1], aligned[2])
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if type(other) is Fixed and other.places == self.places:
+            return Fixed(self.units - other.units, self.places)
+        aligned = self._aligned(other)
+        if aligned is None:
+            return NotImplemented
+        return Fixed(aligned[0] - aligned[1], aligned[2])
+
+    def __rsub__(self, other):
+        aligned = self._aligned(other)
+        if aligned is None:
+            return NotImplemented
+        return Fixed(aligned[1] - aligned[0], aligned[2])
+
+    def __mul__(self, other):
+        if isinstance(other, int) and not isinstance(other, bool):
+            return Fixed(self.units * other, self.places)
+        if isinstance(other, Fixed):
+            return Fixed(self.units * other.units, self.places + other.places)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def divide(self, other: Union["Fixed", int], places: int) -> "Fixed":
+        """Divides the amount by `other`, rounding the quotient half to even to
+        `places` decimal places."""
+        if not isinstance(other, Fixed):
+            other = Fixed(other)
+        numerator = self.units * _power_of_ten(places + other.places)
+        denominator = other.units * _power_of_ten(self.places)
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        return Fixed(_round_half_even(numerator, denominator), places)
+
+    def __neg__(self) -> "Fixed":
+        return Fixed(-self.units, self.places)
+
+    def __abs__(self) -> "Fixed":
+        return Fixed(abs(self.units), self.places)
+
+    def __bool__(self) -> bool:
+        return self.units != 0
+
+    def __eq__(self, other) -> bool:
+        aligned = self._aligned(other)
+        if aligned is None:
+            return NotImplemented
+        return aligned[0] == aligned[1]
+
+    def __lt__(self, other) -> bool:
+        if type(other) is Fixed and other.places == self.places:
+            return self.units < other.units
+        aligned = self._aligned(other)
+        if aligned is None:
+            return NotImplemented
+        return aligned[0] < aligned[1]
+
+    def __le__(self, other) -> bool:
+        aligned = self._aligned(other)
+        if aligned is None:
+            return NotImplemented
+        return aligned[0] <= aligned[1]
+
+    def __gt__(self, other) -> bool:
+        if type(other) is Fixed and other.places == self.places:
+            return self.units > other.units
+        aligned = self._aligned(other)
+        if aligned is None:
+            return NotImplemented
+        return aligned[0] > aligned[1]
+
+    def __ge__(self, other) -> bool:
+        aligned = self._aligned(other)
+        if aligned is None:
+            return NotImplemented
+        return aligned[0] >= aligned[1]
+
+    def __hash__(self) -> int:
+        # Equal to the hash of the equal int, so both work as the same dict key.
+        return hash(Fraction(self.units, _power_of_ten(self.places)))
+
+    def __float__(self) -> float:
+        return self.units / _power_of_ten(self.places)
+
+    def __int__(self) -> int:
+        whole = abs(self.units) // _power_of_ten(self.places)
+        return -whole if self.units < 0 else whole
+
+    def __str__(self) -> str:
+        if not self.places:
+            return str(self.units)
+        digits = str(abs(self.units)).rjust(self.places + 1, "0")
+        sign = "-" if self.units < 0 else ""
+        return f"{sign}{digits[:-self.places]}.{digits[-self.places:]}"
+
+    def __repr__(self) -> str:
+        return f"Fixed({self.units}, {self.places})"
+
+    def __reduce__(self):
+        return Fixed, (self.units, self.places)
@@ -0,0 +1,314 @@
+import math
+from array import array
+from collections import deque
+from typing import Deque, Iterable, NamedTuple, Optional, Sequence, Tuple, Union
+
+from pyquidax.utils import APIResponse
+
+try:
+    import numpy
+except ImportError:  # Installed with the `numpy` extra.
+    numpy = None
+
+# Below this many values, converting to and from NumPy costs more than it saves.
+_NUMPY_MIN_SIZE = 64
+# The lowest decay factor applied within a block of `_smooth`, so that the inverse
+# weights it sums stay far from overflowing.
+_MIN_BLOCK_DECAY = 1e-100
+
+
+class KLineColumns(NamedTuple):
+    """The rows of `MarketClient.get_k_line` split into contiguous columns."""
+
+    timestamp: array
+    open: array
+    high: array
+    low: array
+    close: array
+    volume: array
+
+
+def columns(response: Union[APIResponse, Sequence[Sequence]]) -> KLineColumns:
+    """Splits k-line rows into columns.
+
+    Args:
+        response: The `APIResponse` returned by `get_k_line` or its `data`, a list of
+            `[timestamp, open, high, low, close, volume]` rows.
+    """
+    rows = response.data if isinstance(response, APIResponse) else response
+    rows = rows or []
+    return KLineColumns(
+        timestamp=array("q", (int(row[0]) for row in rows)),
+        open=array("d", (float(row[1]) for row in rows)),
+        high=array("d", (float(row[2]) for row in rows)),
+        low=array("d", (float(row[3]) for row in rows)),
+        close=array("d", (float(row[4]) for row in rows)),
+        volume=array("d", (float(row[5]) for row in rows)),
+    )
+
+
+class EMA:
+    """An exponential moving average updated one value at a time.
+
+    The first value seeds the average.
+    """
+
+    def __init__(self, span: int):
+        """
+        Args:
+            span: The number of periods, the smoothing factor being `2 / (span + 1)`.
+        """
+        if span < 1:
+            raise ValueError("`span` must be at least `1`")
+        self.alpha = 2 / (span + 1)
+        self.value = math.nan
+
+    def update(self, value: float) -> float:
+        if math.isnan(self.value):
+            self.value = value
+        else:
+            self.value += self.alpha * (value - self.value)
+        return self.value
+
+
+class VWAP:
+    """A cumulative volume weighted average price updated one candle at a time,
+    using the typical price `(high + low + close) / 3` of each candle."""
+
+    def __init__(self):
+        self._total = 0.0
+        self._volume = 0.0
+
+    @property
+    def value(self) -> float:
+        return self._total / self._volume if self._volume else math.nan
+
+    def update(self, high: float, low: float, close: float, volume: float) -> float:
+        self._total += (high + low + close) / 3 * volume
+        self._volume += volume
+        return self.value
+
+    def reset(self):
+        """Starts a new session, e.g. at the beginning of each day."""
+        self._total = 0.0
+        self._volume = 0.0
+
+
+class ATR:
+    """Wilder's average true range updated one candle at a time.
+
+    It is `nan` until `period` candles have been seen, then seeded with the mean of
+    their true ranges.
+    """
+
+    def __init__(self, period: int = 14):
+        if period < 1:
+            raise ValueError("`period` must be at least `1`")
+        self.period = period
+        self.value = math.nan
+        self._previous_close: Optional[float] = None
+        self._count = 0
+        self._sum = 0.0
+
+    def update(self, high: float, low: float, close: float) -> float:
+        if self._previous_close is None:
+            true_range = high - low
+        else:
+            true_range = max(
+                high - low,
+                abs(high - self._previous_close),
+                abs(low - self._previous_close),
+            )
+        self._previous_close = close
+        self._count += 1
+        if self._count < self.period:
+            self._sum += true_range
+        elif self._count == self.period:
+            self.value = (self._sum + true_range) / self.period
+        else:
+            self.value += (true_range - self.value) / self.period
+        return self.value
+
+
+class BollingerBands:
+    """Bollinger bands over a rolling window, updated one value at a time in constant
+    time with Welford's method, which unlike running sums of squares does not lose
+    the variance of large prices to rounding.
+
+    The bands are `nan` until `period` values have been seen.
+    """
+
+    def __init__(self, period: int = 20, deviations: float = 2.0):
+        """
+        Args:
+            period: The size of the rolling window.
+            deviations: How many standard deviations the bands are from the average.
+        """
+        if period < 1:
+            raise ValueError("`period` must be at least `1`")
+        self.period = period
+        self.deviations = deviations
+        self._window: Deque[float] = deque()
+        self._mean = 0.0
+        # The sum of squared differences from the mean of the window.
+        self._m2 = 0.0
+
+    def update(self, value: float) -> Tuple[float, float, float]:
+        """Returns the `(middle, upper, lower)` bands after adding `value`."""
+        self._window.append(value)
+        if len(self._window) > self.period:
+            removed = self._window.popleft()
+            mean = self._mean + (value - removed) / self.period
+            self._m2 += (value - removed) * (value - mean + removed - self._mean)
+            self._mean = mean
+        else:
+            delta = value - self._mean
+            self._mean += delta / len(self._window)
+            self._m2 += delta * (value - self._mean)
+        if len(self._window) < self.period:
+            return math.nan, math.nan, math.nan
+        middle = self._mean
+        width = self.deviations * math.sqrt(max(self._m2 / self.period, 0.0))
+        return middle, middle + width, middle - width
+
+
+def _to_numpy(*columns: Iterable[float]) -> Optional[tuple]:
+    # Returns the columns as float64 NumPy arrays truncated to the shortest, like
+    # `zip`, or None when NumPy is missing or the columns are too short to be worth
+    # it. Iterators are left to the pure Python path, which consumes them lazily.
+    if numpy is None or not all(hasattr(column, "__len__") for column in columns):
+        return None
+    size = min(len(column) for column in columns)
+    if size < _NUMPY_MIN_SIZE:
+        return None
+    return tuple(numpy.asarray(column[:size], dtype=float) for column in columns)
+
+
+def _from_numpy(values) -> array:
+    result = array("d")
+    result.frombytes(numpy.ascontiguousarray(values, dtype=float).tobytes())
+    return result
+
+
+def _smooth(values, alpha: float, seed: float):
+    """Computes `previous += alpha * (value - previous)` over `values` from `seed`.
+
+    Within a block, the recurrence is the closed form
+    `decay ** (i + 1) * seed + alpha * decay ** i * cumsum(value_k / decay ** k)`,
+    the blocks being short enough for `decay ** -k` to stay finite.
+    """
+    if alpha == 1:
+        return values.copy()
+    decay = 1 - alpha
+    block = max(int(math.log(_MIN_BLOCK_DECAY) / math.log(decay)), 1)
+    result = numpy.empty_like(values)
+    powers = decay ** numpy.arange(min(block, len(values)) + 1)
+    previous = seed
+    for start in range(0, len(values), block):
+        chunk = values[start : start + block]
+        size = len(chunk)
+        weighted = numpy.cumsum(chunk / powers[:size])
+        result[start : start + size] = (
+            powers[1 : size + 1] * previous + alpha * powers[:size] * weighted
+        )
+        previous = result[start + size - 1]
+    return result
+
+
+def ema(values: Iterable[float], span: int) -> array:
+    """Returns the exponential moving average of every value. See `EMA`.
+
+    Computed with NumPy when the `numpy` extra is installed.
+    """
+    average = EMA(span)
+    data = _to_numpy(values)
+    if data is not None and not numpy.isnan(data[0]).any():
+        (values,) = data
+        return _from_numpy(_smooth(values, average.alpha, values[0]))
+    return array("d", (average.update(value) for value in values))
+
+
+def vwap(
+    high: Iterable[float],
+    low: Iterable[float],
+    close: Iterable[float],
+    volume: Iterable[float],
+) -> array:
+    """Returns the cumulative VWAP at every candle. See `VWAP`.
+
+    Computed with NumPy when the `numpy` extra is installed.
+    """
+    data = _to_numpy(high, low, close, volume)
+    if data is not None:
+        high, low, close, volume = data
+        total = numpy.cumsum((high + low + close) / 3 * volume)
+        cumulative_volume = numpy.cumsum(volume)
+        result = numpy.full_like(total, math.nan)
+        numpy.divide(total, cumulative_volume, out=result, where=cumulative_volume != 0)
+        return _from_numpy(result)
+    average = VWAP()
+    return array(
+        "d", (average.update(*candle) for candle in zip(high, low, close, volume))
+    )
+
+
+def atr(
+    high: Iterable[float],
+    low: Iterable[float],
+    close: Iterable[float],
+    period: int = 14,
+) -> array:
+    """Returns the average true range at every candle. See `ATR`.
+
+    Computed with NumPy when the `numpy` extra is installed.
+    """
+    average = ATR(period)
+    data = _to_numpy(high, low, close)
+    if data is not None:
+        high, low, close = data
+        true_range = high - low
+        previous_close = close[:-1]
+        true_range[1:] = numpy.maximum.reduce(
+            [
+                true_range[1:],
+                numpy.abs(high[1:] - previous_close),
+                numpy.abs(low[1:] - previous_close),
+            ]
+        )
+        result = numpy.full_like(true_range, math.nan)
+        if len(true_range) >= period:
+            seed = true_range[:period].mean()
+            result[period - 1] = seed
+            result[period:] = _smooth(true_range[period:], 1 / period, seed)
+        return _from_numpy(result)
+    return array("d", (average.update(*candle) for candle in zip(high, low, close)))
+
+
+def bollinger_bands(
+    values: Iterable[float], period: int = 20, deviations: float = 2.0
+) -> Tuple[array, array, array]:
+    """Returns the `(middle, upper, lower)` bands at every value. See `BollingerBands`.
+
+    Computed with NumPy when the `numpy` extra is installed, the variance of each
+    window being recomputed from its values.
+    """
+    bands = BollingerBands(period, deviations)
+    data = _to_numpy(values)
+    if data is not None:
+        (values,) = data
+        middle = numpy.full_like(values, math.nan)
+        width = numpy.full_like(values, math.nan)
+        if len(values) >= period:
+            windows = numpy.lib.stride_tricks.sliding_window_view(values, period)
+            middle[period - 1 :] = windows.mean(axis=1)
+            width[period - 1 :] = deviations * windows.std(axis=1)
+        return (
+            _from_numpy(middle),
+            _from_numpy(middle + width),
+            _from_numpy(middle - width),
+        )
+    middle, upper, lower = array("d"), array("d"), array("d")
+    for value in values:
+        for column, band in zip((middle, upper, lower), bands.update(value)):
+            column.append(band)
+    return middle, upper, lower
@@ -0,0 +1,171 @@
+import codecs
+import json
+import re
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List
+
+_WHITESPACE = " \t\n\r"
+_NON_WHITESPACE = re.compile(r"[^ \t\n\r]")
+
+
+class JSONArrayParser:
+    """An incremental parser yielding the items of an array held by a key of a JSON
+    object, e.g. the `data` array of a Quidax response, as the document arrives.
+
+    Only the item being parsed and the text not consumed yet are kept in memory, so
+    peak memory depends on the size of the largest item rather than of the document.
+    The other keys of the object are decoded whole and kept in `fields`.
+
+    Usage:
+        parser = JSONArrayParser("data")
+        for text in chunks:
+            for item in parser.feed(text):
+                ...
+        parser.close()
+    """
+
+    def __init__(self, key: str = "data"):
+        """
+        Args:
+            key: The key of the array whose items are yielded.
+        """
+        self.key = key
+        self.fields: Dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._state = "object"
+        self._current_key = None
+
+    def feed(self, text: str) -> List[Any]:
+        """Adds the next part of the document.
+
+        Returns:
+            The items of the array completed by this part.
+
+        Raises:
+            json.JSONDecodeError: If the document is not a JSON object.
+        """
+        # The consumed prefix is only dropped here, once per part.
+        self._buffer = self._buffer[self._position :] + text
+        self._position = 0
+        items = []
+        while True:
+            char = self._next_char()
+            if char is None:
+                return items
+            if self._state == "object":
+                self._expect(char, "{")
+                self._state = "key"
+            elif self._state == "key":
+                if char == "}":
+                    self._position += 1
+                    self._state = "done"
+                    continue
+                if char != '"':
+                    self._fail("Expecting property name enclosed in double quotes")
+                if not self._decode():
+                    return items
+                self._current_key = self._value
+                self._state = "colon"
+            elif self._state == "colon":
+                self._expect(char, ":")
+                self._state = "value"
+            elif self._state == "value":
+                if self._current_key == self.key and char == "[":
+                    self._position += 1
+                    self._state = "first_item"
+                    continue
+                if not self._decode():
+                    return items
+                self.fields[self._current_key] = self._value
+                self._state = "next_key"
+            elif self._state in ("first_item", "item"):
+                if self._state == "first_item" and char == "]":
+                    self._position += 1
+                    self._state = "next_key"
+                    continue
+                if not self._decode():
+                    return items
+                items.append(self._value)
+                self._state = "next_item"
+            elif self._state == "next_item":
+                if char == "]":
+                    self._position += 1
+                    self._state = "next_key"
+                else:
+                    self._expect(char, ",")
+                    self._state = "item"
+            elif self._state == "next_key":
+                if char == "}":
+                    self._position += 1
+                    self._state = "done"
+                else:
+                    self._expect(char, ",")
+                    self._state = "key"
+            else:
+                self._fail("Extra data")
+
+    def close(self):
+        """Checks that the whole document was fed.
+
+        Raises:
+            json.JSONDecodeError: If the document is truncated.
+        """
+        if self._state != "done":
+            self._fail("Unterminated JSON document")
+
+    def _next_char(self):
+        buffer = self._buffer
+        position = self._position
+        while position < len(buffer) and buffer[position] in _WHITESPACE:
+            position += 1
+        self._position = position
+        return buffer[position] if position < len(buffer) else None
+
+    def _expect(self, char: str, expected: str):
+        if char != expected:
+            self._fail(f"Expecting '{expected}' delimiter")
+        self._position += 1
+
+    def _decode(self) -> bool:
+        # A value is only accepted once something follows it, otherwise a number
+        # split across two parts would be decoded from its first digits.
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError:
+            return False
+        # Searched by index, as slicing the rest of the buffer after every item would
+        # make parsing a large part quadratic.
+        if _NON_WHITESPACE.search(self._buffer, end) is None:
+            return False
+        self._value = value
+        self._position = end
+        return True
+
+    def _fail(self, message: str):
+        raise json.JSONDecodeError(message, self._buffer, self._position)
+
+
+def iter_json_items(chunks: Iterable[bytes], key: str = "data") -> Iterator[Any]:
+    """Yields the items of the `key` array of a UTF-8 encoded JSON object read from
+    `chunks`, e.g. `httpx.Response.iter_bytes()`. See `JSONArrayParser`."""
+    parser = JSONArrayParser(key)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        yield from parser.feed(decoder.decode(chunk))
+    yield from parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+
+
+async def aiter_json_items(
+    chunks: AsyncIterable[bytes], key: str = "data"
+) -> AsyncIterator[Any]:
+    """An async version of `iter_json_items`."""
+    parser = JSONArrayParser(key)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    async for chunk in chunks:
+        for item in parser.feed(decoder.decode(chunk)):
+            yield item
+    for item in parser.feed(decoder.decode(b"", final=True)):
+        yield item
+    parser.close()
@@ -0,0 +1,173 @@
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pyquidax.utils import APIResponse, CurrencyPair, parse_amount
+
+Level = Tuple[float, float]
+# A changed price level, whose volume is None when the level was removed.
+LevelChange = Tuple[float, Optional[float]]
+
+
+def parse_levels(entries: Optional[Iterable]) -> Dict[float, float]:
+    """Aggregates one side of an order book into a mapping of price to volume.
+
+    Args:
+        entries: The `asks` or `bids` returned by `MarketClient.get_order_book`
+            (a list of orders) or by `MarketClient.get_depth_data` (a list of
+            `[price, volume]` pairs).
+
+    Returns:
+        A dict mapping each price level to the total volume resting at that price.
+        Entries with a missing price or volume are skipped, and so are levels
+        without any volume left.
+    """
+    levels: Dict[float, float] = {}
+    for entry in entries or ():
+        if isinstance(entry, dict):
+            price = parse_amount(entry.get("price"))
+            volume = parse_amount(entry.get("volume"))
+        else:
+            price, volume = parse_amount(entry[0]), parse_amount(entry[1])
+        # NaN never equals itself, so such a level would be reported as changed by
+        # every delta.
+        if math.isnan(price) or math.isnan(volume):
+            continue
+        levels[price] = levels.get(price, 0.0) + volume
+    return {price: volume for price, volume in levels.items() if volume > 0}
+
+
+def diff_levels(
+    previous: Dict[float, float], current: Dict[float, float]
+) -> List[LevelChange]:
+    """Computes the price levels that changed between two sides of an order book.
+
+    Args:
+        previous: The price levels of the older snapshot.
+        current: The price levels of the newer snapshot.
+
+    Returns:
+        A list of `(price, volume)` tuples sorted by price. Inserted and updated
+        levels carry their new volume while removed levels carry a volume of `None`.
+    """
+    changes: List[LevelChange] = [
+        (price, volume)
+        for price, volume in current.items()
+        if previous.get(price) != volume
+    ]
+    changes.extend((price, None) for price in previous if price not in current)
+    changes.sort(key=lambda change: change[0])
+    return changes
+
+
+@dataclass
+class OrderBookSnapshot:
+    """A dataclass representing the aggregated price levels of a market's order book."""
+
+    pair: CurrencyPair
+    bids: Dict[float, float] = field(default_factory=dict)
+    asks: Dict[float, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_response(
+        cls, pair: CurrencyPair, response: Union[APIResponse, dict]
+    ) -> "OrderBookSnapshot":
+        """Builds a snapshot from the response of `get_order_book` or `get_depth_data`.
+
+        Args:
+            pair: The market the response belongs to.
+            response: The `APIResponse` returned by the market client or its `data`.
+        """
+        data = response.data if isinstance(response, APIResponse) else response
+        data = data or {}
+        return cls(
+            pair=pair,
+            bids=parse_levels(data.get("bids")),
+            asks=parse_levels(data.get("asks")),
+        )
+
+
+@dataclass
+class OrderBookDelta:
+    """A dataclass representing the price levels that changed between two consecutive
+    order book snapshots of a market.
+
+    `bids` and `asks` are lists of `(price, volume)` tuples sorted by price. A volume of
+    `None` means the level was removed, any other volume is the new total at that price.
+    """
+
+    pair: CurrencyPair
+    bids: List[LevelChange] = field(default_factory=list)
+    asks: List[LevelChange] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.bids or self.asks)
+
+    def apply(self, snapshot: OrderBookSnapshot) -> OrderBookSnapshot:
+        """Applies the delta to a snapshot in place and returns it."""
+        for levels, changes in ((snapshot.bids, self.bids), (snapshot.asks, self.asks)):
+            for price, volume in changes:
+                if volume is None:
+                    levels.pop(price, None)
+                else:
+                    levels[price] = volume
+        return snapshot
+
+
+class OrderBookDiffer:
+    """Compares consecutive order book snapshots per market and emits only the
+    price levels that changed.
+
+    The first snapshot of a market yields a delta containing every level, so consumers
+    can build their local book from deltas alone.
+    """
+
+    def __init__(self):
+        self._books: Dict[CurrencyPair, OrderBookSnapshot] = {}
+
+    def update(
+        self, pair: CurrencyPair, response: Union[APIResponse, dict]
+    ) -> OrderBookDelta:
+        """Records a new snapshot of a market and returns what changed since the last one.
+
+        Args:
+            pair: The market the snapshot belongs to.
+            response: The `APIResponse` returned by `get_order_book`/`get_depth_data`
+                or its `data`.
+
+        Returns:
+            An `OrderBookDelta`, which is falsy when nothing changed.
+        """
+        current = OrderBookSnapshot.from_response(pair, response)
+        previous = self._books.get(pair) or OrderBookSnapshot(pair=pair)
+        self._books[pair] = current
+        return OrderBookDelta(
+            pair=pair,
+            bids=diff_levels(previous.bids, current.bids),
+            asks=diff_levels(previous.asks, current.asks),
+        )
+
+    def diff(
+        self, pair: CurrencyPair, responses: Iterable[Union[APIResponse, dict]]
+    ) -> Iterator[OrderBookDelta]:
+        """Yields a delta for each snapshot in `responses` that changed the book.
+
+        Args:
+            pair: The market the snapshots belong to.
+            responses: Consecutive responses of `get_order_book`/`get_depth_data`.
+        """
+        for response in responses:
+            delta = self.update(pair, response)
+            if delta:
+                yield delta
+
+    def snapshot(self, pair: CurrencyPair) -> Optional[OrderBookSnapshot]:
+        """Returns the last recorded snapshot of a market if any."""
+        return self._books.get(pair)
+
+    def reset(self, pair: Optional[CurrencyPair] = None):
+        """Forgets the recorded snapshot of a market, or of every market if `pair` is not given."""
+        if pair is None:
+            self._books.clear()
+        else:
+            self._books.pop(pair, None)
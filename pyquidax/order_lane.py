@@ -0,0 +1,239 @@
+import json
+import math
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Literal, Optional, Tuple, Union
+
+import httpx
+
+from pyquidax.base import BaseAPIWrapper, BaseAsyncAPIWrapper
+from pyquidax.exceptions import ConnectionException
+from pyquidax.fixed import Fixed
+from pyquidax.utils import APIResponse, CurrencyPair, OrderType
+
+Number = Union[int, float, Decimal, str, Fixed]
+
+
+def _encode_number(value: Number) -> bytes:
+    if isinstance(value, bool):
+        raise TypeError("Prices and volumes must be numbers, not booleans")
+    if isinstance(value, int):
+        return str(value).encode()
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError(f"{value} is not a valid price or volume")
+        return repr(value).encode()
+    if isinstance(value, Decimal):
+        if not value.is_finite():
+            raise ValueError(f"{value} is not a valid price or volume")
+        return str(value).encode()
+    if isinstance(value, str):
+        return json.dumps(value).encode()
+    if isinstance(value, Fixed):
+        return str(value).encode()
+    raise TypeError(f"Cannot encode {type(value).__name__} as a price or volume")
+
+
+class OrderTicket:
+    """An order entry bound to a market, side and order type.
+
+    The URL and the constant part of the JSON body are built once, so placing an order
+    only formats its price and volume.
+    """
+
+    __slots__ = ("url", "ord_type", "_prefix", "_send")
+
+    def __init__(
+        self,
+        url: str,
+        pair: str,
+        side: str,
+        ord_type: str,
+        send: Callable[[str, bytes], Any],
+    ):
+        self.url = url
+        self.ord_type = ord_type
+        self._prefix = json.dumps(
+            {"market": pair, "side": side, "ord_type": ord_type},
+            separators=(",", ":"),
+        )[:-1].encode()
+        self._send = send
+
+    def body(self, price: Optional[Number], volume: Number) -> bytes:
+        """Returns the JSON body of an order, the one `OrderClient.create` sends."""
+        if self.ord_type == "market":
+            return b"".join((self._prefix, b',"volume":', _encode_number(volume), b"}"))
+        return b"".join(
+            (
+                self._prefix,
+                b',"price":',
+                _encode_number(price),
+                b',"volume":',
+                _encode_number(volume),
+                b"}",
+            )
+        )
+
+    def submit(self, price: Optional[Number], volume: Number):
+        """Places an order. `price` is ignored by market orders.
+
+        Returns:
+            The `APIResponse` of the order, or an awaitable of it if the ticket was
+            bound by an `AsyncOrderLane`.
+        """
+        return self._send(self.url, self.body(price, volume))
+
+
+def _value(value: Union[Enum, str]) -> str:
+    return value.value if isinstance(value, Enum) else value
+
+
+class _OrderLaneMixin:
+    def _init_lane(self, user_id: str, connections: int, keepalive_expiry: float):
+        self.user_id = user_id
+        self.connections = connections
+        self.keepalive_expiry = keepalive_expiry
+        self._tickets: Dict[Tuple[str, str, str], OrderTicket] = {}
+
+    @property
+    def _lane_headers(self) -> dict:
+        return {**self.headers, "content-type": "application/json"}
+
+    @property
+    def _lane_limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.connections,
+            max_keepalive_connections=self.connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def bind(
+        self,
+        pair: Union[CurrencyPair, str],
+        type: Union[OrderType, str],
+        ord_type: Literal["limit", "market"] = "limit",
+    ) -> OrderTicket:
+        """Returns the `OrderTicket` of a market, side and order type, creating it on
+        first use."""
+        key = (_value(pair), _value(type), ord_type)
+        ticket = self._tickets.get(key)
+        if ticket is None:
+            ticket = self._tickets[key] = OrderTicket(
+                f"{self.base_url}/users/{self.user_id}/orders", *key, send=self._send
+            )
+        return ticket
+
+
+class OrderLane(_OrderLaneMixin, BaseAPIWrapper):
+    """A low-latency path to place orders, separate from the other requests.
+
+    It keeps its own small pool of connections to Quidax, so orders never wait behind
+    market data requests, with headers bound once to the pool and bodies encoded from
+    pre-built templates by `OrderTicket`. Call `warmup` ahead of trading to open the
+    connections.
+
+    Usage:
+        lane = OrderLane(secret_key)
+        lane.warmup(lane.connections)
+        buy = lane.bind(CurrencyPair.BTC_NGN, OrderType.BUY)
+        response = buy.submit(price=20_000_000, volume=0.001)
+    """
+
+    def __init__(
+        self,
+        secret_key: Optional[str] = None,
+        user_id: str = "me",
+        connections: int = 1,
+        keepalive_expiry: float = 60.0,
+    ):
+        """
+        Args:
+            secret_key: Your Quidax secret key.
+            user_id: The User ID. Use 'me' for main authenticated user,
+                use the user_id of Sub-account linked to the authenticated user for performing activity for subaccount.
+            connections: The number of connections reserved for placing orders.
+            keepalive_expiry: The number of seconds an idle connection is kept open.
+        """
+        super().__init__(secret_key)
+        self._init_lane(user_id, connections, keepalive_expiry)
+
+    def _create_http_client(self) -> httpx.Client:
+        return httpx.Client(headers=self._lane_headers, limits=self._lane_limits)
+
+    def _send(self, url: str, body: bytes) -> APIResponse:
+        try:
+            response = self.http_client.post(url, content=body)
+        except httpx.ConnectError:
+            raise ConnectionException(
+                "Unable to connect to server. Please ensure you have an internet connection"
+            )
+        except httpx.ConnectTimeout:
+            raise ConnectionException("Server refused to respond")
+        return self._parse_response(response)
+
+    def create(
+        self,
+        pair: CurrencyPair,
+        type: OrderType,
+        price: Optional[Number],
+        volume: Number,
+        ord_type: Literal["limit", "market"] = "limit",
+    ) -> APIResponse:
+        """Places an order like `OrderClient.create`, through the bound ticket."""
+        return self.bind(pair, type, ord_type).submit(price, volume)
+
+
+class AsyncOrderLane(_OrderLaneMixin, BaseAsyncAPIWrapper):
+    """An async version of `OrderLane`. Tickets bound by it return awaitables.
+
+    Each event loop gets its own connections, closed by `aclose`.
+
+    Usage:
+        async with AsyncOrderLane(secret_key) as lane:
+            await lane.warmup(lane.connections)
+            buy = lane.bind(CurrencyPair.BTC_NGN, OrderType.BUY)
+            response = await buy.submit(price=20_000_000, volume=0.001)
+    """
+
+    def __init__(
+        self,
+        secret_key: Optional[str] = None,
+        user_id: str = "me",
+        connections: int = 1,
+        keepalive_expiry: float = 60.0,
+    ):
+        """
+        Args:
+            secret_key: Your Quidax secret key.
+            user_id: The User ID. Use 'me' for main authenticated user,
+                use the user_id of Sub-account linked to the authenticated user for performing activity for subaccount.
+            connections: The number of connections reserved for placing orders.
+            keepalive_expiry: The number of seconds an idle connection is kept open.
+        """
+        super().__init__(secret_key)
+        self._init_lane(user_id, connections, keepalive_expiry)
+
+    def _create_http_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(headers=self._lane_headers, limits=self._lane_limits)
+
+    async def _send(self, url: str, body: bytes) -> APIResponse:
+        try:
+            response = await self.http_client.post(url, content=body)
+        except httpx.ConnectError:
+            raise ConnectionException(
+                "Unable to connect to server. Please ensure you have an internet connection"
+            )
+        except httpx.ConnectTimeout:
+            raise ConnectionException("Server refused to respond")
+        return self._parse_response(response)
+
+    async def create(
+        self,
+        pair: CurrencyPair,
+        type: OrderType,
+        price: Optional[Number],
+        volume: Number,
+        ord_type: Literal["limit", "market"] = "limit",
+    ) -> APIResponse:
+        """Places an order like `AsyncOrderClient.create`, through the bound ticket."""
+        return await self.bind(pair, type, ord_type).submit(price, volume)
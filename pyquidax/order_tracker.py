@@ -0,0 +1,476 @@
+import asyncio
+import logging
+import math
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pyquidax.batch import DEFAULT_MAX_WORKERS, stream_batch
+from pyquidax.clients.orders import AsyncOrderClient, OrderClient
+from pyquidax.pagination import DEFAULT_PER_PAGE
+from pyquidax.polling import _AsyncPoller, _Poller
+from pyquidax.utils import APIResponse, CurrencyPair, OrderState
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATES = frozenset((OrderState.DONE.value, OrderState.CANCEL.value))
+
+
+@dataclass
+class OrderEvent:
+    """A dataclass representing a change of state of a tracked order.
+
+    `order` is the order as Quidax returned it when the change was seen.
+    """
+
+    order_id: str
+    previous_state: Optional[str]
+    state: str
+    order: dict
+
+
+OrderCallback = Callable[[OrderEvent], None]
+AsyncOrderCallback = Callable[[OrderEvent], Union[None, Awaitable[None]]]
+
+
+class _WatchedOrder:
+    __slots__ = ("id", "pair", "state", "since", "next_check")
+
+    def __init__(self, id: str, pair: Optional[str], state: str, since: float):
+        self.id = id
+        self.pair = pair
+        self.state = state
+        self.since = since
+        self.next_check = since
+
+
+def _state(value) -> Optional[str]:
+    return value.value if isinstance(value, Enum) else value
+
+
+class _TrackedOrders:
+    """The bookkeeping of an order tracker: what to refresh next and how, and which
+    refreshed orders changed state."""
+
+    def __init__(
+        self,
+        interval: float,
+        max_interval: float,
+        age_factor: float,
+        per_page: int,
+        clock: Callable[[], float],
+    ):
+        self.interval = interval
+        self.max_interval = max_interval
+        self.age_factor = age_factor
+        self.per_page = per_page
+        self.clock = clock
+        self.orders: Dict[str, _WatchedOrder] = {}
+        # The number of open orders each market had when it was last listed.
+        self.open_counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def watch(
+        self,
+        order_id: str,
+        pair: Optional[Union[CurrencyPair, str]],
+        state: Union[OrderState, str],
+        age: float,
+    ):
+        order = _WatchedOrder(
+            str(order_id),
+            pair.value if isinstance(pair, Enum) else pair,
+            _state(state),
+            self.clock() - age,
+        )
+        order.next_check = order.since + self._interval_for(order, order.since)
+        with self._lock:
+            self.orders[order.id] = order
+
+    def unwatch(self, order_id: str):
+        with self._lock:
+            self.orders.pop(str(order_id), None)
+
+    def _interval_for(self, order: _WatchedOrder, now: float) -> float:
+        # Young orders are the likeliest to fill, so they are polled the most often.
+        age = now - order.since
+        return min(self.max_interval, max(self.interval, age * self.age_factor))
+
+    def plan(self) -> Tuple[Dict[str, List[str]], List[str]]:
+        """Returns the due orders to refresh by listing the open orders of their
+        market, keyed by market, and the ones to refresh one by one.
+
+        Listing a market costs a request per page of all its open orders, watched or
+        not, so it is only chosen when more of its orders are due than it has pages.
+        Their number is the one seen when the market was last listed, and at least
+        the number of its watched orders.
+        """
+        now = self.clock()
+        due_by_pair: Dict[Optional[str], List[str]] = {}
+        watched_by_pair: Dict[Optional[str], int] = {}
+        with self._lock:
+            for order in self.orders.values():
+                watched_by_pair[order.pair] = watched_by_pair.get(order.pair, 0) + 1
+                if order.next_check <= now:
+                    due_by_pair.setdefault(order.pair, []).append(order.id)
+        listings, gets = {}, due_by_pair.pop(None, [])
+        for pair, ids in due_by_pair.items():
+            open_count = max(watched_by_pair[pair], self.open_counts.get(pair, 0))
+            if len(ids) > max(math.ceil(open_count / self.per_page), 1):
+                listings[pair] = ids
+            else:
+                gets.extend(ids)
+        return listings, gets
+
+    def listed(
+        self, pair: str, ids: List[str], open_orders: Iterable[dict]
+    ) -> Tuple[List[OrderEvent], List[str]]:
+        """Refreshes orders from the open orders of their market.
+
+        Returns:
+            The events of the refreshed orders and the ids of the due orders that are
+            no longer open, whose new state must be fetched one by one.
+        """
+        open_by_id = {str(order.get("id")): order for order in open_orders}
+        self.open_counts[pair] = len(open_by_id)
+        events = []
+        for order_id, order in open_by_id.items():
+            if order_id in self.orders:
+                event = self.updated(order_id, order)
+                if event is not None:
+                    events.append(event)
+        return events, [order_id for order_id in ids if order_id not in open_by_id]
+
+    def fetched(self, order_id: str, response: APIResponse) -> Optional[OrderEvent]:
+        if response.status_code != 200 or not isinstance(response.data, dict):
+            logger.warning(
+                "Refreshing order %s failed with status code %s",
+                order_id,
+                response.status_code,
+            )
+            self._reschedule(order_id)
+            return None
+        return self.updated(order_id, response.data)
+
+    def _reschedule(self, order_id: str):
+        with self._lock:
+            order = self.orders.get(order_id)
+            if order is not None:
+                now = self.clock()
+                order.next_check = now + self._interval_for(order, now)
+
+    def updated(self, order_id: str, data: dict) -> Optional[OrderEvent]:
+        now = self.clock()
+        with self._lock:
+            order = self.orders.get(order_id)
+            if order is None:
+                return None
+            if order.pair is None:
+                market = data.get("market")
+                order.pair = market.get("id") if isinstance(market, dict) else market
+            state = data.get("state")
+            order.next_check = now + self._interval_for(order, now)
+            if state in TERMINAL_STATES:
+                del self.orders[order_id]
+            if state is None or state == order.state:
+                return None
+            previous_state, order.state = order.state, state
+        return OrderEvent(order_id, previous_state, state, data)
+
+
+class OrderTracker(_Poller):
+    """Tracks the state of many open orders with as few requests as possible and emits
+    an `OrderEvent` whenever one changes, e.g. from `wait` to `done` or `cancel`.
+
+    Each round, the due orders of a market are refreshed by listing its open orders
+    with `OrderClient.all`, a request per page of all of them, when that is cheaper
+    than a request per order with `OrderClient.get`. Orders missing from the listing are then fetched one
+    by one to learn their new state. Orders are polled every `interval` seconds while
+    young and less often as they age, up to every `max_interval` seconds. Orders in a
+    final state are no longer tracked.
+
+    Usage:
+        tracker = OrderTracker(client.orders)
+        tracker.watch(order_id, CurrencyPair.BTC_NGN)
+        events = tracker.queue()
+        with tracker:
+            event = events.get()
+    """
+
+    def __init__(
+        self,
+        orders: OrderClient,
+        user_id: str = "me",
+        interval: float = 1.0,
+        max_interval: float = 30.0,
+        age_factor: float = 0.1,
+        per_page: int = DEFAULT_PER_PAGE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            orders: The order client used to refresh orders.
+            user_id: The User ID owning the orders.
+            interval: The shortest number of seconds between two refreshes of an order.
+            max_interval: The longest number of seconds between two refreshes.
+            age_factor: The interval of an order as a fraction of its age, between
+                `interval` and `max_interval`.
+            per_page: The number of orders fetched per page when listing a market.
+            clock: The function returning the current time in seconds.
+        """
+        super().__init__()
+        self.orders = orders
+        self.user_id = user_id
+        self._tracked = _TrackedOrders(
+            interval, max_interval, age_factor, per_page, clock
+        )
+
+    def __len__(self) -> int:
+        return len(self._tracked.orders)
+
+    def __contains__(self, order_id: str) -> bool:
+        return str(order_id) in self._tracked.orders
+
+    def watch(
+        self,
+        order_id: str,
+        pair: Optional[Union[CurrencyPair, str]] = None,
+        state: Union[OrderState, str] = OrderState.WAIT,
+        age: float = 0.0,
+    ):
+        """Starts tracking an order.
+
+        Args:
+            order_id: The id of the order.
+            pair: The market of the order. When omitted, it is learnt from the first
+                refresh, which is then a `get` of the order.
+            state: The last known state of the order.
+            age: How many seconds ago the order was placed.
+        """
+        self._tracked.watch(order_id, pair, state, age)
+
+    def unwatch(self, order_id: str):
+        """Stops tracking an order."""
+        self._tracked.unwatch(order_id)
+
+    _thread_name = "pyquidax-order-tracker"
+    _failure_message = "Refreshing orders failed"
+
+    @property
+    def interval(self) -> float:
+        return self._tracked.interval
+
+    def subscribe(self, callback: OrderCallback) -> Callable[[], None]:
+        """Registers a callback called with every `OrderEvent`.
+
+        Callbacks run on the polling thread and should return quickly.
+
+        Returns:
+            A function that removes the subscription when called.
+        """
+        return self._subscribe(None, callback)
+
+    def queue(self, maxsize: int = 0) -> queue.Queue:
+        """Returns a queue that receives every `OrderEvent`.
+
+        When a bounded queue is full, its oldest event is dropped rather than blocking
+        the poller.
+        """
+        return self._queue(None, maxsize)
+
+    def poll(self) -> List[OrderEvent]:
+        """Refreshes the orders that are due and notifies the subscribers of the ones
+        that changed.
+
+        Returns:
+            The events of the orders that changed.
+        """
+        listings, gets = self._tracked.plan()
+        events = []
+        for pair, ids in listings.items():
+            try:
+                open_orders = list(
+                    self.orders.iter_all(
+                        pair,
+                        OrderState.WAIT,
+                        user_id=self.user_id,
+                        per_page=self._tracked.per_page,
+                    )
+                )
+            except Exception:
+                logger.exception("Listing orders of %s failed", pair)
+                gets.extend(ids)
+                continue
+            listed_events, missing = self._tracked.listed(pair, ids, open_orders)
+            events.extend(listed_events)
+            gets.extend(missing)
+        for order_id in gets:
+            try:
+                response = self.orders.get(order_id, self.user_id)
+            except Exception:
+                logger.exception("Refreshing order %s failed", order_id)
+                continue
+            event = self._tracked.fetched(order_id, response)
+            if event is not None:
+                events.append(event)
+        for event in events:
+            self._notify(None, event)
+        return events
+
+    def __enter__(self) -> "OrderTracker":
+        return super().__enter__()
+
+
+class AsyncOrderTracker(_AsyncPoller):
+    """An async version of `OrderTracker` which refreshes orders with
+    `AsyncOrderClient`, listing markets and fetching orders concurrently.
+
+    Usage:
+        tracker = AsyncOrderTracker(client.orders)
+        tracker.watch(order_id, CurrencyPair.BTC_NGN)
+        tracker.subscribe(on_order_event)
+        tracker.start()
+    """
+
+    def __init__(
+        self,
+        orders: AsyncOrderClient,
+        user_id: str = "me",
+        interval: float = 1.0,
+        max_interval: float = 30.0,
+        age_factor: float = 0.1,
+        per_page: int = DEFAULT_PER_PAGE,
+        concurrency: int = DEFAULT_MAX_WORKERS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            orders: The async order client used to refresh orders.
+            user_id: The User ID owning the orders.
+            interval: The shortest number of seconds between two refreshes of an order.
+            max_interval: The longest number of seconds between two refreshes.
+            age_factor: The interval of an order as a fraction of its age, between
+                `interval` and `max_interval`.
+            per_page: The number of orders fetched per page when listing a market.
+            concurrency: The maximum number of requests in flight.
+            clock: The function returning the current time in seconds.
+        """
+        super().__init__()
+        self.orders = orders
+        self.user_id = user_id
+        self.concurrency = concurrency
+        self._tracked = _TrackedOrders(
+            interval, max_interval, age_factor, per_page, clock
+        )
+
+    def __len__(self) -> int:
+        return len(self._tracked.orders)
+
+    def __contains__(self, order_id: str) -> bool:
+        return str(order_id) in self._tracked.orders
+
+    def watch(
+        self,
+        order_id: str,
+        pair: Optional[Union[CurrencyPair, str]] = None,
+        state: Union[OrderState, str] = OrderState.WAIT,
+        age: float = 0.0,
+    ):
+        """Starts tracking an order. See `OrderTracker.watch`."""
+        self._tracked.watch(order_id, pair, state, age)
+
+    def unwatch(self, order_id: str):
+        """Stops tracking an order."""
+        self._tracked.unwatch(order_id)
+
+    _failure_message = "Refreshing orders failed"
+
+    @property
+    def interval(self) -> float:
+        return self._tracked.interval
+
+    def subscribe(self, callback: AsyncOrderCallback) -> Callable[[], None]:
+        """Registers a callback, or coroutine function, called with every `OrderEvent`.
+
+        Returns:
+            A function that removes the subscription when called.
+        """
+        return self._subscribe(None, callback)
+
+    def queue(self, maxsize: int = 0) -> asyncio.Queue:
+        """Returns a queue that receives every `OrderEvent`.
+
+        When a bounded queue is full, its oldest event is dropped rather than blocking
+        the poller.
+        """
+        return self._queue(None, maxsize)
+
+    async def _list(self, pair: str) -> List[dict]:
+        return [
+            order
+            async for order in self.orders.iter_all(
+                pair,
+                OrderState.WAIT,
+                user_id=self.user_id,
+                per_page=self._tracked.per_page,
+            )
+        ]
+
+    async def poll(self) -> List[OrderEvent]:
+        """Refreshes the orders that are due and notifies the subscribers of the ones
+        that changed.
+
+        Returns:
+            The events of the orders that changed.
+        """
+        listings, gets = self._tracked.plan()
+        events = []
+        pairs = list(listings)
+        async for index, result in stream_batch(
+            [lambda pair=pair: self._list(pair) for pair in pairs],
+            concurrency=self.concurrency,
+            fatal=(),
+        ):
+            ids = listings[pairs[index]]
+            if not result.ok:
+                logger.error(
+                    "Listing orders of %s failed: %r", pairs[index], result.error
+                )
+                gets.extend(ids)
+                continue
+            listed_events, missing = self._tracked.listed(
+                pairs[index], ids, result.value
+            )
+            events.extend(listed_events)
+            gets.extend(missing)
+        async for index, result in stream_batch(
+            [
+                lambda order_id=order_id: self.orders.get(order_id, self.user_id)
+                for order_id in gets
+            ],
+            concurrency=self.concurrency,
+            fatal=(),
+        ):
+            if not result.ok:
+                logger.error(
+                    "Refreshing order %s failed: %r", gets[index], result.error
+                )
+                continue
+            event = self._tracked.fetched(gets[index], result.value)
+            if event is not None:
+                events.append(event)
+        for event in events:
+            await self._notify(None, event)
+        return events
@@ -0,0 +1,143 @@
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from pyquidax.exceptions import APIResponseException
+from pyquidax.utils import APIResponse
+
+DEFAULT_PER_PAGE = 100
+DEFAULT_MAX_PAGES = 10_000
+
+
+def _page_items(response: APIResponse) -> List[Any]:
+    if response.status_code != 200:
+        raise APIResponseException(
+            f"Fetching a page failed with status code {response.status_code}: "
+            f"{response.message}",
+            response=response,
+        )
+    return response.data if isinstance(response.data, list) else []
+
+
+def _page_count(response: APIResponse, per_page: int) -> Optional[int]:
+    # Read from metadata like `{"total_pages": 3}` or `{"total": 250}`, when present.
+    meta = response.meta
+    if not isinstance(meta, dict):
+        return None
+    try:
+        if meta.get("total_pages") is not None:
+            return int(meta["total_pages"])
+        if meta.get("total") is not None:
+            return math.ceil(int(meta["total"]) / per_page)
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def _page_ids(items: List[Any]) -> Optional[Tuple[Any, Any]]:
+    if not items or not isinstance(items[0], dict) or not isinstance(items[-1], dict):
+        return None
+    first, last = items[0].get("id"), items[-1].get("id")
+    if first is None or last is None:
+        return None
+    return first, last
+
+
+class _PageCursor:
+    """Decides which page follows each fetched one.
+
+    Iteration stops after an empty page, a page holding fewer than `per_page` items,
+    the last page announced by the pagination metadata, or `max_pages` pages. It also
+    stops without yielding a page whose first and last ids are those of the previous
+    one, as endpoints ignoring the page number return the same page forever.
+    """
+
+    def __init__(self, per_page: int, max_pages: Optional[int]):
+        self.per_page = per_page
+        self.max_pages = max_pages
+        self.page = 1
+        self._previous_ids: Optional[Tuple[Any, Any]] = None
+
+    def advance(self, response: APIResponse) -> Tuple[List[Any], bool]:
+        """Returns the items of the fetched page to yield and whether another page
+        should be fetched, moving `page` to it if so."""
+        items = _page_items(response)
+        ids = _page_ids(items)
+        if ids is not None and ids == self._previous_ids:
+            return [], False
+        self._previous_ids = ids
+        page_count = _page_count(response, self.per_page)
+        if page_count is not None:
+            more = self.page < page_count
+        else:
+            more = len(items) >= self.per_page
+        if not items or (self.max_pages is not None and self.page >= self.max_pages):
+            more = False
+        if more:
+            self.page += 1
+        return items, more
+
+
+def paginate(
+    fetch_page: Callable[[int], APIResponse],
+    per_page: int = DEFAULT_PER_PAGE,
+    max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+) -> Iterator[Any]:
+    """Yields the items of every page returned by `fetch_page`, starting at page 1.
+
+    The next page is fetched on a background thread while the current one is being
+    consumed. Iteration stops after the first page holding fewer than `per_page` items
+    or, when the response carries pagination metadata, after the last page it
+    announces. An empty page, or one repeating the first and last ids of the previous
+    page, ends iteration too.
+
+    Args:
+        fetch_page: A callable returning the `APIResponse` of a page number.
+        per_page: The number of items requested per page.
+        max_pages: The number of pages after which iteration stops regardless.
+            Unbounded if None.
+
+    Raises:
+        APIResponseException: If a page could not be fetched.
+    """
+    cursor = _PageCursor(per_page, max_pages)
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        pending = executor.submit(fetch_page, cursor.page)
+        while pending is not None:
+            items, more = cursor.advance(pending.result())
+            pending = executor.submit(fetch_page, cursor.page) if more else None
+            yield from items
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def apaginate(
+    fetch_page: Callable[[int], Awaitable[APIResponse]],
+    per_page: int = DEFAULT_PER_PAGE,
+    max_pages: Optional[int] = DEFAULT_MAX_PAGES,
+) -> AsyncIterator[Any]:
+    """An async version of `paginate`, prefetching the next page on a task."""
+    cursor = _PageCursor(per_page, max_pages)
+    pending = asyncio.ensure_future(fetch_page(cursor.page))
+    try:
+        while pending is not None:
+            items, more = cursor.advance(await pending)
+            pending = None
+            if more:
+                pending = asyncio.ensure_future(fetch_page(cursor.page))
+            for item in items:
+                yield item
+    finally:
+        if pending is not None:
+            pending.cancel()
@@ -0,0 +1,178 @@
+import asyncio
+import inspect
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _put_dropping_oldest(items: queue.Queue, item: Any):
+    # A full queue must not block the poller, and with it every other subscriber.
+    while True:
+        try:
+            items.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                items.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def _aput_dropping_oldest(items: asyncio.Queue, item: Any):
+    while True:
+        try:
+            items.put_nowait(item)
+            return
+        except asyncio.QueueFull:
+            try:
+                items.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+
+
+class _Poller:
+    """The machinery shared by the pollers, e.g. `TickerHub` and `OrderTracker`: a
+    background daemon thread calling `poll` every `interval` seconds, and subscribers
+    keyed by what they are interested in.
+
+    Subclasses implement `poll`, which notifies the subscribers with `_notify`, and set
+    `interval`.
+    """
+
+    interval: float
+    _thread_name = "pyquidax-poller"
+    _failure_message = "Polling failed"
+
+    def __init__(self):
+        self._callbacks: Dict[Hashable, List[Callable]] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _subscribe(self, key: Hashable, callback: Callable) -> Callable[[], None]:
+        with self._lock:
+            self._callbacks.setdefault(key, []).append(callback)
+
+        def unsubscribe():
+            with self._lock:
+                callbacks = self._callbacks.get(key, [])
+                if callback in callbacks:
+                    callbacks.remove(callback)
+
+        return unsubscribe
+
+    def _queue(self, key: Hashable, maxsize: int) -> queue.Queue:
+        items = queue.Queue(maxsize=maxsize)
+        self._subscribe(key, lambda *args: _put_dropping_oldest(items, args[-1]))
+        return items
+
+    def _notify(self, key: Hashable, *args: Any):
+        with self._lock:
+            callbacks = list(self._callbacks.get(key, ()))
+        for callback in callbacks:
+            try:
+                callback(*args)
+            except Exception:
+                logger.exception("Subscriber of %r failed", key)
+
+    def poll(self):
+        raise NotImplementedError
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self.poll()
+            except Exception:
+                logger.exception(self._failure_message)
+            self._stopped.wait(self.interval)
+
+    def start(self):
+        """Starts polling on a background daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=self._thread_name, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stops polling and waits for the background thread to exit."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+class _AsyncPoller:
+    """An async version of `_Poller` polling on a task of the running event loop.
+    Subscribers may be coroutine functions."""
+
+    interval: float
+    _failure_message = "Polling failed"
+
+    def __init__(self):
+        self._callbacks: Dict[Hashable, List[Callable]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def _subscribe(self, key: Hashable, callback: Callable) -> Callable[[], None]:
+        callbacks = self._callbacks.setdefault(key, [])
+        callbacks.append(callback)
+
+        def unsubscribe():
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+        return unsubscribe
+
+    def _queue(self, key: Hashable, maxsize: int) -> asyncio.Queue:
+        items = asyncio.Queue(maxsize=maxsize)
+        self._subscribe(key, lambda *args: _aput_dropping_oldest(items, args[-1]))
+        return items
+
+    async def _notify(self, key: Hashable, *args: Any):
+        for callback in list(self._callbacks.get(key, ())):
+            try:
+                result = callback(*args)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception("Subscriber of %r failed", key)
+
+    async def poll(self):
+        raise NotImplementedError
+
+    async def run(self):
+        """Polls until cancelled."""
+        while True:
+            try:
+                await self.poll()
+            except Exception:
+                logger.exception(self._failure_message)
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> asyncio.Task:
+        """Starts polling on a task of the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self.run())
+        return self._task
+
+    async def stop(self):
+        """Cancels the polling task and waits for it to finish."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -1,6 +1,32 @@
-from typing import Optional
+import asyncio
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+import httpx
 
-from pyquidax.base import BaseAPIWrapper, BaseAsyncAPIWrapper
+from pyquidax.base import BaseAPIWrapper, BaseAsyncAPIWrapper, _replace_inherited
+from pyquidax.batch import (
+    DEFAULT_FATAL_ERRORS,
+    DEFAULT_MAX_WORKERS,
+    BatchResult,
+    run_batch,
+    stream_batch,
+)
+from pyquidax.cache import QuoteCache
+from pyquidax.registry import MarketRegistry
 from pyquidax.utils import (
     Currency,
     HTTPMethod,
@@ -19,16 +45,91 @@ from pyquidax.clients.wallets import WalletClient, AsyncWalletClient
 from pyquidax.clients.withdrawals import WithdrawalClient, AsyncWithdrawalClient
 
 
+@dataclass(frozen=True)
+class ClientConfig:
+    """A picklable dataclass describing a `QuidaxClient` or `AsyncQuidaxClient`, so
+    workers of a process pool can create their own instead of inheriting one.
+
+    Connections, thread pools and the quote cache are specific to a process and are
+    not part of it.
+
+    Usage:
+        config = client.config
+        with ProcessPoolExecutor(initializer=init_worker, initargs=(config,)) as pool:
+            ...
+
+        def init_worker(config):
+            global client
+            client = config.create_client()
+    """
+
+    secret_key: Optional[str] = None
+    max_workers: int = DEFAULT_MAX_WORKERS
+    max_concurrency: int = DEFAULT_MAX_WORKERS
+    market_registry: Optional[MarketRegistry] = None
+
+    def create_client(self) -> "QuidaxClient":
+        return QuidaxClient(
+            self.secret_key,
+            max_workers=self.max_workers,
+            market_registry=self.market_registry,
+        )
+
+    def create_async_client(self) -> "AsyncQuidaxClient":
+        return AsyncQuidaxClient(
+            self.secret_key,
+            max_concurrency=self.max_concurrency,
+            market_registry=self.market_registry,
+        )
+
+
 class QuidaxClient(BaseAPIWrapper):
     """This is a synchronous client for interacting with endpoints provided by Quidax.
 
     It provides attribute bindings and methods that represent every endpoint provided by Quidax.
     E.g. `QuidaxClient.accounts` is a binding to the `Account` client which provides methods for endpoints
     related to accounts on the Quidax platform. It also has methods like `validate_address`
+
+    Every binding shares the connection pool of the client, and `batch` and `map` run
+    many calls concurrently on a thread pool. Call `close` or use the client as a
+    context manager to release both.
+
+    A client created before a `fork` opens new connections and threads in the child
+    process on first use. Pickling a client pickles its `config`.
     """
 
-    def __init__(self, secret_key: Optional[str] = None):
-        super().__init__(secret_key)
+    def __init__(
+        self,
+        secret_key: Optional[str] = None,
+        quote_cache: Optional[QuoteCache] = None,
+        http_client: Optional[httpx.Client] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        market_registry: Optional[MarketRegistry] = None,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ):
+        """
+        Args:
+            secret_key: Your Quidax secret key.
+            quote_cache: An optional `QuoteCache` used to serve recent `quotes` responses
+                without a round trip.
+            http_client: An optional `httpx.Client` whose connection pool is used to
+                send requests. When omitted, one is created on the first request of
+                the client or of any of its bindings. To use the client after a `fork`,
+                register how to recreate it with `register_fork_factory`.
+            max_workers: The number of threads `batch` and `map` run calls on.
+            market_registry: An optional `MarketRegistry` the `orders` and
+                `instant_orders` bindings validate and round orders with before sending
+                them.
+            executor: An optional thread pool `batch` and `map` run calls on, e.g. to
+                share one between several clients. It is not shut down by `close`.
+                One of `max_workers` threads is created when omitted.
+        """
+        super().__init__(secret_key, http_client)
+        self.quote_cache = quote_cache
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = executor
+        self._owns_executor = executor is None
+        self._executor_lock = threading.Lock()
         self.accounts = AccountClient(secret_key)
         self.beneficiaries = BeneficiaryClient(secret_key)
         self.deposits = DepositClient(secret_key)
@@ -38,6 +139,101 @@ class QuidaxClient(BaseAPIWrapper):
         self.trades = TradeClient(secret_key)
         self.wallets = WalletClient(secret_key)
         self.withdrawals = WithdrawalClient(secret_key)
+        self._share_http_client()
+        self.orders.registry = self.instant_orders.registry = market_registry
+
+    def _share_http_client(self):
+        # Every binding uses the http client of this client, which is only created on
+        # the first request of any of them.
+        for binding in (
+            self.accounts,
+            self.beneficiaries,
+            self.deposits,
+            self.instant_orders,
+            self.markets,
+            self.orders,
+            self.trades,
+            self.wallets,
+            self.withdrawals,
+        ):
+            binding._http_client_owner = self
+
+    def batch(self, calls: Iterable[Callable[[], Any]]) -> List[BatchResult]:
+        """Runs many client calls concurrently and waits for all of them.
+
+        Usage:
+            results = client.batch(
+                [lambda: client.orders.get(order_id) for order_id in order_ids]
+            )
+
+        Args:
+            calls: Callables taking no arguments, e.g. lambdas or `functools.partial`
+                objects wrapping client methods.
+
+        Returns:
+            A `BatchResult` per call, in the order of `calls`. A call raising an
+            exception is reported in its `BatchResult.error` without affecting the
+            others.
+        """
+        return run_batch(self._get_executor(), calls)
+
+    def map(
+        self, function: Callable[..., Any], *iterables: Iterable
+    ) -> List[BatchResult]:
+        """Calls `function` concurrently with arguments taken from each of `iterables`,
+        like the builtin `map`.
+
+        Usage:
+            results = client.map(client.orders.get, order_ids)
+
+        Returns:
+            A `BatchResult` per call, in the order of the arguments.
+        """
+        return self.batch(
+            [lambda args=args: function(*args) for args in zip(*iterables)]
+        )
+
+    def _create_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="pyquidax-batch"
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        self._check_fork()
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = self._create_executor()
+        return self._executor
+
+    def _after_fork(self):
+        super()._after_fork()
+        self._executor_lock = threading.Lock()
+        # The threads of the inherited pool do not run in this process.
+        if self._executor is not None:
+            self._executor = _replace_inherited(self._executor, self._create_executor)
+
+    @property
+    def config(self) -> "ClientConfig":
+        """A picklable `ClientConfig` to create this client again, e.g. in a worker
+        process."""
+        return ClientConfig(
+            secret_key=self._token,
+            max_workers=self.max_workers,
+            market_registry=self.orders.registry,
+        )
+
+    def __reduce__(self):
+        return ClientConfig.create_client, (self.config,)
+
+    def close(self):
+        """Shuts down the thread pool of `batch` and closes the connections of the
+        http client, if this client created them."""
+        self._check_fork()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        super().close()
 
     def validate_address(self, currency: Currency, address: str):
         """Validates a wallet address.
@@ -62,6 +258,9 @@ class QuidaxClient(BaseAPIWrapper):
     def quotes(self, market: CurrencyPair, unit: Currency, kind: Kind, volume: int):
         """Retrieves the last current price of an asset.
 
+        If the client was created with a `quote_cache`, a recent quote for the same
+        market, unit, kind and volume band is returned without sending a request.
+
         Args:
             market: An asset pair of We're interested in retrieving its quote.
             unit: The unit currency of the currency pair.
@@ -76,6 +275,10 @@ class QuidaxClient(BaseAPIWrapper):
             `APIResponse.data` (dict | None) is the data returned by Quidax as a result of the
             request sent.
         """
+        if self.quote_cache is not None:
+            cached_response = self.quote_cache.get(market, unit, kind, volume)
+            if cached_response is not None:
+                return cached_response
         query_params = (
             ("market", market),
             ("unit", unit),
@@ -86,10 +289,13 @@ class QuidaxClient(BaseAPIWrapper):
             f"{self.base_url}/quotes",
             query_params,
         )
-        return self._api_call(
+        response = self._api_call(
             url=url,
             method=HTTPMethod.GET,
         )
+        if self.quote_cache is not None:
+            self.quote_cache.set(market, unit, kind, volume, response)
+        return response
 
     def withdrawal_fee(self, currency: Currency):
         """Retrieve the withdrawal fee for a specific currency.
@@ -116,10 +322,31 @@ class AsyncQuidaxClient(BaseAsyncAPIWrapper):
     It provides attribute bindings and methods that represent every endpoint provided by Quidax.
     E.g. `AsyncQuidaxClient.accounts` is a binding to the `Account` client which provides methods for endpoints
     related to accounts on the Quidax platform. It also has methods like `validate_address`
+
+    `as_completed`, `batch` and `map` fan out many calls with bounded concurrency.
     """
 
-    def __init__(self, secret_key: Optional[str] = None):
+    def __init__(
+        self,
+        secret_key: Optional[str] = None,
+        quote_cache: Optional[QuoteCache] = None,
+        max_concurrency: int = DEFAULT_MAX_WORKERS,
+        market_registry: Optional[MarketRegistry] = None,
+    ):
+        """
+        Args:
+            secret_key: Your Quidax secret key.
+            quote_cache: An optional `QuoteCache` used to serve recent `quotes` responses
+                without a round trip.
+            max_concurrency: The default number of calls `as_completed`, `batch` and
+                `map` keep in flight.
+            market_registry: An optional `MarketRegistry` the `orders` and
+                `instant_orders` bindings validate and round orders with before sending
+                them.
+        """
         super().__init__(secret_key)
+        self.quote_cache = quote_cache
+        self.max_concurrency = max_concurrency
         self.accounts = AsyncAccountClient(secret_key)
         self.beneficiaries = AsyncBeneficiaryClient(secret_key)
         self.deposits = AsyncDepositClient(secret_key)
@@ -129,6 +356,123 @@ class AsyncQuidaxClient(BaseAsyncAPIWrapper):
         self.trades = AsyncTradeClient(secret_key)
         self.wallets = AsyncWalletClient(secret_key)
         self.withdrawals = AsyncWithdrawalClient(secret_key)
+        self._share_http_clients(self._http_clients, self._create_http_client)
+        self.orders.registry = self.instant_orders.registry = market_registry
+
+    @property
+    def config(self) -> ClientConfig:
+        """A picklable `ClientConfig` to create this client again, e.g. in a worker
+        process."""
+        return ClientConfig(
+            secret_key=self._token,
+            max_concurrency=self.max_concurrency,
+            market_registry=self.orders.registry,
+        )
+
+    def __reduce__(self):
+        return ClientConfig.create_async_client, (self.config,)
+
+    def _share_http_clients(
+        self,
+        http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]",
+        create_http_client: Callable[[], httpx.AsyncClient],
+    ):
+        # Every binding shares the connection pools opened per event loop, whichever
+        # of them opens the pool of a loop first.
+        for client in (
+            self,
+            self.accounts,
+            self.beneficiaries,
+            self.deposits,
+            self.instant_orders,
+            self.markets,
+            self.orders,
+            self.trades,
+            self.wallets,
+            self.withdrawals,
+        ):
+            client._http_clients = http_clients
+            client._create_http_client = create_http_client
+
+    def as_completed(
+        self,
+        calls: Iterable[Callable[[], Awaitable[Any]]],
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        fatal: Tuple[Type[BaseException], ...] = DEFAULT_FATAL_ERRORS,
+    ) -> AsyncIterator[Tuple[int, BatchResult]]:
+        """Runs many client calls with bounded concurrency and yields their results as
+        they complete.
+
+        Usage:
+            calls = (lambda id=id: client.orders.get(id) for id in order_ids)
+            async for index, result in client.as_completed(calls, timeout=5):
+                ...
+
+        Args:
+            calls: Callables taking no arguments and returning an awaitable, e.g.
+                lambdas or `functools.partial` objects wrapping client methods. They are
+                only called once a slot is free.
+            concurrency: The maximum number of calls in flight. Defaults to
+                `max_concurrency`.
+            timeout: The number of seconds after which a call is cancelled and reported
+                with an `asyncio.TimeoutError`.
+            fatal: The exceptions that cancel the calls in flight, skip the remaining
+                ones and are raised. Other exceptions are reported per call.
+
+        Returns:
+            An async iterator over `(index, BatchResult)` tuples, `index` being the
+            position of the call in `calls`.
+        """
+        return stream_batch(
+            calls,
+            concurrency=concurrency or self.max_concurrency,
+            timeout=timeout,
+            fatal=fatal,
+        )
+
+    async def batch(
+        self,
+        calls: Iterable[Callable[[], Awaitable[Any]]],
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        fatal: Tuple[Type[BaseException], ...] = DEFAULT_FATAL_ERRORS,
+    ) -> List[BatchResult]:
+        """Runs many client calls like `as_completed` and waits for all of them.
+
+        Returns:
+            A `BatchResult` per call, in the order of `calls`.
+        """
+        results = {}
+        async for index, result in self.as_completed(
+            calls, concurrency=concurrency, timeout=timeout, fatal=fatal
+        ):
+            results[index] = result
+        return [results[index] for index in range(len(results))]
+
+    async def map(
+        self,
+        function: Callable[..., Awaitable[Any]],
+        *iterables: Iterable,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        fatal: Tuple[Type[BaseException], ...] = DEFAULT_FATAL_ERRORS,
+    ) -> List[BatchResult]:
+        """Calls `function` with arguments taken from each of `iterables`, like the
+        builtin `map`, and waits for all of the calls. See `as_completed`.
+
+        Usage:
+            results = await client.map(client.orders.get, order_ids, concurrency=5)
+
+        Returns:
+            A `BatchResult` per call, in the order of the arguments.
+        """
+        return await self.batch(
+            (lambda args=args: function(*args) for args in zip(*iterables)),
+            concurrency=concurrency,
+            timeout=timeout,
+            fatal=fatal,
+        )
 
     async def validate_address(self, currency: Currency, address: str):
         """Validates a wallet address.
@@ -155,6 +499,9 @@ class AsyncQuidaxClient(BaseAsyncAPIWrapper):
     ):
         """Retrieves the last current price of an asset.
 
+        If the client was created with a `quote_cache`, a recent quote for the same
+        market, unit, kind and volume band is returned without sending a request.
+
         Args:
             market: An asset pair of We're interested in retrieving its quote.
             unit: The unit currency of the currency pair.
@@ -169,6 +516,10 @@ class AsyncQuidaxClient(BaseAsyncAPIWrapper):
             `APIResponse.data` (dict | None) is the data returned by Quidax as a result of the
             request sent.
         """
+        if self.quote_cache is not None:
+            cached_response = self.quote_cache.get(market, unit, kind, volume)
+            if cached_response is not None:
+                return cached_response
         query_params = (
             ("market", market),
             ("unit", unit),
@@ -179,10 +530,13 @@ class AsyncQuidaxClient(BaseAsyncAPIWrapper):
             f"{self.base_url}/quotes",
             query_params,
         )
-        return await self._api_call(
+        response = await self._api_call(
             url=url,
             method=HTTPMethod.GET,
         )
+        if self.quote_cache is not None:
+            self.quote_cache.set(market, unit, kind, volume, response)
+        return response
 
     async def withdrawal_fee(self, currency: Currency):
         """Retrieve the withdrawal fee for a specific currency.
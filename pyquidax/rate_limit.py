@@ -0,0 +1,63 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Optional
+
+
+class RateLimiter:
+    """A token bucket allowing `rate` requests every `period` seconds, with bursts of
+    up to `burst` requests.
+
+    It is thread safe and can be shared between threads and event loops, e.g. to keep
+    every order placed by a process under the limits of the API.
+
+    Usage:
+        limiter = RateLimiter(rate=10, period=1)
+        limiter.acquire()  # or `await limiter.aacquire()`
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        period: float = 1.0,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            rate: The number of requests allowed every `period`.
+            period: The length of the period in seconds.
+            burst: The number of requests that can be sent at once. Defaults to `rate`.
+            clock: The function returning the current time in seconds.
+        """
+        if rate <= 0 or period <= 0:
+            raise ValueError("`rate` and `period` must be greater than `0`")
+        self.interval = period / rate
+        self.burst = burst if burst is not None else max(int(rate), 1)
+        self._clock = clock
+        self._tokens = float(self.burst)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes a token and returns how many seconds to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) / self.interval
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            return max(-self._tokens * self.interval, 0.0)
+
+    def acquire(self):
+        """Blocks until a request can be sent."""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def aacquire(self):
+        """Waits until a request can be sent without blocking the event loop."""
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
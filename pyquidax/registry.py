@@ -0,0 +1,546 @@
+import json
+import os
+import time
+from dataclasses import dataclass
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal, InvalidOperation
+from enum import Enum
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple, Type, TypeVar, Union
+
+from pyquidax.clients.markets import AsyncMarketClient, MarketClient
+from pyquidax.exceptions import APIResponseException, InvalidOrderException
+from pyquidax.fixed import Fixed
+from pyquidax.utils import APIResponse, Currency, CurrencyPair, OrderType
+
+Number = Union[int, float, Decimal, str, Fixed]
+
+DEFAULT_CACHE_MAX_AGE = 24 * 60 * 60
+
+# The names Quidax may use for each trading rule, looked up in the market and in its
+# nested `filters` and `trading_rules` objects.
+_RULE_ALIASES = {
+    "tick_size": ("tick_size", "price_step", "price_tick"),
+    "min_volume": ("min_volume", "min_amount", "base_min_amount", "min_order_size"),
+    "price_precision": ("price_precision", "quote_precision", "quote_unit_precision"),
+    "volume_precision": (
+        "volume_precision",
+        "amount_precision",
+        "base_precision",
+        "base_unit_precision",
+    ),
+}
+
+
+def _value(value: Union[Enum, str]) -> str:
+    return value.value if isinstance(value, Enum) else value
+
+
+def _decimal(value: Number) -> Optional[Decimal]:
+    if isinstance(value, dict):
+        value = value.get("amount")
+    if value is None or value == "" or isinstance(value, bool):
+        return None
+    try:
+        value = Decimal(str(value))
+    except InvalidOperation:
+        return None
+    return value if value.is_finite() else None
+
+
+def _like(original: Number, rounded: Decimal) -> Number:
+    # Amounts are sent back the way they were given, so the request body is unchanged
+    # when no rounding was needed.
+    if _decimal(original) == rounded:
+        return original
+    if isinstance(original, Fixed):
+        return Fixed.from_decimal(
+            rounded, max(original.places, -rounded.as_tuple().exponent)
+        )
+    if isinstance(original, (str, Decimal)):
+        return type(original)(str(rounded))
+    return float(rounded)
+
+
+def _rules(market: dict) -> dict:
+    sources = [market] + [
+        market[key]
+        for key in ("filters", "trading_rules")
+        if isinstance(market.get(key), dict)
+    ]
+    rules = {}
+    for name, aliases in _RULE_ALIASES.items():
+        for source in sources:
+            found = next((source[alias] for alias in aliases if alias in source), None)
+            if found is not None:
+                rules[name] = found
+                break
+    return rules
+
+
+class Symbol(str):
+    """A currency or market code interned by a `MarketRegistry`.
+
+    It is a `str` equal to the value of the matching enum member, so it can be passed
+    wherever a `Currency` or `CurrencyPair` is expected. `id` is its index in the
+    registry, which makes it usable to index arrays of per-currency or per-market data.
+    """
+
+    enum_type: Optional[Type[Enum]] = None
+
+    def __new__(cls, value: str, id: int, *args):
+        symbol = super().__new__(cls, value)
+        symbol.id = id
+        return symbol
+
+    def __getnewargs__(self):
+        return str(self), self.id
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r}, id={self.id})"
+
+    @property
+    def enum(self) -> Optional[Enum]:
+        """The matching enum member, or `None` if the code is not in the enum yet."""
+        try:
+            return self.enum_type(str(self))
+        except ValueError:
+            return None
+
+
+class CurrencySymbol(Symbol):
+    enum_type = Currency
+
+
+class PairSymbol(Symbol):
+    """A market code interned by a `MarketRegistry`, along with its base and quote
+    currencies when the registry knows them."""
+
+    enum_type = CurrencyPair
+
+    def __new__(
+        cls,
+        value: str,
+        id: int,
+        base: Optional[CurrencySymbol] = None,
+        quote: Optional[CurrencySymbol] = None,
+    ):
+        pair = super().__new__(cls, value, id)
+        pair.base = base
+        pair.quote = quote
+        return pair
+
+    def __getnewargs__(self):
+        return str(self), self.id, self.base, self.quote
+
+
+S = TypeVar("S", bound=Symbol)
+
+
+def _read_cache(path: Optional[str], max_age: Optional[float]) -> Optional[list]:
+    if path is None:
+        return None
+    try:
+        with open(path) as file:
+            cached = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or not isinstance(cached.get("markets"), list):
+        return None
+    if max_age is not None and time.time() - cached.get("fetched_at", 0) > max_age:
+        return None
+    return cached["markets"]
+
+
+def _write_cache(path: Optional[str], markets: list):
+    if path is None:
+        return
+    # Written to a temporary file first, so readers never see a partial cache.
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_path, "w") as file:
+            json.dump({"fetched_at": time.time(), "markets": markets}, file)
+        os.replace(temporary_path, path)
+    except OSError:
+        # The cache only saves requests, so an unwritable path must not fail loading.
+        try:
+            os.remove(temporary_path)
+        except OSError:
+            pass
+
+
+@dataclass(frozen=True)
+class MarketInfo:
+    """A dataclass holding the trading rules of a market.
+
+    Rules set to `None` are not enforced. `price_precision` and `volume_precision` are
+    numbers of decimal places, and `price_precision` is also used for amounts in the
+    quote currency.
+    """
+
+    id: str
+    base_unit: str
+    quote_unit: str
+    tick_size: Optional[Decimal] = None
+    min_volume: Optional[Decimal] = None
+    price_precision: Optional[int] = None
+    volume_precision: Optional[int] = None
+
+    @classmethod
+    def from_market(cls, market: dict) -> "MarketInfo":
+        """Builds a `MarketInfo` from a market returned by `MarketClient.all`."""
+        rules = _rules(market)
+        # Precisions may be sent as strings like "8.0", which `int` rejects.
+        precisions = {}
+        for name in ("price_precision", "volume_precision"):
+            precision = _decimal(rules.get(name))
+            if precision is not None:
+                precisions[name] = int(precision)
+        return cls(
+            id=market["id"],
+            base_unit=market.get("base_unit") or "",
+            quote_unit=market.get("quote_unit") or "",
+            tick_size=_decimal(rules.get("tick_size")) or None,
+            min_volume=_decimal(rules.get("min_volume")),
+            **precisions,
+        )
+
+    @property
+    def price_step(self) -> Optional[Decimal]:
+        if self.tick_size is not None:
+            return self.tick_size
+        return self.quote_step
+
+    @property
+    def quote_step(self) -> Optional[Decimal]:
+        if self.price_precision is not None:
+            return Decimal(1).scaleb(-self.price_precision)
+        return None
+
+    @property
+    def volume_step(self) -> Optional[Decimal]:
+        if self.volume_precision is not None:
+            return Decimal(1).scaleb(-self.volume_precision)
+        return None
+
+    @property
+    def price_places(self) -> Optional[int]:
+        """The number of decimal places of the prices of the market, if known."""
+        step = self.price_step
+        return None if step is None else max(0, -step.normalize().as_tuple().exponent)
+
+    @property
+    def volume_places(self) -> Optional[int]:
+        """The number of decimal places of the volumes of the market, if known."""
+        return self.volume_precision
+
+    def parse_price(self, value: Union[Number, dict]) -> Fixed:
+        """Converts a price, e.g. one returned by Quidax, to a `Fixed` with the places of
+        the market."""
+        return Fixed.parse(value, self.price_places)
+
+    def parse_volume(self, value: Union[Number, dict]) -> Fixed:
+        """Converts a volume, e.g. one returned by Quidax, to a `Fixed` with the places
+        of the market."""
+        return Fixed.parse(value, self.volume_places)
+
+    @staticmethod
+    def _round(value: Decimal, step: Optional[Decimal], rounding: str) -> Decimal:
+        if step is None:
+            return value
+        return (value / step).to_integral_value(rounding=rounding) * step
+
+    def round_price(self, price: Decimal, type: OrderType) -> Decimal:
+        """Rounds a price to the tick size, never to a worse price: buy prices are
+        rounded down and sell prices up."""
+        rounding = ROUND_FLOOR if _value(type) == OrderType.BUY.value else ROUND_CEILING
+        return self._round(price, self.price_step, rounding)
+
+    def round_volume(self, volume: Decimal) -> Decimal:
+        """Rounds a volume down to the volume precision."""
+        return self._round(volume, self.volume_step, ROUND_FLOOR)
+
+    def errors(self, price: Optional[Decimal], volume: Decimal) -> List[str]:
+        """Returns the rules a rounded price and volume break, if any."""
+        errors = []
+        if volume <= 0:
+            errors.append(
+                f"volume must be greater than 0 after rounding to {self.volume_step}"
+            )
+        elif self.min_volume is not None and volume < self.min_volume:
+            errors.append(f"volume {volume} is below the minimum of {self.min_volume}")
+        if price is not None and price <= 0:
+            errors.append(
+                f"price must be greater than 0 after rounding to {self.price_step}"
+            )
+        return errors
+
+
+class MarketRegistry:
+    """The markets and currencies listed by Quidax, loaded at runtime.
+
+    It interns every currency and market code as a `CurrencySymbol` or `PairSymbol`
+    with an integer `id`, so new markets can be used before the `Currency` and
+    `CurrencyPair` enums list them. It also holds the trading rules of the markets,
+    used to validate and round orders before they are sent, so orders Quidax would
+    reject never cost a round trip.
+
+    Load it once from `MarketClient.all`, optionally cached on disk, and pass it to
+    `QuidaxClient`, or set it as the `registry` of an `OrderClient` or
+    `InstantOrderClient`.
+
+    Usage:
+        registry = MarketRegistry.load(client.markets, cache_path="markets.json")
+        client = QuidaxClient(secret_key, market_registry=registry)
+        prices = [0.0] * len(registry.pairs)
+        prices[registry.pair(CurrencyPair.BTC_NGN).id] = 20_000_000
+    """
+
+    def __init__(self, markets: Iterable[MarketInfo] = ()):
+        self._markets: Dict[str, MarketInfo] = {}
+        self._by_units: Dict[Tuple[str, str], MarketInfo] = {}
+        self._currencies: Dict[str, CurrencySymbol] = {}
+        self._pairs: Dict[str, PairSymbol] = {}
+        self._currency_list: List[CurrencySymbol] = []
+        self._pair_list: List[PairSymbol] = []
+        self._lock = Lock()
+        for market in markets:
+            self.add(market)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    @classmethod
+    def from_markets(cls, markets: Iterable[dict]) -> "MarketRegistry":
+        """Builds a registry from the markets returned by `MarketClient.all`."""
+        return cls(MarketInfo.from_market(market) for market in markets)
+
+    @classmethod
+    def from_response(cls, response: APIResponse) -> "MarketRegistry":
+        """Builds a registry from the response of `MarketClient.all`.
+
+        Raises:
+            APIResponseException: If the markets could not be fetched.
+        """
+        return cls.from_markets(cls._markets_of(response))
+
+    @staticmethod
+    def _markets_of(response: APIResponse) -> list:
+        if not 200 <= response.status_code < 300 or not isinstance(response.data, list):
+            raise APIResponseException(
+                f"Fetching the markets failed with status code {response.status_code}: "
+                f"{response.message}",
+                response=response,
+            )
+        return response.data
+
+    @classmethod
+    def _from_fetched(
+        cls, response: APIResponse, cache_path: Optional[str]
+    ) -> "MarketRegistry":
+        try:
+            markets = cls._markets_of(response)
+        except APIResponseException:
+            # A stale cache is better than no registry at all.
+            markets = _read_cache(cache_path, max_age=None)
+            if markets is None:
+                raise
+        else:
+            _write_cache(cache_path, markets)
+        return cls.from_markets(markets)
+
+    @classmethod
+    def load(
+        cls,
+        markets: MarketClient,
+        cache_path: Optional[str] = None,
+        max_age: float = DEFAULT_CACHE_MAX_AGE,
+    ) -> "MarketRegistry":
+        """Builds a registry of the markets listed by `markets.all`.
+
+        Args:
+            markets: The market client used to fetch the markets.
+            cache_path: An optional JSON file the markets are cached in. They are only
+                fetched when it is missing or older than `max_age`, and it is used
+                regardless of its age if fetching them fails.
+            max_age: The number of seconds the cache is used for.
+
+        Raises:
+            APIResponseException: If the markets could not be fetched nor read from
+                the cache.
+        """
+        cached = _read_cache(cache_path, max_age)
+        if cached is not None:
+            return cls.from_markets(cached)
+        return cls._from_fetched(markets.all(), cache_path)
+
+    @classmethod
+    async def aload(
+        cls,
+        markets: AsyncMarketClient,
+        cache_path: Optional[str] = None,
+        max_age: float = DEFAULT_CACHE_MAX_AGE,
+    ) -> "MarketRegistry":
+        """An async version of `load`."""
+        cached = _read_cache(cache_path, max_age)
+        if cached is not None:
+            return cls.from_markets(cached)
+        return cls._from_fetched(await markets.all(), cache_path)
+
+    def _intern(
+        self,
+        symbols: Dict[str, S],
+        symbol_list: List[S],
+        symbol_type: Type[S],
+        value: Union[Enum, str],
+        *args,
+    ) -> S:
+        value = _value(value)
+        symbol = symbols.get(value)
+        if symbol is None:
+            with self._lock:
+                symbol = symbols.get(value)
+                if symbol is None:
+                    symbol = symbol_type(value, len(symbol_list), *args)
+                    symbol_list.append(symbol)
+                    symbols[value] = symbol
+        return symbol
+
+    def currency(self, currency: Union[Currency, str]) -> CurrencySymbol:
+        """Returns the interned symbol of a currency, interning it on first use."""
+        return self._intern(
+            self._currencies, self._currency_list, CurrencySymbol, currency
+        )
+
+    def pair(self, pair: Union[CurrencyPair, str]) -> PairSymbol:
+        """Returns the interned symbol of a market, interning it on first use.
+
+        Markets missing from the registry get a symbol without base and quote
+        currencies.
+        """
+        return self._intern(self._pairs, self._pair_list, PairSymbol, pair)
+
+    @property
+    def currencies(self) -> Tuple[CurrencySymbol, ...]:
+        """Every interned currency, indexed by its `id`."""
+        return tuple(self._currency_list)
+
+    @property
+    def pairs(self) -> Tuple[PairSymbol, ...]:
+        """Every interned market, indexed by its `id`."""
+        return tuple(self._pair_list)
+
+    def add(self, market: MarketInfo):
+        """Adds or replaces the rules of a market, interning its symbols."""
+        base = self.currency(market.base_unit) if market.base_unit else None
+        quote = self.currency(market.quote_unit) if market.quote_unit else None
+        pair = self.pair(market.id)
+        pair.base, pair.quote = base, quote
+        self._markets[market.id] = market
+        self._by_units[(market.base_unit, market.quote_unit)] = market
+
+    def get(self, pair: Union[CurrencyPair, str]) -> Optional[MarketInfo]:
+        return self._markets.get(_value(pair))
+
+    def __contains__(self, pair: Union[CurrencyPair, str]) -> bool:
+        return _value(pair) in self._markets
+
+    def __len__(self) -> int:
+        return len(self._markets)
+
+    def order_errors(
+        self,
+        pair: Union[CurrencyPair, str],
+        type: OrderType,
+        price: Optional[Number],
+        volume: Number,
+        ord_type: str = "limit",
+    ) -> List[str]:
+        """Returns what is wrong with an order once rounded, if anything. Markets missing
+        from the registry are not checked."""
+        try:
+            self.prepare_order(pair, type, price, volume, ord_type)
+        except InvalidOrderException as exception:
+            return exception.errors.get(0, [])
+        return []
+
+    def prepare_order(
+        self,
+        pair: Union[CurrencyPair, str],
+        type: OrderType,
+        price: Optional[Number],
+        volume: Number,
+        ord_type: str = "limit",
+    ) -> Tuple[Optional[Number], Number]:
+        """Rounds the price and volume of an order to the rules of its market.
+
+        Returns:
+            The rounded `(price, volume)`. They are returned unchanged for markets
+            missing from the registry.
+
+        Raises:
+            InvalidOrderException: If the rounded order breaks the rules of its market.
+        """
+        market = self.get(pair)
+        if market is None:
+            return price, volume
+        decimal_volume = _decimal(volume)
+        decimal_price = _decimal(price) if ord_type != "market" else None
+        errors = []
+        if decimal_volume is None:
+            errors.append(f"invalid volume {volume!r}")
+        if ord_type != "market" and decimal_price is None:
+            errors.append(f"invalid price {price!r}")
+        if not errors:
+            decimal_volume = market.round_volume(decimal_volume)
+            if decimal_price is not None:
+                decimal_price = market.round_price(decimal_price, type)
+            errors = market.errors(decimal_price, decimal_volume)
+        if errors:
+            raise InvalidOrderException(
+                f"Invalid order on {market.id}: {', '.join(errors)}", errors={0: errors}
+            )
+        if decimal_price is not None:
+            price = _like(price, decimal_price)
+        return price, _like(volume, decimal_volume)
+
+    def prepare_instant_order(
+        self, bid: Currency, ask: Currency, volume: Number, unit: Union[Currency, str]
+    ) -> Number:
+        """Rounds the volume of an instant order down to the precision of its unit.
+
+        The minimum volume of the market is enforced when the unit is its base currency.
+
+        Returns:
+            The rounded volume. It is returned unchanged for markets missing from the
+            registry or units that are not one of their currencies.
+
+        Raises:
+            InvalidOrderException: If the rounded volume breaks the rules of the market.
+        """
+        bid, ask, unit = _value(bid), _value(ask), _value(unit)
+        market = self._by_units.get((ask, bid)) or self._by_units.get((bid, ask))
+        decimal_volume = _decimal(volume)
+        if market is None or decimal_volume is None:
+            return volume
+        if unit == market.base_unit:
+            rounded = market.round_volume(decimal_volume)
+            errors = market.errors(None, rounded)
+        elif unit == market.quote_unit:
+            rounded = market._round(decimal_volume, market.quote_step, ROUND_FLOOR)
+            errors = (
+                [] if rounded > 0 else ["volume must be greater than 0 after rounding"]
+            )
+        else:
+            return volume
+        if errors:
+            raise InvalidOrderException(
+                f"Invalid instant order on {market.id}: {', '.join(errors)}",
+                errors={0: errors},
+            )
+        return _like(volume, rounded)
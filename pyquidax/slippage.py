@@ -0,0 +1,274 @@
+import math
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Optional, Sequence, Union
+
+from pyquidax.order_book import OrderBookSnapshot
+from pyquidax.registry import MarketRegistry, PairSymbol
+from pyquidax.utils import APIResponse, Currency, CurrencyPair, Kind, parse_amount
+
+try:
+    import numpy
+except ImportError:  # Installed with the `numpy` extra.
+    numpy = None
+
+if TYPE_CHECKING:
+    from pyquidax.quidax import QuidaxClient
+
+# Below this many volumes, converting to and from NumPy costs more than it saves.
+_NUMPY_MIN_SIZE = 64
+
+
+@dataclass
+class FillEstimate:
+    """A dataclass representing the estimated execution of a market order against an
+    order book snapshot.
+
+    `filled` is lower than `volume` when the snapshot is not deep enough, in which case
+    the prices only describe the part of the order that could be filled.
+    """
+
+    volume: float
+    filled: float
+    vwap: float
+    worst_price: float
+    total: float
+    slippage: float
+
+
+@dataclass
+class QuoteVerification:
+    """A dataclass pairing a local estimate with the price quoted by `QuidaxClient.quotes`.
+
+    `deviation` is the relative difference between the estimated VWAP and the quoted price.
+    """
+
+    estimate: FillEstimate
+    quoted_price: float
+    deviation: float
+
+
+class _BookSide:
+    def __init__(self, levels: Sequence[tuple]):
+        self.prices = [price for price, _ in levels]
+        self.cumulative_volume = []
+        self.cumulative_total = []
+        volume = total = 0.0
+        for price, level_volume in levels:
+            volume += level_volume
+            total += price * level_volume
+            self.cumulative_volume.append(volume)
+            self.cumulative_total.append(total)
+
+    def fill(self, amount: float, in_total: bool) -> tuple:
+        """Returns `(filled volume, total, worst price)` for `amount` of base currency,
+        or of quote currency when `in_total` is true."""
+        cumulative = self.cumulative_total if in_total else self.cumulative_volume
+        if not cumulative or amount <= 0:
+            return 0.0, 0.0, math.nan
+        index = bisect_left(cumulative, amount)
+        if index == len(cumulative):
+            return (
+                self.cumulative_volume[-1],
+                self.cumulative_total[-1],
+                self.prices[-1],
+            )
+        price = self.prices[index]
+        volume_before = self.cumulative_volume[index - 1] if index else 0.0
+        total_before = self.cumulative_total[index - 1] if index else 0.0
+        if in_total:
+            volume = volume_before + (amount - total_before) / price
+            return volume, amount, price
+        return amount, total_before + (amount - volume_before) * price, price
+
+    @cached_property
+    def _arrays(self) -> tuple:
+        # Prefixed with a zero, so that index `i` holds the sums before level `i`.
+        return (
+            numpy.asarray(self.prices, dtype=float),
+            numpy.concatenate(([0.0], self.cumulative_volume)),
+            numpy.concatenate(([0.0], self.cumulative_total)),
+        )
+
+    def fill_many(self, amounts, in_total: bool) -> tuple:
+        """A vectorized `fill` over a NumPy array of amounts, returning arrays of
+        filled volumes, totals and worst prices."""
+        prices, volume_before, total_before = self._arrays
+        cumulative = total_before[1:] if in_total else volume_before[1:]
+        index = numpy.searchsorted(cumulative, amounts, side="left")
+        beyond = index == len(cumulative)
+        index[beyond] = len(cumulative) - 1
+        price = prices[index]
+        if in_total:
+            filled = volume_before[index] + (amounts - total_before[index]) / price
+            total = amounts.copy()
+        else:
+            filled = amounts.copy()
+            total = total_before[index] + (amounts - volume_before[index]) * price
+        filled[beyond] = volume_before[-1]
+        total[beyond] = total_before[-1]
+        empty = amounts <= 0
+        filled[empty] = total[empty] = 0.0
+        price[empty] = math.nan
+        return filled, total, price
+
+
+class SlippageEstimator:
+    """Estimates fill prices, VWAP and slippage for arbitrary volumes from a single
+    order book snapshot, so repeated `QuidaxClient.quotes` calls on the same market
+    can be answered locally.
+
+    Cumulative volumes are computed once per snapshot, after which each estimate is a
+    binary search over the price levels. Large batches are searched at once with
+    NumPy when the `numpy` extra is installed.
+
+    `Kind.BID` estimates a buy, which walks the asks from the lowest price, while
+    `Kind.ASK` estimates a sell, which walks the bids from the highest price.
+    """
+
+    def __init__(
+        self, snapshot: OrderBookSnapshot, registry: Optional[MarketRegistry] = None
+    ):
+        """
+        Args:
+            snapshot: The order book to estimate fills against.
+            registry: An optional `MarketRegistry` used by `verify` to find the quote
+                currency of the market. The client's registry is used otherwise.
+        """
+        self.pair = snapshot.pair
+        self.registry = registry
+        self._sides = {
+            Kind.BID: _BookSide(sorted(snapshot.asks.items())),
+            Kind.ASK: _BookSide(sorted(snapshot.bids.items(), reverse=True)),
+        }
+
+    @classmethod
+    def from_response(
+        cls,
+        pair: CurrencyPair,
+        response: Union[APIResponse, dict],
+        registry: Optional[MarketRegistry] = None,
+    ) -> "SlippageEstimator":
+        """Builds an estimator from the response of `get_order_book` or `get_depth_data`.
+
+        Args:
+            pair: The market the response belongs to.
+            response: The `APIResponse` returned by the market client or its `data`.
+            registry: An optional `MarketRegistry`, see `__init__`.
+        """
+        return cls(OrderBookSnapshot.from_response(pair, response), registry)
+
+    def estimate(
+        self, kind: Kind, volumes: Sequence[float], in_total: bool = False
+    ) -> List[FillEstimate]:
+        """Estimates the execution of a batch of market orders.
+
+        Args:
+            kind: Kind.BID to estimate buys, Kind.ASK to estimate sells.
+            volumes: The volumes to estimate. Each one is estimated independently.
+            in_total: If true, `volumes` are amounts of the quote currency
+                (e.g. how much NGN to spend) rather than of the base currency.
+
+        Returns:
+            A list of `FillEstimate`s in the same order as `volumes`.
+        """
+        side = self._sides[Kind(kind)]
+        best_price = side.prices[0] if side.prices else math.nan
+        if (
+            numpy is not None
+            and side.prices
+            and hasattr(volumes, "__len__")
+            and len(volumes) >= _NUMPY_MIN_SIZE
+        ):
+            return self._estimate_many(side, best_price, volumes, in_total)
+        estimates = []
+        for volume in volumes:
+            filled, total, worst_price = side.fill(volume, in_total)
+            vwap = total / filled if filled else math.nan
+            slippage = abs(vwap - best_price) / best_price if filled else math.nan
+            estimates.append(
+                FillEstimate(
+                    volume=volume,
+                    filled=filled,
+                    vwap=vwap,
+                    worst_price=worst_price,
+                    total=total,
+                    slippage=slippage,
+                )
+            )
+        return estimates
+
+    @staticmethod
+    def _estimate_many(
+        side: _BookSide, best_price: float, volumes: Sequence[float], in_total: bool
+    ) -> List[FillEstimate]:
+        filled, total, worst_price = side.fill_many(
+            numpy.asarray(volumes, dtype=float), in_total
+        )
+        vwap = numpy.full_like(total, math.nan)
+        numpy.divide(total, filled, out=vwap, where=filled != 0)
+        slippage = numpy.abs(vwap - best_price) / best_price
+        return [
+            FillEstimate(
+                volume=volume,
+                filled=filled,
+                vwap=vwap,
+                worst_price=worst_price,
+                total=total,
+                slippage=slippage,
+            )
+            for volume, filled, vwap, worst_price, total, slippage in zip(
+                volumes,
+                filled.tolist(),
+                vwap.tolist(),
+                worst_price.tolist(),
+                total.tolist(),
+                slippage.tolist(),
+            )
+        ]
+
+    def _quote_unit(self, client: "QuidaxClient") -> str:
+        if isinstance(self.pair, PairSymbol) and self.pair.quote is not None:
+            return str(self.pair.quote)
+        for registry in (self.registry, client.orders.registry):
+            market = registry.get(self.pair) if registry is not None else None
+            if market is not None and market.quote_unit:
+                return market.quote_unit
+        raise ValueError(
+            f"The quote currency of {self.pair} is unknown, pass a `MarketRegistry` "
+            "listing the market"
+        )
+
+    def verify(
+        self,
+        client: "QuidaxClient",
+        unit: Currency,
+        kind: Kind,
+        volume: float,
+    ) -> QuoteVerification:
+        """Compares a local estimate with the price returned by `QuidaxClient.quotes`.
+
+        Args:
+            client: The client used to request the quote.
+            unit: The unit currency of the volume, as passed to `QuidaxClient.quotes`.
+                If it is the quote currency of the market, `volume` is treated as a total.
+            kind: Kind.BID or Kind.ASK.
+            volume: Volume to buy or sell.
+
+        Raises:
+            ValueError: If neither the estimator's nor the client's `MarketRegistry`
+                knows the quote currency of the market.
+        """
+        in_total = Currency(unit).value == self._quote_unit(client)
+        estimate = self.estimate(kind, [volume], in_total=in_total)[0]
+        response = client.quotes(self.pair, unit, kind, volume)
+        quoted_price = parse_amount((response.data or {}).get("price"))
+        deviation = (
+            abs(estimate.vwap - quoted_price) / quoted_price
+            if quoted_price
+            else math.nan
+        )
+        return QuoteVerification(
+            estimate=estimate, quoted_price=quoted_price, deviation=deviation
+        )
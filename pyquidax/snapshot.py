@@ -0,0 +1,94 @@
+import math
+from array import array
+from typing import Dict, NamedTuple, Optional, Union
+
+from pyquidax.utils import APIResponse, CurrencyPair, parse_amount
+
+PAIRS = tuple(CurrencyPair)
+PAIR_INDEX: Dict[str, int] = {pair.value: index for index, pair in enumerate(PAIRS)}
+
+
+class Ticker(NamedTuple):
+    last: float
+    bid: float
+    ask: float
+    volume: float
+
+
+def pair_index(pair: Union[CurrencyPair, str]) -> int:
+    """Returns the fixed array index of a market."""
+    return PAIR_INDEX[CurrencyPair(pair).value]
+
+
+class MarketSnapshot:
+    """A compact snapshot of every market's ticker, built from `MarketClient.tickers`.
+
+    Each `CurrencyPair` has a fixed index (see `pair_index`) into the contiguous `last`,
+    `bid`, `ask` and `volume` arrays. Markets missing from the response hold `nan`.
+    The arrays support the buffer protocol, so they can be wrapped without copying
+    e.g. with `numpy.frombuffer(snapshot.last)` for whole-market computations.
+
+    Usage:
+        snapshot = MarketSnapshot.from_tickers(client.markets.tickers())
+        snapshot.last[pair_index(CurrencyPair.BTC_NGN)]
+        snapshot[CurrencyPair.BTC_NGN].ask
+    """
+
+    __slots__ = ("at", "last", "bid", "ask", "volume")
+
+    def __init__(self, at: Optional[int] = None):
+        size = len(PAIRS)
+        self.at = at
+        self.last = array("d", [math.nan]) * size
+        self.bid = array("d", [math.nan]) * size
+        self.ask = array("d", [math.nan]) * size
+        self.volume = array("d", [math.nan]) * size
+
+    @classmethod
+    def from_tickers(cls, response: Union[APIResponse, dict]) -> "MarketSnapshot":
+        """Builds a snapshot from the response of `MarketClient.tickers`.
+
+        Args:
+            response: The `APIResponse` returned by `tickers` or its `data`.
+        """
+        data = response.data if isinstance(response, APIResponse) else response
+        snapshot = cls()
+        for pair, market in (data or {}).items():
+            index = PAIR_INDEX.get(pair)
+            if index is None or not isinstance(market, dict):
+                continue
+            ticker = market.get("ticker") or {}
+            snapshot.last[index] = parse_amount(ticker.get("last"))
+            snapshot.bid[index] = parse_amount(ticker.get("buy"))
+            snapshot.ask[index] = parse_amount(ticker.get("sell"))
+            snapshot.volume[index] = parse_amount(ticker.get("vol"))
+            at = market.get("at")
+            if at is not None and (snapshot.at is None or at > snapshot.at):
+                snapshot.at = at
+        return snapshot
+
+    def __getitem__(self, pair: Union[CurrencyPair, str]) -> Ticker:
+        index = pair_index(pair)
+        return Ticker(
+            last=self.last[index],
+            bid=self.bid[index],
+            ask=self.ask[index],
+            volume=self.volume[index],
+        )
+
+    def __len__(self) -> int:
+        return len(PAIRS)
+
+    def mid(self) -> array:
+        """Returns the mid price of every market."""
+        return array("d", ((bid + ask) / 2 for bid, ask in zip(self.bid, self.ask)))
+
+    def spread(self) -> array:
+        """Returns the relative bid/ask spread of every market."""
+        return array(
+            "d",
+            (
+                (ask - bid) / ((ask + bid) / 2) if ask + bid else math.nan
+                for bid, ask in zip(self.bid, self.ask)
+            ),
+        )
@@ -0,0 +1,686 @@
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import socket
+import ssl
+import struct
+import threading
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlsplit
+
+from pyquidax.base import __version__
+from pyquidax.exceptions import ConnectionException, StreamException
+from pyquidax.utils import CurrencyPair
+
+DEFAULT_MAX_RECONNECT_ATTEMPTS = 10
+
+_WEBSOCKET_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_OPCODE_CONTINUATION = 0x0
+_OPCODE_TEXT = 0x1
+_OPCODE_BINARY = 0x2
+_OPCODE_CLOSE = 0x8
+_OPCODE_PING = 0x9
+_OPCODE_PONG = 0xA
+
+
+@dataclass
+class StreamMessage:
+    """A dataclass representing a message pushed by the market data stream.
+
+    `gap` is true when messages of the channel may have been missed, either because
+    the sequence number skipped ahead or because the stream had to reconnect. Consumers
+    keeping local state, like an order book, should resync it from the REST API.
+    """
+
+    channel: str
+    data: Any
+    sequence: Optional[int] = None
+    gap: bool = False
+
+
+def _pair_id(pair: Union[CurrencyPair, str]) -> str:
+    return pair.value if isinstance(pair, Enum) else pair
+
+
+def ticker_channel(pair: Union[CurrencyPair, str]) -> str:
+    return f"ticker:{_pair_id(pair)}"
+
+
+def trades_channel(pair: Union[CurrencyPair, str]) -> str:
+    return f"trades:{_pair_id(pair)}"
+
+
+def order_book_channel(pair: Union[CurrencyPair, str]) -> str:
+    return f"order_book:{_pair_id(pair)}"
+
+
+def _accept_key(key: str) -> str:
+    digest = hashlib.sha1(key.encode() + _WEBSOCKET_GUID).digest()
+    return base64.b64encode(digest).decode()
+
+
+def _mask(payload: bytes, key: bytes) -> bytes:
+    if not payload:
+        return payload
+    length = len(payload)
+    repeated_key = (key * (length // 4 + 1))[:length]
+    masked = int.from_bytes(payload, "big") ^ int.from_bytes(repeated_key, "big")
+    return masked.to_bytes(length, "big")
+
+
+def _encode_frame(opcode: int, payload: bytes, mask: bool) -> bytes:
+    header = bytearray([0x80 | opcode])
+    mask_bit = 0x80 if mask else 0
+    length = len(payload)
+    if length < 126:
+        header.append(mask_bit | length)
+    elif length < 1 << 16:
+        header.append(mask_bit | 126)
+        header += struct.pack("!H", length)
+    else:
+        header.append(mask_bit | 127)
+        header += struct.pack("!Q", length)
+    if mask:
+        key = os.urandom(4)
+        header += key
+        payload = _mask(payload, key)
+    return bytes(header) + payload
+
+
+class _FrameDecoder:
+    """Incrementally decodes websocket frames from received bytes and reassembles
+    fragmented messages."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._fragments: List[bytes] = []
+        self._fragmented_opcode: Optional[int] = None
+
+    def feed(self, data: bytes) -> List[Tuple[int, bytes]]:
+        """Returns the complete `(opcode, payload)` messages found after adding `data`."""
+        self._buffer += data
+        messages = []
+        while True:
+            frame = self._next_frame()
+            if frame is None:
+                return messages
+            fin, opcode, payload = frame
+            if opcode >= _OPCODE_CLOSE:
+                messages.append((opcode, payload))
+            elif opcode == _OPCODE_CONTINUATION:
+                self._fragments.append(payload)
+                if fin:
+                    messages.append(
+                        (self._fragmented_opcode, b"".join(self._fragments))
+                    )
+                    self._fragments = []
+            elif fin:
+                messages.append((opcode, payload))
+            else:
+                self._fragmented_opcode = opcode
+                self._fragments = [payload]
+
+    def _next_frame(self) -> Optional[Tuple[bool, int, bytes]]:
+        buffer = self._buffer
+        if len(buffer) < 2:
+            return None
+        fin = bool(buffer[0] & 0x80)
+        opcode = buffer[0] & 0x0F
+        masked = bool(buffer[1] & 0x80)
+        length = buffer[1] & 0x7F
+        offset = 2
+        if length == 126:
+            if len(buffer) < 4:
+                return None
+            (length,) = struct.unpack_from("!H", buffer, 2)
+            offset = 4
+        elif length == 127:
+            if len(buffer) < 10:
+                return None
+            (length,) = struct.unpack_from("!Q", buffer, 2)
+            offset = 10
+        key = b""
+        if masked:
+            key = bytes(buffer[offset : offset + 4])
+            offset += 4
+        if len(buffer) < offset + length:
+            return None
+        payload = bytes(buffer[offset : offset + length])
+        del buffer[: offset + length]
+        if masked:
+            payload = _mask(payload, key)
+        return fin, opcode, payload
+
+
+def _handshake_request(url: str, key: str) -> bytes:
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += f"?{parts.query}"
+    return (
+        f"GET {path} HTTP/1.1\r\n"
+        f"Host: {parts.netloc}\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Key: {key}\r\n"
+        "Sec-WebSocket-Version: 13\r\n"
+        f"User-Agent: PyQuidax {__version__}\r\n"
+        "\r\n"
+    ).encode()
+
+
+def _check_handshake_response(head: bytes, key: str):
+    lines = head.decode("latin-1").split("\r\n")
+    status = lines[0].split(" ")
+    if len(status) < 2 or status[1] != "101":
+        raise StreamException(f"Stream handshake failed: {lines[0]}")
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if headers.get("sec-websocket-accept") != _accept_key(key):
+        raise StreamException("Stream handshake failed: invalid Sec-WebSocket-Accept")
+
+
+def _address(url: str) -> Tuple[str, int, Optional[ssl.SSLContext]]:
+    parts = urlsplit(url)
+    if parts.scheme not in {"ws", "wss"}:
+        raise ValueError(f"{url} is not a websocket url")
+    secure = parts.scheme == "wss"
+    port = parts.port or (443 if secure else 80)
+    return parts.hostname, port, ssl.create_default_context() if secure else None
+
+
+class _SequenceTracker:
+    """Detects skipped and duplicated sequence numbers per channel."""
+
+    def __init__(self):
+        self._last: Dict[str, Optional[int]] = {}
+        self._stale = set()
+
+    def reconnected(self):
+        """Marks every channel seen so far as possibly having missed messages."""
+        self._stale = set(self._last)
+
+    def message(self, text: str) -> Optional[StreamMessage]:
+        payload = json.loads(text)
+        if not isinstance(payload, dict):
+            return None
+        if payload.get("event") == "error":
+            raise StreamException(payload.get("message") or "Stream error")
+        channel = payload.get("channel")
+        if channel is None or "data" not in payload:
+            return None
+        sequence = payload.get("sequence")
+        last = self._last.get(channel)
+        gap = False
+        if channel in self._stale:
+            self._stale.discard(channel)
+            gap = sequence is None or last is None or sequence != last + 1
+        elif sequence is not None and last is not None:
+            if sequence <= last:
+                return None
+            gap = sequence != last + 1
+        self._last[channel] = sequence
+        return StreamMessage(
+            channel=channel, data=payload["data"], sequence=sequence, gap=gap
+        )
+
+
+def _subscription(event: str, channel: str) -> str:
+    return json.dumps({"event": event, "channel": channel})
+
+
+class _WebSocket:
+    def __init__(self, url: str, timeout: float, read_timeout: Optional[float]):
+        host, port, context = _address(url)
+        sock = socket.create_connection((host, port), timeout=timeout)
+        self._decoder = _FrameDecoder()
+        self._messages: Deque[Tuple[int, bytes]] = deque()
+        self._send_lock = threading.Lock()
+        try:
+            if context is not None:
+                sock = context.wrap_socket(sock, server_hostname=host)
+            key = base64.b64encode(os.urandom(16)).decode()
+            sock.sendall(_handshake_request(url, key))
+            response = b""
+            while b"\r\n\r\n" not in response:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    raise StreamException("Stream closed during handshake")
+                response += chunk
+            head, _, rest = response.partition(b"\r\n\r\n")
+            _check_handshake_response(head, key)
+            self._messages.extend(self._decoder.feed(rest))
+            sock.settimeout(read_timeout)
+        except BaseException:
+            sock.close()
+            raise
+        self._socket = sock
+
+    def send(self, text: str):
+        self._send_frame(_OPCODE_TEXT, text.encode())
+
+    def _send_frame(self, opcode: int, payload: bytes):
+        with self._send_lock:
+            self._socket.sendall(_encode_frame(opcode, payload, mask=True))
+
+    def recv(self) -> Optional[str]:
+        """Returns the next text message, or None once the connection is closed."""
+        while True:
+            while self._messages:
+                opcode, payload = self._messages.popleft()
+                if opcode in {_OPCODE_TEXT, _OPCODE_BINARY}:
+                    return payload.decode()
+                if opcode == _OPCODE_PING:
+                    self._send_frame(_OPCODE_PONG, payload)
+                elif opcode == _OPCODE_CLOSE:
+                    return None
+            data = self._socket.recv(65536)
+            if not data:
+                return None
+            self._messages.extend(self._decoder.feed(data))
+
+    def close(self):
+        try:
+            self._send_frame(_OPCODE_CLOSE, b"")
+        except OSError:
+            pass
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+
+
+class _AsyncWebSocket:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        self._decoder = _FrameDecoder()
+        self._messages: Deque[Tuple[int, bytes]] = deque()
+
+    @classmethod
+    async def connect(cls, url: str) -> "_AsyncWebSocket":
+        host, port, context = _address(url)
+        reader, writer = await asyncio.open_connection(host, port, ssl=context)
+        websocket = cls(reader, writer)
+        key = base64.b64encode(os.urandom(16)).decode()
+        try:
+            writer.write(_handshake_request(url, key))
+            await writer.drain()
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except asyncio.IncompleteReadError:
+                raise StreamException("Stream closed during handshake")
+            _check_handshake_response(head[:-4], key)
+        except BaseException:
+            # Also covers the cancellation by `asyncio.wait_for` on a timeout.
+            writer.close()
+            raise
+        return websocket
+
+    async def send(self, text: str):
+        await self._send_frame(_OPCODE_TEXT, text.encode())
+
+    async def _send_frame(self, opcode: int, payload: bytes):
+        self._writer.write(_encode_frame(opcode, payload, mask=True))
+        await self._writer.drain()
+
+    async def recv(self) -> Optional[str]:
+        """Returns the next text message, or None once the connection is closed."""
+        while True:
+            while self._messages:
+                opcode, payload = self._messages.popleft()
+                if opcode in {_OPCODE_TEXT, _OPCODE_BINARY}:
+                    return payload.decode()
+                if opcode == _OPCODE_PING:
+                    await self._send_frame(_OPCODE_PONG, payload)
+                elif opcode == _OPCODE_CLOSE:
+                    return None
+            data = await self._reader.read(65536)
+            if not data:
+                return None
+            self._messages.extend(self._decoder.feed(data))
+
+    async def close(self):
+        try:
+            await self._send_frame(_OPCODE_CLOSE, b"")
+        except (OSError, ConnectionError):
+            pass
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except (OSError, ConnectionError):
+            pass
+
+
+class _BaseMarketStream:
+    def __init__(
+        self,
+        url: str,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        max_reconnect_attempts: Optional[int] = DEFAULT_MAX_RECONNECT_ATTEMPTS,
+    ):
+        self.url = url
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.max_reconnect_attempts = max_reconnect_attempts
+        self._channels: List[str] = []
+        self._sequences = _SequenceTracker()
+        # Consecutive connections that failed or dropped before delivering any data.
+        self._attempt = 0
+
+    @property
+    def channels(self) -> List[str]:
+        """The channels currently subscribed to."""
+        return list(self._channels)
+
+    def _backoff(self, attempt: int) -> float:
+        if (
+            self.max_reconnect_attempts is not None
+            and attempt > self.max_reconnect_attempts
+        ):
+            raise ConnectionException(
+                f"Unable to connect to the market data stream at {self.url}"
+            )
+        return min(self.reconnect_delay * 2 ** (attempt - 1), self.max_reconnect_delay)
+
+
+class MarketStream(_BaseMarketStream):
+    """A synchronous client for Quidax's push market data, covering tickers, public
+    trades and order book updates.
+
+    The stream connects lazily on iteration, reconnects with exponential backoff when the
+    connection drops, resubscribes to every channel after reconnecting and flags
+    messages that follow a sequence gap or a reconnection with `StreamMessage.gap`.
+
+    Messages are JSON objects. Subscriptions are sent as
+    `{"event": "subscribe", "channel": "ticker:btcngn"}` and updates are expected as
+    `{"channel": "ticker:btcngn", "sequence": 42, "data": {...}}`.
+
+    Usage:
+        with MarketStream(url) as stream:
+            stream.subscribe_ticker(CurrencyPair.BTC_NGN)
+            stream.subscribe_order_book(CurrencyPair.BTC_NGN)
+            for message in stream:
+                ...
+    """
+
+    def __init__(
+        self,
+        url: str,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        max_reconnect_attempts: Optional[int] = DEFAULT_MAX_RECONNECT_ATTEMPTS,
+        timeout: float = 10.0,
+        read_timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            url: The websocket url of the market data stream, e.g.
+                `wss://stream.example.com/api/v1/stream`. Quidax does not document
+                one, so it must be given.
+            reconnect_delay: Seconds to wait before the first reconnection attempt.
+                The delay doubles after each failed attempt.
+            max_reconnect_delay: The upper bound of the reconnection delay.
+            max_reconnect_attempts: How many consecutive reconnections without
+                receiving any message are tolerated before `ConnectionException` is
+                raised. Retries forever if None.
+            timeout: Seconds to wait for the connection to be established.
+            read_timeout: Seconds without any message after which the connection
+                is considered dead and reestablished. Waits forever if None.
+        """
+        super().__init__(
+            url=url,
+            reconnect_delay=reconnect_delay,
+            max_reconnect_delay=max_reconnect_delay,
+            max_reconnect_attempts=max_reconnect_attempts,
+        )
+        self.timeout = timeout
+        self.read_timeout = read_timeout
+        self._websocket: Optional[_WebSocket] = None
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+
+    def subscribe(self, channel: str) -> str:
+        """Subscribes to a channel, e.g. `ticker_channel(CurrencyPair.BTC_NGN)`."""
+        with self._lock:
+            if channel in self._channels:
+                return channel
+            self._channels.append(channel)
+            websocket = self._websocket
+        if websocket is not None:
+            try:
+                websocket.send(_subscription("subscribe", channel))
+            except OSError:
+                pass
+        return channel
+
+    def unsubscribe(self, channel: str):
+        """Stops receiving messages of a channel."""
+        with self._lock:
+            if channel not in self._channels:
+                return
+            self._channels.remove(channel)
+            websocket = self._websocket
+        if websocket is not None:
+            try:
+                websocket.send(_subscription("unsubscribe", channel))
+            except OSError:
+                pass
+
+    def subscribe_ticker(self, pair: Union[CurrencyPair, str]) -> str:
+        return self.subscribe(ticker_channel(pair))
+
+    def subscribe_trades(self, pair: Union[CurrencyPair, str]) -> str:
+        return self.subscribe(trades_channel(pair))
+
+    def subscribe_order_book(self, pair: Union[CurrencyPair, str]) -> str:
+        return self.subscribe(order_book_channel(pair))
+
+    def _connect(self) -> Optional[_WebSocket]:
+        while not self._closed.is_set():
+            # Returns early when the stream is closed during the backoff.
+            if self._attempt and self._closed.wait(self._backoff(self._attempt)):
+                break
+            try:
+                websocket = _WebSocket(self.url, self.timeout, self.read_timeout)
+                with self._lock:
+                    self._websocket = websocket
+                    channels = list(self._channels)
+                    self._sequences.reconnected()
+                for channel in channels:
+                    websocket.send(_subscription("subscribe", channel))
+                return websocket
+            except (OSError, StreamException):
+                self._attempt += 1
+        return None
+
+    def __iter__(self) -> Iterator[StreamMessage]:
+        while not self._closed.is_set():
+            websocket = self._websocket or self._connect()
+            if websocket is None:
+                return
+            try:
+                text = websocket.recv()
+            except OSError:
+                text = None
+            if text is None:
+                self._attempt += 1
+                self._drop(websocket)
+                continue
+            message = self._sequences.message(text)
+            if message is not None:
+                # Only data proves the connection works; a handshake or an ack does not.
+                self._attempt = 0
+                yield message
+
+    def _drop(self, websocket: _WebSocket):
+        with self._lock:
+            if self._websocket is websocket:
+                self._websocket = None
+        websocket.close()
+
+    def close(self):
+        """Closes the connection and ends iteration."""
+        self._closed.set()
+        websocket = self._websocket
+        if websocket is not None:
+            self._drop(websocket)
+
+    def __enter__(self) -> "MarketStream":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class AsyncMarketStream(_BaseMarketStream):
+    """An async version of `MarketStream`.
+
+    Usage:
+        stream = AsyncMarketStream(url)
+        await stream.subscribe_trades(CurrencyPair.BTC_NGN)
+        async for message in stream:
+            ...
+    """
+
+    def __init__(
+        self,
+        url: str,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        max_reconnect_attempts: Optional[int] = DEFAULT_MAX_RECONNECT_ATTEMPTS,
+        timeout: float = 10.0,
+        read_timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            url: The websocket url of the market data stream, e.g.
+                `wss://stream.example.com/api/v1/stream`. Quidax does not document
+                one, so it must be given.
+            reconnect_delay: Seconds to wait before the first reconnection attempt.
+                The delay doubles after each failed attempt.
+            max_reconnect_delay: The upper bound of the reconnection delay.
+            max_reconnect_attempts: How many consecutive reconnections without
+                receiving any message are tolerated before `ConnectionException` is
+                raised. Retries forever if None.
+            timeout: Seconds to wait for the connection to be established.
+            read_timeout: Seconds without any message after which the connection
+                is considered dead and reestablished. Waits forever if None.
+        """
+        super().__init__(
+            url=url,
+            reconnect_delay=reconnect_delay,
+            max_reconnect_delay=max_reconnect_delay,
+            max_reconnect_attempts=max_reconnect_attempts,
+        )
+        self.timeout = timeout
+        self.read_timeout = read_timeout
+        self._websocket: Optional[_AsyncWebSocket] = None
+        self._closed = False
+
+    async def subscribe(self, channel: str) -> str:
+        """Subscribes to a channel, e.g. `ticker_channel(CurrencyPair.BTC_NGN)`."""
+        if channel in self._channels:
+            return channel
+        self._channels.append(channel)
+        if self._websocket is not None:
+            try:
+                await self._websocket.send(_subscription("subscribe", channel))
+            except (OSError, ConnectionError):
+                pass
+        return channel
+
+    async def unsubscribe(self, channel: str):
+        """Stops receiving messages of a channel."""
+        if channel not in self._channels:
+            return
+        self._channels.remove(channel)
+        if self._websocket is not None:
+            try:
+                await self._websocket.send(_subscription("unsubscribe", channel))
+            except (OSError, ConnectionError):
+                pass
+
+    async def subscribe_ticker(self, pair: Union[CurrencyPair, str]) -> str:
+        return await self.subscribe(ticker_channel(pair))
+
+    async def subscribe_trades(self, pair: Union[CurrencyPair, str]) -> str:
+        return await self.subscribe(trades_channel(pair))
+
+    async def subscribe_order_book(self, pair: Union[CurrencyPair, str]) -> str:
+        return await self.subscribe(order_book_channel(pair))
+
+    async def _connect(self) -> Optional[_AsyncWebSocket]:
+        while not self._closed:
+            if self._attempt:
+                await asyncio.sleep(self._backoff(self._attempt))
+                if self._closed:
+                    break
+            try:
+                websocket = await asyncio.wait_for(
+                    _AsyncWebSocket.connect(self.url), self.timeout
+                )
+                self._websocket = websocket
+                self._sequences.reconnected()
+                for channel in list(self._channels):
+                    await websocket.send(_subscription("subscribe", channel))
+                return websocket
+            except (OSError, ConnectionError, StreamException, asyncio.TimeoutError):
+                self._attempt += 1
+        return None
+
+    async def _messages(self) -> AsyncIterator[StreamMessage]:
+        while not self._closed:
+            websocket = self._websocket or await self._connect()
+            if websocket is None:
+                return
+            try:
+                text = await asyncio.wait_for(websocket.recv(), self.read_timeout)
+            except (OSError, ConnectionError, asyncio.TimeoutError):
+                text = None
+            if text is None:
+                self._attempt += 1
+                if self._websocket is websocket:
+                    self._websocket = None
+                await websocket.close()
+                continue
+            message = self._sequences.message(text)
+            if message is not None:
+                # Only data proves the connection works; a handshake or an ack does not.
+                self._attempt = 0
+                yield message
+
+    def __aiter__(self) -> AsyncIterator[StreamMessage]:
+        return self._messages()
+
+    async def close(self):
+        """Closes the connection and ends iteration."""
+        self._closed = True
+        websocket, self._websocket = self._websocket, None
+        if websocket is not None:
+            await websocket.close()
+
+    async def __aenter__(self) -> "AsyncMarketStream":
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -0,0 +1,252 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+
+from pyquidax.clients.trades import AsyncTradeClient, TradeClient
+from pyquidax.utils import APIResponse, CurrencyPair, parse_amount
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Trade:
+    """A dataclass representing a public trade returned by `TradeClient.get`.
+
+    `timestamp` is the time of the trade in seconds since the Unix epoch and `data`
+    holds the trade exactly as Quidax returned it.
+    """
+
+    pair: str
+    id: Hashable
+    price: float
+    volume: float
+    timestamp: float
+    side: Optional[str]
+    data: Dict[str, Any]
+
+    @classmethod
+    def from_data(cls, pair: Union[CurrencyPair, str], data: dict) -> "Trade":
+        return cls(
+            pair=pair.value if isinstance(pair, Enum) else pair,
+            id=data.get("id"),
+            price=parse_amount(data.get("price")),
+            volume=parse_amount(data.get("volume")),
+            timestamp=_parse_timestamp(data.get("created_at")),
+            side=data.get("side") or data.get("taker_side"),
+            data=data,
+        )
+
+
+def _parse_timestamp(value: Union[str, int, float, None]) -> float:
+    if value is None:
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+    if value.endswith("Z"):
+        value = f"{value[:-1]}+00:00"
+    return datetime.fromisoformat(value).timestamp()
+
+
+class TradeWindow:
+    """A fixed-size window of recently seen trade ids.
+
+    Membership checks are O(1) and memory stays bounded: once `size` ids are held,
+    recording a new id forgets the oldest one.
+    """
+
+    def __init__(self, size: int = 1024):
+        if size <= 0:
+            raise ValueError("`size` must be greater than `0`")
+        self.size = size
+        self._ids: Deque[Hashable] = deque()
+        self._members: Set[Hashable] = set()
+
+    def __contains__(self, trade_id: Hashable) -> bool:
+        return trade_id in self._members
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, trade_id: Hashable) -> bool:
+        """Records a trade id.
+
+        Returns:
+            False if the id was already in the window.
+        """
+        if trade_id in self._members:
+            return False
+        if len(self._ids) == self.size:
+            self._members.discard(self._ids.popleft())
+        self._ids.append(trade_id)
+        self._members.add(trade_id)
+        return True
+
+
+def _trade_order(trade: Trade) -> tuple:
+    # Trades of the same second are ordered by id, the ones without an id last.
+    return trade.timestamp, trade.id is None, 0 if trade.id is None else trade.id
+
+
+def _amount_key(amount: float) -> Optional[float]:
+    # NaN never equals itself, so it would make every key unique.
+    return None if math.isnan(amount) else amount
+
+
+def _trade_key(trade: Trade) -> Hashable:
+    if trade.id is not None:
+        return trade.id
+    # Trades without an id are told apart by their content instead.
+    return (
+        trade.timestamp,
+        _amount_key(trade.price),
+        _amount_key(trade.volume),
+        trade.side,
+    )
+
+
+class _TradeDeduplicator:
+    def __init__(self, window: int):
+        self.window = window
+        self._windows: Dict[str, TradeWindow] = {}
+
+    def new_trades(self, pair: str, response: APIResponse) -> List[Trade]:
+        if response.status_code != 200 or not isinstance(response.data, list):
+            return []
+        window = self._windows.get(pair)
+        if window is None:
+            window = self._windows[pair] = TradeWindow(self.window)
+        trades = sorted(
+            (Trade.from_data(pair, data) for data in response.data), key=_trade_order
+        )
+        return [trade for trade in trades if window.add(_trade_key(trade))]
+
+
+class TradeTape:
+    """Polls `TradeClient.get` for a set of markets and emits each public trade once.
+
+    Every poll returns the most recent trades, which overlap heavily with the previous
+    poll. The tape remembers the last `window` trade ids per market and only emits
+    trades it has not seen, oldest first and by id within the same second, so memory
+    stays bounded however long it runs. `window` should be larger than the number of
+    trades returned by a single poll. Trades without an id are recognised by their
+    time, price, volume and side instead.
+
+    Usage:
+        tape = TradeTape(client.trades, [CurrencyPair.BTC_NGN, CurrencyPair.ETH_NGN])
+        for trade in tape:
+            ...
+    """
+
+    def __init__(
+        self,
+        trades: TradeClient,
+        pairs: Sequence[Union[CurrencyPair, str]],
+        interval: float = 1.0,
+        window: int = 1024,
+    ):
+        """
+        Args:
+            trades: The trade client used to poll trades.
+            pairs: The markets to follow.
+            interval: Seconds to wait between two rounds of polls.
+            window: How many trade ids to remember per market.
+        """
+        self.trades = trades
+        self.pairs = [pair.value if isinstance(pair, Enum) else pair for pair in pairs]
+        self.interval = interval
+        self._deduplicator = _TradeDeduplicator(window)
+        self._closed = False
+
+    def poll(self, pair: Union[CurrencyPair, str]) -> List[Trade]:
+        """Fetches the recent trades of a market and returns the ones not seen before."""
+        pair = pair.value if isinstance(pair, Enum) else pair
+        return self._deduplicator.new_trades(pair, self.trades.get(pair))
+
+    def __iter__(self) -> Iterator[Trade]:
+        while not self._closed:
+            for pair in self.pairs:
+                try:
+                    new_trades = self.poll(pair)
+                except Exception:
+                    logger.exception("Polling trades of %s failed", pair)
+                    continue
+                yield from new_trades
+            time.sleep(self.interval)
+
+    def close(self):
+        """Ends iteration after the current round of polls."""
+        self._closed = True
+
+
+class AsyncTradeTape:
+    """An async version of `TradeTape` which polls `AsyncTradeClient.get`.
+
+    Usage:
+        tape = AsyncTradeTape(client.trades, [CurrencyPair.BTC_NGN])
+        async for trade in tape:
+            ...
+    """
+
+    def __init__(
+        self,
+        trades: AsyncTradeClient,
+        pairs: Sequence[Union[CurrencyPair, str]],
+        interval: float = 1.0,
+        window: int = 1024,
+    ):
+        """
+        Args:
+            trades: The async trade client used to poll trades.
+            pairs: The markets to follow.
+            interval: Seconds to wait between two rounds of polls.
+            window: How many trade ids to remember per market.
+        """
+        self.trades = trades
+        self.pairs = [pair.value if isinstance(pair, Enum) else pair for pair in pairs]
+        self.interval = interval
+        self._deduplicator = _TradeDeduplicator(window)
+        self._closed = False
+
+    async def poll(self, pair: Union[CurrencyPair, str]) -> List[Trade]:
+        """Fetches the recent trades of a market and returns the ones not seen before."""
+        pair = pair.value if isinstance(pair, Enum) else pair
+        return self._deduplicator.new_trades(pair, await self.trades.get(pair))
+
+    async def _trades(self) -> AsyncIterator[Trade]:
+        while not self._closed:
+            responses = await asyncio.gather(
+                *(self.trades.get(pair) for pair in self.pairs),
+                return_exceptions=True,
+            )
+            for pair, response in zip(self.pairs, responses):
+                if isinstance(response, Exception):
+                    logger.error("Polling trades of %s failed: %r", pair, response)
+                    continue
+                for trade in self._deduplicator.new_trades(pair, response):
+                    yield trade
+            await asyncio.sleep(self.interval)
+
+    def __aiter__(self) -> AsyncIterator[Trade]:
+        return self._trades()
+
+    def close(self):
+        """Ends iteration after the current round of polls."""
+        self._closed = True
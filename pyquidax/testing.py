@@ -0,0 +1,226 @@
+import json
+import socket
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+from pyquidax.streaming import (
+    _OPCODE_CLOSE,
+    _OPCODE_PING,
+    _OPCODE_PONG,
+    _OPCODE_TEXT,
+    _FrameDecoder,
+    _accept_key,
+    _encode_frame,
+)
+
+
+class _Connection:
+    def __init__(self, sock: socket.socket):
+        self.socket = sock
+        self.channels: Set[str] = set()
+        self.lock = threading.Lock()
+
+    def send(self, opcode: int, payload: bytes):
+        with self.lock:
+            self.socket.sendall(_encode_frame(opcode, payload, mask=False))
+
+    def close(self):
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.socket.close()
+
+
+class LocalStreamServer:
+    """A local stand-in for Quidax's market data stream.
+
+    It speaks the same protocol as `MarketStream` and `AsyncMarketStream` expect, so
+    streaming consumers can be tested without network access. Messages are only
+    published when `publish` is called, and disconnects or sequence gaps can be
+    simulated with `disconnect_all` and `skip`.
+
+    Usage:
+        with LocalStreamServer() as server:
+            stream = MarketStream(server.url)
+            stream.subscribe_ticker(CurrencyPair.BTC_NGN)
+            ...
+            server.publish("ticker:btcngn", {"last": "100"})
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            host: The interface to listen on.
+            port: The port to listen on. A free port is picked if `0`.
+        """
+        self.host = host
+        self.port = port
+        self._listener: Optional[socket.socket] = None
+        self._connections: List[_Connection] = []
+        self._sequences: Dict[str, int] = {}
+        self._changed = threading.Condition()
+        self._threads: List[threading.Thread] = []
+
+    @property
+    def url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    @property
+    def connection_count(self) -> int:
+        with self._changed:
+            return len(self._connections)
+
+    def start(self):
+        """Starts accepting connections on a background thread."""
+        self._listener = socket.create_server((self.host, self.port))
+        self.port = self._listener.getsockname()[1]
+        self._spawn(self._accept, self._listener)
+
+    def stop(self):
+        """Closes every connection and stops listening."""
+        if self._listener is not None:
+            try:
+                self._listener.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._listener.close()
+            self._listener = None
+        self.disconnect_all()
+        for thread in self._threads:
+            thread.join(timeout=1)
+        self._threads = []
+
+    def __enter__(self) -> "LocalStreamServer":
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def _spawn(self, target, *args):
+        thread = threading.Thread(target=target, args=args, daemon=True)
+        self._threads.append(thread)
+        thread.start()
+
+    def _accept(self, listener: socket.socket):
+        while True:
+            try:
+                sock, _ = listener.accept()
+            except OSError:
+                return
+            self._spawn(self._serve, _Connection(sock))
+
+    def _serve(self, connection: _Connection):
+        try:
+            request = b""
+            while b"\r\n\r\n" not in request:
+                chunk = connection.socket.recv(4096)
+                if not chunk:
+                    return
+                request += chunk
+            head, _, rest = request.partition(b"\r\n\r\n")
+            key = ""
+            for line in head.decode("latin-1").split("\r\n")[1:]:
+                name, _, value = line.partition(":")
+                if name.strip().lower() == "sec-websocket-key":
+                    key = value.strip()
+            connection.socket.sendall(
+                (
+                    "HTTP/1.1 101 Switching Protocols\r\n"
+                    "Upgrade: websocket\r\n"
+                    "Connection: Upgrade\r\n"
+                    f"Sec-WebSocket-Accept: {_accept_key(key)}\r\n"
+                    "\r\n"
+                ).encode()
+            )
+            with self._changed:
+                self._connections.append(connection)
+                self._changed.notify_all()
+            decoder = _FrameDecoder()
+            data = rest
+            while True:
+                for opcode, payload in decoder.feed(data):
+                    if opcode == _OPCODE_TEXT:
+                        self._handle(connection, payload)
+                    elif opcode == _OPCODE_PING:
+                        connection.send(_OPCODE_PONG, payload)
+                    elif opcode == _OPCODE_CLOSE:
+                        return
+                data = connection.socket.recv(65536)
+                if not data:
+                    return
+        except OSError:
+            return
+        finally:
+            with self._changed:
+                if connection in self._connections:
+                    self._connections.remove(connection)
+                self._changed.notify_all()
+            connection.close()
+
+    def _handle(self, connection: _Connection, payload: bytes):
+        message = json.loads(payload)
+        channel = message.get("channel")
+        with self._changed:
+            if message.get("event") == "subscribe":
+                connection.channels.add(channel)
+            elif message.get("event") == "unsubscribe":
+                connection.channels.discard(channel)
+            self._changed.notify_all()
+
+    def subscriber_count(self, channel: str) -> int:
+        """Returns how many connections are subscribed to a channel."""
+        with self._changed:
+            return self._subscriber_count(channel)
+
+    def _subscriber_count(self, channel: str) -> int:
+        return sum(channel in connection.channels for connection in self._connections)
+
+    def wait_for_subscribers(
+        self, channel: str, count: int = 1, timeout: float = 5.0
+    ) -> bool:
+        """Blocks until at least `count` connections are subscribed to a channel.
+
+        Returns:
+            False if the timeout elapsed first.
+        """
+        with self._changed:
+            return self._changed.wait_for(
+                lambda: self._subscriber_count(channel) >= count, timeout=timeout
+            )
+
+    def publish(self, channel: str, data: Any) -> int:
+        """Sends a message to every subscriber of a channel.
+
+        Returns:
+            The sequence number of the message.
+        """
+        with self._changed:
+            sequence = self._sequences.get(channel, 0) + 1
+            self._sequences[channel] = sequence
+            connections = [
+                connection
+                for connection in self._connections
+                if channel in connection.channels
+            ]
+        payload = json.dumps({"channel": channel, "sequence": sequence, "data": data})
+        for connection in connections:
+            try:
+                connection.send(_OPCODE_TEXT, payload.encode())
+            except OSError:
+                pass
+        return sequence
+
+    def skip(self, channel: str, count: int = 1):
+        """Advances the sequence of a channel without sending, to simulate lost messages."""
+        with self._changed:
+            self._sequences[channel] = self._sequences.get(channel, 0) + count
+
+    def disconnect_all(self):
+        """Drops every open connection, to simulate a network failure."""
+        with self._changed:
+            connections, self._connections = self._connections, []
+            self._changed.notify_all()
+        for connection in connections:
+            connection.close()
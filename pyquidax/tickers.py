@@ -0,0 +1,167 @@
+import asyncio
+import queue
+from enum import Enum
+from typing import AsyncIterator, Awaitable, Callable, Dict, Union
+
+from pyquidax.clients.markets import AsyncMarketClient, MarketClient
+from pyquidax.polling import _AsyncPoller, _Poller
+from pyquidax.utils import APIResponse, CurrencyPair
+
+TickerCallback = Callable[[str, dict], None]
+AsyncTickerCallback = Callable[[str, dict], Union[None, Awaitable[None]]]
+
+
+def _pair_id(pair: Union[CurrencyPair, str]) -> str:
+    return pair.value if isinstance(pair, Enum) else pair
+
+
+class _TickerChanges:
+    """Tracks the last ticker of each market and reports the ones that changed."""
+
+    def __init__(self):
+        self._last: Dict[str, dict] = {}
+
+    def changes(self, response: APIResponse) -> Dict[str, dict]:
+        if response.status_code != 200 or not isinstance(response.data, dict):
+            return {}
+        changed = {}
+        for pair, market in response.data.items():
+            ticker = market.get("ticker") if isinstance(market, dict) else None
+            if ticker is None or self._last.get(pair) == ticker:
+                continue
+            self._last[pair] = ticker
+            changed[pair] = market
+        return changed
+
+
+class TickerHub(_Poller):
+    """Polls `MarketClient.tickers` at a fixed cadence and dispatches per-market updates
+    to subscribers, so many consumers of `get_ticker` share a single request.
+
+    Subscribers are only notified when the ticker of their market changed. Each update
+    is the same dict `MarketClient.get_ticker` returns as `data` e.g.
+    `{"at": 1700000000, "ticker": {"buy": "...", "sell": "...", "last": "...", ...}}`.
+
+    Usage:
+        hub = TickerHub(client.markets, interval=2)
+        hub.subscribe(CurrencyPair.BTC_NGN, lambda pair, update: print(update))
+        updates = hub.queue(CurrencyPair.ETH_NGN)
+        with hub:
+            update = updates.get()
+    """
+
+    _thread_name = "pyquidax-ticker-hub"
+    _failure_message = "Polling market tickers failed"
+
+    def __init__(self, markets: MarketClient, interval: float = 1.0):
+        """
+        Args:
+            markets: The market client used to poll tickers.
+            interval: Seconds to wait between two polls.
+        """
+        super().__init__()
+        self.markets = markets
+        self.interval = interval
+        self._changes = _TickerChanges()
+
+    def subscribe(
+        self, pair: Union[CurrencyPair, str], callback: TickerCallback
+    ) -> Callable[[], None]:
+        """Registers a callback called with `(pair, update)` whenever a market's ticker changes.
+
+        Callbacks run on the polling thread and should return quickly.
+
+        Returns:
+            A function that removes the subscription when called.
+        """
+        return self._subscribe(_pair_id(pair), callback)
+
+    def queue(self, pair: Union[CurrencyPair, str], maxsize: int = 0) -> queue.Queue:
+        """Returns a queue that receives the updates of a market.
+
+        When a bounded queue is full, its oldest update is dropped rather than
+        blocking the poller.
+        """
+        return self._queue(_pair_id(pair), maxsize)
+
+    def poll(self) -> Dict[str, dict]:
+        """Fetches all tickers once and notifies the subscribers of changed markets.
+
+        Returns:
+            The updates of the markets that changed, keyed by market id.
+        """
+        changed = self._changes.changes(self.markets.tickers())
+        for pair, update in changed.items():
+            self._notify(pair, pair, update)
+        return changed
+
+    def __enter__(self) -> "TickerHub":
+        return super().__enter__()
+
+
+class AsyncTickerHub(_AsyncPoller):
+    """An async version of `TickerHub` which polls `AsyncMarketClient.tickers`.
+
+    Usage:
+        hub = AsyncTickerHub(client.markets, interval=2)
+        hub.start()
+        async for update in hub.stream(CurrencyPair.BTC_NGN):
+            ...
+    """
+
+    _failure_message = "Polling market tickers failed"
+
+    def __init__(self, markets: AsyncMarketClient, interval: float = 1.0):
+        """
+        Args:
+            markets: The async market client used to poll tickers.
+            interval: Seconds to wait between two polls.
+        """
+        super().__init__()
+        self.markets = markets
+        self.interval = interval
+        self._changes = _TickerChanges()
+
+    def subscribe(
+        self, pair: Union[CurrencyPair, str], callback: AsyncTickerCallback
+    ) -> Callable[[], None]:
+        """Registers a callback, or coroutine function, called with `(pair, update)`
+        whenever a market's ticker changes.
+
+        Returns:
+            A function that removes the subscription when called.
+        """
+        return self._subscribe(_pair_id(pair), callback)
+
+    def queue(self, pair: Union[CurrencyPair, str], maxsize: int = 0) -> asyncio.Queue:
+        """Returns a queue that receives the updates of a market.
+
+        When a bounded queue is full, its oldest update is dropped rather than
+        blocking the poller.
+        """
+        return self._queue(_pair_id(pair), maxsize)
+
+    async def stream(self, pair: Union[CurrencyPair, str]) -> AsyncIterator[dict]:
+        """Iterates over the updates of a market.
+
+        The subscription starts with the iteration and ends when the iterator is
+        closed, so an iterator that is never started leaves nothing subscribed.
+        """
+        updates = asyncio.Queue()
+        unsubscribe = self.subscribe(pair, lambda _, update: updates.put_nowait(update))
+        try:
+            while True:
+                yield await updates.get()
+        finally:
+            unsubscribe()
+
+    async def poll(self) -> Dict[str, dict]:
+        """Fetches all tickers once and notifies the subscribers of changed markets.
+
+        Returns:
+            The updates of the markets that changed, keyed by market id.
+        """
+        changed = self._changes.changes(await self.markets.tickers())
+        for pair, update in changed.items():
+            await self._notify(pair, pair, update)
+        return changed
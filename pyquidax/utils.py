@@ -1,6 +1,7 @@
+import math
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Sequence, Literal
+from typing import Optional, Sequence, Literal, Union
 
 Period = Literal[1, 5, 15, 30, 60, 120, 240, 360, 720, 1440, 4320, 10080]
 
@@ -10,13 +11,15 @@ class APIResponse:
     """A dataclass representing the response returned from Quidax servers.
 
     Every method on each client class provided by the pyquidax package returns
-    an `APIResponse`
+    an `APIResponse`. `meta` holds the pagination metadata of the list endpoints
+    that return it.
     """
 
     status_code: int
     status: Optional[str]
     message: Optional[str]
     data: Optional[dict]
+    meta: Optional[dict] = None
 
 
 class Currency(str, Enum):
@@ -147,3 +150,16 @@ def append_query_parameters(url: str, query_params: Sequence) -> str:
             else:
                 url += f"?{key}={value}"
     return url
+
+
+def parse_amount(value: Union[str, int, float, dict, None]) -> float:
+    """Converts an amount returned by Quidax to a float.
+
+    Quidax returns amounts either as plain strings e.g. `"0.5"` or as objects
+    e.g. `{"unit": "btc", "amount": "0.5"}`. Missing amounts are returned as `nan`.
+    """
+    if isinstance(value, dict):
+        value = value.get("amount")
+    if value is None or value == "":
+        return math.nan
+    return float(value)
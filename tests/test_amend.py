@@ -0,0 +1,98 @@
+import asyncio
+from unittest.mock import patch
+
+from pyquidax.clients.orders import AsyncOrderClient, OrderClient
+from pyquidax.utils import APIResponse, CurrencyPair, OrderType
+from tests.utils import MockedAPICallTestCase, MockedAsyncAPICallTestCase
+
+
+def response(status_code=200, **data):
+    return APIResponse(status_code=status_code, status=None, message=None, data=data)
+
+
+class AmendTestCase(MockedAPICallTestCase):
+    def setUp(self) -> None:
+        self.client = OrderClient(self.secret_key)
+
+    def tearDown(self) -> None:
+        self.client.close()
+
+    def test_cancel_and_create_are_sent_concurrently(self):
+        order = response(market={"id": "btcngn"}, side="sell", state="wait")
+        with patch.object(self.client, "get", return_value=order), patch.object(
+            self.client, "cancel", return_value=response()
+        ) as cancel, patch.object(
+            self.client, "create", return_value=response(201)
+        ) as create:
+            result = self.client.amend("1", price=10, volume=2)
+        self.assertTrue(result.ok)
+        cancel.assert_called_once_with("1", "me")
+        create.assert_called_once_with("btcngn", "sell", 10, 2, user_id="me")
+
+    def test_failures_are_reported(self):
+        with patch.object(
+            self.client, "cancel", return_value=response(422)
+        ), patch.object(self.client, "create", return_value=response(201)):
+            result = self.client.amend(
+                "1", 10, 2, pair=CurrencyPair.BTC_NGN, type=OrderType.BUY
+            )
+        self.assertFalse(result.ok)
+        self.assertFalse(result.cancel.ok)
+        self.assertTrue(result.create.ok)
+
+    def test_safe_mode_waits_for_the_cancellation(self):
+        states = [response(state="wait"), response(state="cancel")]
+        with patch.object(self.client, "get", side_effect=states), patch.object(
+            self.client, "cancel", return_value=response()
+        ), patch.object(self.client, "create", return_value=response(201)) as create:
+            result = self.client.amend(
+                "1",
+                10,
+                2,
+                pair=CurrencyPair.BTC_NGN,
+                type=OrderType.BUY,
+                safe=True,
+                poll_interval=0,
+            )
+        self.assertTrue(result.ok)
+        self.assertEqual(result.cancel.value.data["state"], "cancel")
+        create.assert_called_once()
+
+    def test_safe_mode_does_not_replace_filled_orders(self):
+        with patch.object(
+            self.client, "get", return_value=response(state="done")
+        ), patch.object(self.client, "cancel", return_value=response()), patch.object(
+            self.client, "create"
+        ) as create:
+            result = self.client.amend(
+                "1", 10, 2, pair=CurrencyPair.BTC_NGN, type=OrderType.BUY, safe=True
+            )
+        self.assertFalse(result.ok)
+        self.assertIsNone(result.create)
+        create.assert_not_called()
+
+
+class AsyncAmendTestCase(MockedAsyncAPICallTestCase):
+    async def test_cancel_and_create_are_sent_concurrently(self):
+        client = AsyncOrderClient(self.secret_key)
+        started = []
+
+        async def call(name, result):
+            started.append(name)
+            await asyncio.sleep(0.01)
+            self.assertEqual(len(started), 2)
+            return result
+
+        async def cancel(*args):
+            return await call("cancel", response())
+
+        async def create(*args, **kwargs):
+            return await call("create", response(201))
+
+        with patch.object(client, "cancel", side_effect=cancel), patch.object(
+            client, "create", side_effect=create
+        ):
+            result = await client.amend(
+                "1", 10, 2, pair=CurrencyPair.BTC_NGN, type=OrderType.BUY
+            )
+        self.assertTrue(result.ok)
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pyquidax.batch import BatchResult
+from pyquidax.exceptions import ConnectionException
+from pyquidax.quidax import AsyncQuidaxClient, QuidaxClient
+from tests.utils import MockedAPICallTestCase
+
+
+class BatchResultTestCase(TestCase):
+    def test_unwrap_returns_the_value_or_raises_the_error(self):
+        self.assertEqual(BatchResult(value=1).unwrap(), 1)
+        with self.assertRaises(KeyError):
+            BatchResult(error=KeyError("id")).unwrap()
+
+
+class QuidaxClientBatchTestCase(MockedAPICallTestCase):
+    def setUp(self) -> None:
+        self.client = QuidaxClient(self.secret_key, max_workers=4)
+
+    def tearDown(self) -> None:
+        self.client.close()
+
+    def test_results_are_returned_in_input_order(self):
+        def delayed(value):
+            time.sleep(0.01 * (5 - value))
+            return value
+
+        results = self.client.map(delayed, range(5))
+        self.assertEqual([result.value for result in results], [0, 1, 2, 3, 4])
+
+    def test_calls_run_concurrently(self):
+        barrier = threading.Barrier(4, timeout=5)
+        results = self.client.batch([barrier.wait] * 4)
+        self.assertTrue(all(result.ok for result in results))
+
+    def test_errors_are_reported_per_call(self):
+        def fail():
+            raise ValueError("boom")
+
+        results = self.client.batch([lambda: 1, fail, lambda: 3])
+        self.assertEqual([result.ok for result in results], [True, False, True])
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertEqual(results[2].value, 3)
+
+    def test_client_calls_share_the_connection_pool(self):
+        self.assertIs(self.client.orders.http_client, self.client.http_client)
+        results = self.client.map(self.client.orders.get, ["1", "2"])
+        self.assertEqual([result.value.status_code for result in results], [200, 200])
+
+    def test_connection_pool_is_created_on_the_first_request(self):
+        client = QuidaxClient(self.secret_key)
+        self.assertIsNone(client._http_client)
+        http_client = client.orders.http_client
+        self.assertIs(client._http_client, http_client)
+        self.assertIs(client.markets.http_client, http_client)
+        client.close()
+        self.assertTrue(http_client.is_closed)
+
+    def test_map_zips_several_iterables(self):
+        results = self.client.map(lambda a, b: a + b, [1, 2], [10, 20])
+        self.assertEqual([result.value for result in results], [11, 22])
+
+
+class AsyncQuidaxClientBatchTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.client = AsyncQuidaxClient("qwerty", max_concurrency=2)
+
+    async def test_concurrency_is_bounded(self):
+        in_flight = []
+        peak = []
+
+        async def call(value):
+            in_flight.append(value)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(value)
+            return value
+
+        results = await self.client.map(call, range(6))
+        self.assertEqual([result.value for result in results], list(range(6)))
+        self.assertEqual(max(peak), 2)
+
+    async def test_results_are_streamed_as_they_complete(self):
+        async def call(delay):
+            await asyncio.sleep(delay)
+            return delay
+
+        calls = [lambda delay=delay: call(delay) for delay in (0.05, 0.01)]
+        indices = [index async for index, _ in self.client.as_completed(calls)]
+        self.assertEqual(indices, [1, 0])
+
+    async def test_timeouts_are_reported_per_call(self):
+        results = await self.client.batch(
+            [lambda: asyncio.sleep(1), lambda: asyncio.sleep(0, result=1)],
+            timeout=0.01,
+        )
+        self.assertIsInstance(results[0].error, asyncio.TimeoutError)
+        self.assertEqual(results[1].value, 1)
+
+    async def test_fatal_errors_cancel_remaining_calls(self):
+        started = []
+
+        async def call(value):
+            started.append(value)
+            if value == 1:
+                raise ConnectionException("offline")
+            await asyncio.sleep(1)
+
+        calls = (lambda value=value: call(value) for value in range(10))
+        with self.assertRaises(ConnectionException):
+            await self.client.batch(calls, concurrency=2)
+        self.assertEqual(started, [0, 1])
@@ -0,0 +1,71 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from pyquidax.cache import QuoteCache
+from pyquidax.quidax import QuidaxClient
+from pyquidax.utils import APIResponse, Currency, CurrencyPair, Kind
+from tests.utils import MockedAPICallTestCase
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class QuoteCacheTestCase(TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.cache = QuoteCache(
+            ttl=1.0,
+            bands=[1, 10],
+            max_staleness={CurrencyPair.BTC_NGN: 0.2},
+            clock=self.clock,
+        )
+        self.response = APIResponse(
+            status_code=200, status="success", message=None, data={}
+        )
+        self.key = (CurrencyPair.ETH_NGN, Currency.ETHEREUM, Kind.BID)
+
+    def test_volumes_in_the_same_band_share_an_entry(self):
+        self.cache.set(*self.key, 2, self.response)
+        self.assertIs(self.cache.get(*self.key, 5), self.response)
+        self.assertIsNone(self.cache.get(*self.key, 0.5))
+        self.assertIsNone(self.cache.get(*self.key, 11))
+
+    def test_volumes_outside_the_bands_are_not_cached(self):
+        self.cache.set(*self.key, 11, self.response)
+        self.assertIsNone(self.cache.get(*self.key, 11))
+        self.assertIsNone(self.cache.get(*self.key, 10_000))
+        self.cache.set(*self.key, 0.5, self.response)
+        self.assertIsNone(self.cache.get(*self.key, 0.5))
+
+    def test_entries_expire_after_ttl(self):
+        self.cache.set(*self.key, 2, self.response)
+        self.clock.now = 1.0
+        self.assertIsNone(self.cache.get(*self.key, 2))
+
+    def test_max_staleness_overrides_ttl(self):
+        key = (CurrencyPair.BTC_NGN, Currency.BITCOIN, Kind.BID)
+        self.cache.set(*key, 2, self.response)
+        self.clock.now = 0.1
+        self.assertIs(self.cache.get(*key, 2), self.response)
+        self.clock.now = 0.2
+        self.assertIsNone(self.cache.get(*key, 2))
+
+    def test_unsuccessful_responses_are_not_cached(self):
+        self.response.status_code = 400
+        self.cache.set(*self.key, 2, self.response)
+        self.assertIsNone(self.cache.get(*self.key, 2))
+
+
+class QuidaxClientQuoteCacheTestCase(MockedAPICallTestCase):
+    def test_quotes_are_served_from_cache(self):
+        client = QuidaxClient(self.secret_key, quote_cache=QuoteCache(bands=[1, 10]))
+        with patch.object(client, "_api_call", wraps=client._api_call) as api_call:
+            first = client.quotes(CurrencyPair.BTC_NGN, Currency.BITCOIN, Kind.BID, 2)
+            second = client.quotes(CurrencyPair.BTC_NGN, Currency.BITCOIN, Kind.BID, 3)
+        self.assertIs(first, second)
+        api_call.assert_called_once()
@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+from pyquidax.clients.orders import AsyncOrderClient, OrderClient
+from pyquidax.exceptions import ConnectionException
+from pyquidax.utils import APIResponse, CurrencyPair, OrderState
+from tests.utils import MockedAPICallTestCase, MockedAsyncAPICallTestCase
+
+
+def response(status_code=200):
+    return APIResponse(status_code=status_code, status=None, message=None, data={})
+
+
+class FlakyCancel:
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+        self.calls = []
+
+    def __call__(self, order_id, user_id="me"):
+        self.calls.append(order_id)
+        outcome = self.outcomes.get(order_id, [response()]).pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class CancelAllTestCase(MockedAPICallTestCase):
+    def setUp(self) -> None:
+        self.client = OrderClient(self.secret_key)
+        self.open_orders = [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    def tearDown(self) -> None:
+        self.client.close()
+
+    def test_every_open_order_is_cancelled(self):
+        cancel = FlakyCancel({})
+        with patch.object(
+            self.client, "iter_all", return_value=iter(self.open_orders)
+        ) as iter_all, patch.object(self.client, "cancel", side_effect=cancel):
+            summary = self.client.cancel_all(CurrencyPair.BTC_NGN)
+        iter_all.assert_called_once_with(
+            CurrencyPair.BTC_NGN, OrderState.WAIT, user_id="me"
+        )
+        self.assertTrue(summary.ok)
+        self.assertEqual(sorted(summary.cancelled), ["1", "2", "3"])
+
+    def test_transient_failures_are_retried(self):
+        cancel = FlakyCancel(
+            {
+                "1": [ConnectionException("reset"), response()],
+                "2": [response(503), response(503), response(503)],
+                "3": [response(422)],
+            }
+        )
+        with patch.object(
+            self.client, "iter_all", return_value=iter(self.open_orders)
+        ), patch.object(self.client, "cancel", side_effect=cancel):
+            summary = self.client.cancel_all(retry_delay=0)
+        self.assertEqual(summary.cancelled, ["1"])
+        self.assertEqual(sorted(summary.failed), ["2", "3"])
+        self.assertEqual(summary.failed["2"].response.status_code, 503)
+        self.assertEqual(cancel.calls.count("2"), 3)
+        self.assertEqual(cancel.calls.count("3"), 1)
+
+
+class AsyncCancelAllTestCase(MockedAsyncAPICallTestCase):
+    async def test_every_open_order_is_cancelled(self):
+        client = AsyncOrderClient(self.secret_key)
+        cancel = FlakyCancel({"2": [ConnectionException("reset"), response()]})
+
+        async def open_orders():
+            for order in ({"id": 1}, {"id": 2}):
+                yield order
+
+        async def async_cancel(order_id, user_id="me"):
+            return cancel(order_id, user_id)
+
+        with patch.object(client, "iter_all", return_value=open_orders()), patch.object(
+            client, "cancel", side_effect=async_cancel
+        ):
+            summary = await client.cancel_all(retry_delay=0)
+        self.assertTrue(summary.ok)
+        self.assertEqual(sorted(summary.cancelled), ["1", "2"])
@@ -0,0 +1,51 @@
+from unittest import TestCase
+
+from pyquidax.candles import CandleBuilder
+from pyquidax.tape import Trade
+from pyquidax.utils import CurrencyPair
+
+
+def trade(timestamp: float, price: float, volume: float = 1.0) -> Trade:
+    return Trade(
+        pair="btcngn",
+        id=timestamp,
+        price=price,
+        volume=volume,
+        timestamp=timestamp,
+        side="buy",
+        data={},
+    )
+
+
+class CandleBuilderTestCase(TestCase):
+    def test_candles_are_closed_by_later_trades(self):
+        builder = CandleBuilder(periods=[1, 5])
+        trades = [
+            trade(0, 100),
+            trade(10, 105),
+            trade(20, 95),
+            trade(30, 101, volume=2),
+            trade(61, 102),
+        ]
+        (candle,) = list(builder.feed(trades))
+        self.assertEqual(candle.period, 1)
+        self.assertEqual(candle.as_k_line(), [0, 100, 105, 95, 101, 5.0])
+
+        five_minutes = builder.current(CurrencyPair.BTC_NGN, 5)
+        self.assertEqual(five_minutes.volume, 6.0)
+        self.assertEqual(five_minutes.close, 102)
+
+    def test_flush_closes_ended_candles(self):
+        builder = CandleBuilder(periods=[1, 5])
+        builder.update(trade(0, 100))
+        (candle,) = builder.flush(now=60)
+        self.assertEqual(candle.period, 1)
+        self.assertIsNone(builder.current("btcngn", 1))
+        self.assertEqual(builder.update(trade(30, 90)), [])
+        self.assertIsNone(builder.current("btcngn", 1))
+
+    def test_late_trades_are_ignored(self):
+        builder = CandleBuilder(periods=[1])
+        builder.update(trade(120, 100))
+        self.assertEqual(builder.update(trade(30, 50)), [])
+        self.assertEqual(builder.current("btcngn", 1).low, 100)
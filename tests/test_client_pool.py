@@ -0,0 +1,91 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+import httpx
+
+from pyquidax.client_pool import AsyncQuidaxClientPool, QuidaxClientPool
+from pyquidax.registry import MarketRegistry
+
+
+class RecordingTransport:
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(
+            200,
+            json={"status": "success", "data": {}},
+            headers={"set-cookie": "session=tenant; Path=/"},
+        )
+
+
+class QuidaxClientPoolTestCase(TestCase):
+    def setUp(self) -> None:
+        self.transport = RecordingTransport()
+        self.registry = MarketRegistry()
+        self.pool = QuidaxClientPool(
+            market_registry=self.registry, max_clients=2, rate=5
+        )
+        self.pool.http_client.close()
+        self.pool._http_client = httpx.Client(
+            transport=httpx.MockTransport(self.transport),
+            cookies=self.pool.http_client.cookies.jar,
+        )
+
+    def tearDown(self) -> None:
+        self.pool.close()
+
+    def test_clients_share_the_pool_resources(self):
+        first, second = self.pool.client("key-1"), self.pool.client("key-2")
+        self.assertIs(self.pool.client("key-1"), first)
+        self.assertIs(first.orders.http_client, second.http_client)
+        self.assertIs(first._get_executor(), second._get_executor())
+        self.assertIs(second.orders.registry, self.registry)
+
+    def test_requests_are_authenticated_per_key(self):
+        self.pool.client("key-1").markets.all()
+        self.pool.client("key-2").markets.all()
+        self.assertEqual(
+            [request.headers["authorization"] for request in self.transport.requests],
+            ["Bearer key-1", "Bearer key-2"],
+        )
+        self.assertNotIn("cookie", self.transport.requests[1].headers)
+
+    def test_least_recently_used_clients_are_dropped(self):
+        first = self.pool.client("key-1")
+        self.pool.client("key-2")
+        self.pool.client("key-1")
+        self.pool.client("key-3")
+        self.assertNotIn("key-2", self.pool)
+        self.assertIs(self.pool.client("key-1"), first)
+        self.assertEqual(len(self.pool), 2)
+
+    def test_each_key_has_its_own_rate_limiter(self):
+        limiter = self.pool.rate_limiter("key-1")
+        self.assertIs(self.pool.rate_limiter("key-1"), limiter)
+        self.assertIsNot(self.pool.rate_limiter("key-2"), limiter)
+        self.assertIsNone(QuidaxClientPool().rate_limiter("key-1"))
+
+    def test_closing_a_client_keeps_the_shared_resources(self):
+        client = self.pool.client("key-1")
+        executor = client._get_executor()
+        client.close()
+        self.assertFalse(self.pool.http_client.is_closed)
+        self.assertIs(self.pool.client("key-2")._get_executor(), executor)
+
+
+class AsyncQuidaxClientPoolTestCase(IsolatedAsyncioTestCase):
+    async def test_clients_share_the_connections_of_the_loop(self):
+        transport = RecordingTransport()
+        async with AsyncQuidaxClientPool() as pool:
+            pool._create_http_client = lambda: httpx.AsyncClient(
+                transport=httpx.MockTransport(transport)
+            )
+            first, second = pool.client("key-1"), pool.client("key-2")
+            await first.markets.all()
+            await second.orders.get("1")
+            self.assertIs(first.markets.http_client, second.orders.http_client)
+        self.assertEqual(
+            [request.headers["authorization"] for request in transport.requests],
+            ["Bearer key-1", "Bearer key-2"],
+        )
@@ -0,0 +1,121 @@
+import asyncio
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from pyquidax.clients.orders import AsyncOrderClient, OrderClient, OrderRequest
+from pyquidax.exceptions import APIResponseException, InvalidOrderException
+from pyquidax.rate_limit import RateLimiter
+from pyquidax.utils import CurrencyPair, OrderType
+from tests.utils import MockedAPICallTestCase, MockedAsyncAPICallTestCase
+
+
+def ladder(levels=3):
+    return [
+        OrderRequest(CurrencyPair.BTC_NGN, OrderType.BUY, volume=1, price=100 - level)
+        for level in range(levels)
+    ]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RateLimiterTestCase(TestCase):
+    def test_bursts_are_allowed_then_requests_are_spaced(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rate=2, period=1, clock=clock)
+        self.assertEqual([limiter.reserve() for _ in range(4)], [0, 0, 0.5, 1.0])
+        clock.now = 2.0
+        self.assertEqual(limiter.reserve(), 0)
+
+
+class OrderRequestTestCase(TestCase):
+    def test_invalid_orders_are_reported(self):
+        order = OrderRequest("nope", "hold", volume=0)
+        self.assertEqual(len(order.errors()), 4)
+        market = OrderRequest(
+            CurrencyPair.BTC_NGN, OrderType.SELL, 1, ord_type="market"
+        )
+        self.assertEqual(market.errors(), [])
+        self.assertEqual(
+            OrderRequest(CurrencyPair.BTC_NGN, OrderType.BUY, "abc", "1e").errors(),
+            ["invalid volume 'abc'", "invalid price '1e'"],
+        )
+
+
+class CreateManyTestCase(MockedAPICallTestCase):
+    def setUp(self) -> None:
+        self.client = OrderClient(self.secret_key)
+
+    def tearDown(self) -> None:
+        self.client.close()
+
+    def test_every_order_is_placed(self):
+        with patch.object(self.client, "create", wraps=self.client.create) as create:
+            results = self.client.create_many(ladder())
+        self.assertTrue(all(result.ok for result in results))
+        prices = sorted(call.kwargs["price"] for call in create.call_args_list)
+        self.assertEqual(prices, [98, 99, 100])
+
+    def test_orders_can_be_dicts(self):
+        results = self.client.create_many(
+            [{"pair": "btcngn", "type": "sell", "volume": 1, "price": 5}]
+        )
+        self.assertTrue(results[0].ok)
+
+    def test_malformed_orders_are_reported_per_order(self):
+        orders = ladder() + [
+            {"pair": "btcngn", "type": "buy", "volume": 1, "price": 5, "side": "x"},
+            {"pair": "btcngn", "type": "buy", "volume": "lots", "price": 5},
+        ]
+        with patch.object(self.client, "create") as create:
+            with self.assertRaises(InvalidOrderException) as context:
+                self.client.create_many(orders)
+        create.assert_not_called()
+        self.assertEqual(sorted(context.exception.errors), [3, 4])
+        self.assertEqual(context.exception.errors[4], ["invalid volume 'lots'"])
+
+    def test_nothing_is_placed_if_an_order_is_invalid(self):
+        orders = ladder() + [OrderRequest(CurrencyPair.BTC_NGN, OrderType.BUY, 1)]
+        with patch.object(self.client, "create") as create:
+            with self.assertRaises(InvalidOrderException) as context:
+                self.client.create_many(orders)
+        create.assert_not_called()
+        self.assertEqual(list(context.exception.errors), [3])
+
+    def test_rejected_orders_are_reported_per_order(self):
+        rejected = Mock(status_code=422)
+        rejected.json.return_value = {"status": "error", "message": "Low balance"}
+
+        def post(url, json, headers):
+            return rejected if json["price"] == 99 else self.mocked_api_response
+
+        with patch("httpx.Client.post", side_effect=post):
+            results = self.client.create_many(ladder())
+        self.assertEqual([result.ok for result in results], [True, False, True])
+        self.assertIsInstance(results[1].error, APIResponseException)
+        self.assertEqual(results[1].error.response.message, "Low balance")
+
+
+class AsyncCreateManyTestCase(MockedAsyncAPICallTestCase):
+    async def test_orders_are_placed_concurrently(self):
+        client = AsyncOrderClient(self.secret_key)
+        response = Mock(status_code=201)
+        in_flight = []
+        peak = []
+
+        async def create(**kwargs):
+            in_flight.append(kwargs)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(kwargs)
+            return response
+
+        with patch.object(client, "create", side_effect=create):
+            results = await client.create_many(ladder(5), max_concurrency=5)
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual(max(peak), 5)
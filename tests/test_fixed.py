@@ -0,0 +1,94 @@
+import json
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import patch
+
+from pyquidax.clients.orders import OrderClient
+from pyquidax.fixed import Fixed, parse_fixed
+from pyquidax.order_lane import OrderLane
+from pyquidax.registry import MarketInfo, MarketRegistry
+from pyquidax.utils import CurrencyPair, OrderType, parse_amount
+from tests.utils import MockedAPICallTestCase
+
+
+class FixedTestCase(TestCase):
+    def test_strings_are_parsed_exactly(self):
+        self.assertEqual(repr(parse_fixed("0.00120000")), "Fixed(120000, 8)")
+        self.assertEqual(str(parse_fixed("-12.5")), "-12.5")
+        self.assertEqual(str(parse_fixed("3", 2)), "3.00")
+        self.assertEqual(str(parse_fixed(".5")), "0.5")
+        self.assertEqual(str(parse_fixed(" 2.50 ")), "2.50")
+        self.assertEqual(str(parse_fixed("1e-5")), "0.00001")
+
+    def test_extra_places_are_rounded_half_to_even(self):
+        self.assertEqual(str(parse_fixed("1.005", 2)), "1.00")
+        self.assertEqual(str(parse_fixed("1.015", 2)), "1.02")
+        self.assertEqual(str(parse_fixed("-2.5", 0)), "-2")
+
+    def test_invalid_strings_are_rejected(self):
+        for text in ("", "-", ".", "1.2.3", "abc", "nan", ".-5", "1_000", "1e", "١"):
+            with self.assertRaises(ValueError):
+                parse_fixed(text)
+
+    def test_values_are_converted(self):
+        self.assertEqual(Fixed.parse(0.1), Fixed(1, 1))
+        self.assertEqual(Fixed.parse(Decimal("1E+2")), 100)
+        self.assertEqual(str(Fixed.parse({"unit": "btc", "amount": "3"}, 2)), "3.00")
+        with self.assertRaises(ValueError):
+            Fixed.parse(None)
+
+    def test_arithmetic_is_exact(self):
+        price, volume = parse_fixed("0.1"), parse_fixed("0.2")
+        self.assertEqual(price + volume, parse_fixed("0.3"))
+        self.assertEqual(
+            str(parse_fixed("20000000.00") * parse_fixed("0.0015")), "30000.000000"
+        )
+        self.assertEqual(str(parse_fixed("10").divide(3, 4)), "3.3333")
+        self.assertEqual(str(1 - price), "0.9")
+        self.assertEqual(str(-price * 3), "-0.3")
+
+    def test_comparisons_and_hashes_ignore_places(self):
+        self.assertEqual(Fixed(100, 2), 1)
+        self.assertEqual(hash(Fixed(100, 2)), hash(1))
+        self.assertLess(parse_fixed("0.09"), parse_fixed("0.1"))
+        self.assertEqual(len({Fixed(1, 0), Fixed(10, 1)}), 1)
+        self.assertEqual(int(Fixed(-150, 2)), -1)
+        self.assertEqual(float(Fixed(15, 1)), 1.5)
+        self.assertEqual(parse_amount(Fixed(15, 1)), 1.5)
+
+
+class FixedOrdersTestCase(MockedAPICallTestCase):
+    def test_orders_send_fixed_amounts_as_strings(self):
+        client = OrderClient(self.secret_key)
+        with patch.object(client, "_api_call") as api_call:
+            client.create(
+                CurrencyPair.BTC_NGN, OrderType.BUY, parse_fixed("100.50"), Fixed(5, 3)
+            )
+        data = api_call.call_args.kwargs["data"]
+        self.assertEqual((data["price"], data["volume"]), ("100.50", "0.005"))
+        client.close()
+
+    def test_registry_rounds_fixed_amounts(self):
+        registry = MarketRegistry(
+            [
+                MarketInfo(
+                    "btcngn", "btc", "ngn", tick_size=Decimal("0.5"), volume_precision=2
+                )
+            ]
+        )
+        market = registry.get("btcngn")
+        self.assertEqual((market.price_places, market.volume_places), (1, 2))
+        self.assertEqual(repr(market.parse_price("10.25")), "Fixed(102, 1)")
+        price, volume = registry.prepare_order(
+            "btcngn", OrderType.SELL, parse_fixed("10.2"), parse_fixed("1.239")
+        )
+        self.assertEqual((str(price), str(volume)), ("10.5", "1.230"))
+
+    def test_order_lane_encodes_fixed_amounts(self):
+        lane = OrderLane(self.secret_key)
+        body = lane.bind(CurrencyPair.BTC_NGN, OrderType.BUY).body(
+            Fixed(1005, 1), Fixed(1, 2)
+        )
+        self.assertEqual(json.loads(body)["price"], 100.5)
+        self.assertIn(b'"volume":0.01', body)
+        lane.close()
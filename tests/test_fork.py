@@ -0,0 +1,137 @@
+import json
+import os
+import pickle
+from unittest import IsolatedAsyncioTestCase, TestCase, skipUnless
+
+import httpx
+
+from pyquidax.base import BaseAPIWrapper, register_fork_factory
+from pyquidax.client_pool import QuidaxClientPool
+from pyquidax.quidax import AsyncQuidaxClient, QuidaxClient
+from pyquidax.registry import MarketInfo, MarketRegistry
+
+
+def in_child(check) -> dict:
+    """Runs `check` in a forked process and returns the dict it returned."""
+    read_end, write_end = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_end)
+        try:
+            result = check()
+        except BaseException as error:
+            result = {"error": repr(error)}
+        with os.fdopen(write_end, "w") as pipe:
+            json.dump(result, pipe)
+        os._exit(0)
+    os.close(write_end)
+    with os.fdopen(read_end) as pipe:
+        result = json.load(pipe)
+    os.waitpid(pid, 0)
+    return result
+
+
+@skipUnless(hasattr(os, "fork"), "requires os.fork")
+class ForkTestCase(TestCase):
+    def test_clients_replace_inherited_connections_and_threads(self):
+        client = QuidaxClient("qwerty")
+        self.addCleanup(client.close)
+        http_client, executor = client.http_client, client._get_executor()
+        executor.submit(lambda: None).result()
+
+        def check():
+            return {
+                "http_client": client.http_client is not http_client,
+                "shared": client.orders.http_client is client.http_client,
+                "executor": client._get_executor() is not executor,
+                "batch": client.batch([lambda: 1])[0].value,
+            }
+
+        self.assertEqual(
+            in_child(check),
+            {"http_client": True, "shared": True, "executor": True, "batch": 1},
+        )
+        self.assertIs(client.http_client, http_client)
+        self.assertIs(client._get_executor(), executor)
+
+    def test_pool_clients_keep_sharing_the_pool_settings(self):
+        pool = QuidaxClientPool(max_connections=7)
+        self.addCleanup(pool.close)
+        first, second = pool.client("key-1"), pool.client("key-2")
+        inherited = pool.http_client
+
+        def check():
+            http_client = first.orders.http_client
+            return {
+                "replaced": http_client is not inherited,
+                "shared": http_client is second.markets.http_client
+                and http_client is pool.http_client,
+                "cookies": http_client.cookies.jar._policy.allowed_domains(),
+            }
+
+        self.assertEqual(
+            in_child(check),
+            {"replaced": True, "shared": True, "cookies": []},
+        )
+
+    def test_injected_clients_need_a_fork_factory(self):
+        http_client = httpx.Client()
+        self.addCleanup(http_client.close)
+        wrapper = BaseAPIWrapper("qwerty", http_client)
+
+        def check():
+            try:
+                wrapper.http_client
+            except Exception as error:
+                raised = type(error).__name__
+            wrapper.close()
+            return {"raised": raised}
+
+        self.assertEqual(in_child(check), {"raised": "ForkException"})
+
+    def test_injected_clients_are_recreated_by_their_factory_and_closed(self):
+        http_client = httpx.Client(headers={"x-test": "1"})
+        self.addCleanup(http_client.close)
+        register_fork_factory(
+            http_client, lambda: httpx.Client(headers={"x-test": "2"})
+        )
+        wrapper = BaseAPIWrapper("qwerty", http_client)
+
+        def check():
+            replacement = wrapper.http_client
+            wrapper.close()
+            return {
+                "header": replacement.headers["x-test"],
+                "closed": replacement.is_closed,
+            }
+
+        self.assertEqual(in_child(check), {"header": "2", "closed": True})
+        self.assertFalse(http_client.is_closed)
+
+
+class ClientConfigTestCase(TestCase):
+    def setUp(self) -> None:
+        self.registry = MarketRegistry([MarketInfo("btcngn", "btc", "ngn")])
+
+    def test_clients_are_rebuilt_from_their_pickled_config(self):
+        client = QuidaxClient("qwerty", max_workers=3, market_registry=self.registry)
+        self.addCleanup(client.close)
+        config = pickle.loads(pickle.dumps(client.config))
+        self.assertEqual((config.secret_key, config.max_workers), ("qwerty", 3))
+        rebuilt = pickle.loads(pickle.dumps(client))
+        self.addCleanup(rebuilt.close)
+        self.assertIsInstance(rebuilt, QuidaxClient)
+        self.assertEqual(rebuilt.headers, client.headers)
+        self.assertEqual(rebuilt.max_workers, 3)
+        self.assertIn("btcngn", rebuilt.orders.registry)
+        self.assertEqual(rebuilt.orders.registry.pair("btcngn").id, 0)
+
+
+class AsyncClientConfigTestCase(IsolatedAsyncioTestCase):
+    async def test_async_clients_are_pickled_by_config(self):
+        client = AsyncQuidaxClient("qwerty", max_concurrency=4)
+        rebuilt = pickle.loads(pickle.dumps(client))
+        self.assertIsInstance(rebuilt, AsyncQuidaxClient)
+        self.assertEqual(
+            (rebuilt.max_concurrency, rebuilt.headers), (4, client.headers)
+        )
@@ -0,0 +1,127 @@
+import math
+import random
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from pyquidax import indicators
+
+from pyquidax.indicators import (
+    ATR,
+    BollingerBands,
+    EMA,
+    atr,
+    bollinger_bands,
+    columns,
+    ema,
+    vwap,
+)
+from pyquidax.utils import APIResponse
+
+
+class IndicatorsTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.k_line = columns(
+            APIResponse(
+                status_code=200,
+                status="success",
+                message=None,
+                data=[
+                    [60, "10", "12", "9", "11", "1"],
+                    [120, "11", "13", "10", "12", "2"],
+                    [180, "12", "12", "8", "9", "1"],
+                ],
+            )
+        )
+
+    def test_columns(self):
+        self.assertEqual(list(self.k_line.timestamp), [60, 120, 180])
+        self.assertEqual(list(self.k_line.close), [11.0, 12.0, 9.0])
+
+    def test_ema(self):
+        self.assertEqual(list(ema(self.k_line.close, span=3)), [11.0, 11.5, 10.25])
+
+    def test_vwap(self):
+        values = vwap(
+            self.k_line.high, self.k_line.low, self.k_line.close, self.k_line.volume
+        )
+        self.assertAlmostEqual(values[1], (32 / 3 * 1 + 35 / 3 * 2) / 3)
+
+    def test_atr(self):
+        values = atr(self.k_line.high, self.k_line.low, self.k_line.close, period=2)
+        self.assertTrue(math.isnan(values[0]))
+        self.assertEqual(values[1], (3 + 3) / 2)
+        self.assertEqual(values[2], 3 + (4 - 3) / 2)
+
+    def test_bollinger_bands(self):
+        middle, upper, lower = bollinger_bands([1, 3, 5, 7], period=2, deviations=1)
+        self.assertTrue(math.isnan(middle[0]))
+        self.assertEqual(list(middle[1:]), [2, 4, 6])
+        self.assertEqual(list(upper[1:]), [3, 5, 7])
+        self.assertEqual(list(lower[1:]), [1, 3, 5])
+
+    def test_streaming_updates_match_batch(self):
+        closes = [11.0, 12.0, 9.0, 10.0, 14.0]
+        average, bands = EMA(span=3), BollingerBands(period=3)
+        streamed = [(average.update(c), bands.update(c)[0]) for c in closes]
+        self.assertEqual([e for e, _ in streamed], list(ema(closes, span=3)))
+        self.assertEqual(streamed[-1][1], bollinger_bands(closes, period=3)[0][-1])
+
+        true_range = ATR(period=2)
+        for candle in zip(self.k_line.high, self.k_line.low, self.k_line.close):
+            value = true_range.update(*candle)
+        self.assertEqual(value, true_range.value)
+
+    def test_bands_of_large_prices_keep_their_variance(self):
+        bands = BollingerBands(period=2, deviations=1)
+        for value in [1e9, 1e9 + 2] * 1000:
+            middle, upper, _ = bands.update(value)
+        self.assertEqual(middle, 1e9 + 1)
+        self.assertAlmostEqual(upper - middle, 1.0, places=6)
+
+
+@skipIf(indicators.numpy is None, "numpy is not installed")
+class VectorizedIndicatorsTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        generator = random.Random(7)
+        close = [100.0]
+        for _ in range(4999):
+            close.append(close[-1] * (1 + generator.gauss(0, 0.01)))
+        cls.close = close
+        cls.high = [value * (1 + generator.random() / 100) for value in close]
+        cls.low = [value * (1 - generator.random() / 100) for value in close]
+        cls.volume = [generator.random() * 10 for _ in close]
+
+    def assertColumnsAlmostEqual(self, first, second):
+        self.assertEqual(len(first), len(second))
+        for a, b in zip(first, second):
+            if math.isnan(b):
+                self.assertTrue(math.isnan(a))
+            else:
+                self.assertAlmostEqual(a, b, delta=1e-9 * abs(b))
+
+    def compare(self, function, *args, **kwargs):
+        vectorized = function(*args, **kwargs)
+        with patch.object(indicators, "numpy", None):
+            expected = function(*args, **kwargs)
+        if isinstance(expected, tuple):
+            for first, second in zip(vectorized, expected):
+                self.assertColumnsAlmostEqual(first, second)
+        else:
+            self.assertColumnsAlmostEqual(vectorized, expected)
+
+    def test_ema(self):
+        for span in (1, 3, 20, 200):
+            self.compare(ema, self.close, span=span)
+
+    def test_vwap(self):
+        self.compare(vwap, self.high, self.low, self.close, [0.0] * 10 + self.volume)
+
+    def test_atr(self):
+        for period in (1, 14, 100):
+            self.compare(atr, self.high, self.low, self.close, period=period)
+
+    def test_bollinger_bands(self):
+        for period in (1, 20):
+            self.compare(bollinger_bands, self.close, period=period)
@@ -0,0 +1,126 @@
+from unittest.mock import patch
+
+from pyquidax.clients.instant_orders import (
+    AsyncInstantOrderClient,
+    InstantOrderClient,
+)
+from pyquidax.exceptions import (
+    APIResponseException,
+    QuoteDeadlineExceededException,
+    SlippageExceededException,
+)
+from pyquidax.utils import APIResponse, Currency, OrderType
+from tests.utils import MockedAPICallTestCase, MockedAsyncAPICallTestCase
+
+
+def response(status_code=200, **data):
+    return APIResponse(status_code=status_code, status=None, message=None, data=data)
+
+
+def expired():
+    return APIResponse(422, "error", "Quote has expired, requote the order", None)
+
+
+def quote(price):
+    return response(id="1", price={"unit": "ngn", "amount": str(price)})
+
+
+class ExecuteTestCase(MockedAPICallTestCase):
+    def setUp(self) -> None:
+        self.client = InstantOrderClient(self.secret_key)
+
+    def tearDown(self) -> None:
+        self.client.close()
+
+    def execute(self, type=OrderType.BUY, **kwargs):
+        return self.client.execute(
+            Currency.NAIRA, Currency.BITCOIN, type, 1, "ngn", **kwargs
+        )
+
+    def test_valid_quotes_are_confirmed_without_requote(self):
+        confirmed = response(state="done")
+        with patch.object(self.client, "create", return_value=quote(100)), patch.object(
+            self.client, "confirm", return_value=confirmed
+        ) as confirm, patch.object(self.client, "requote") as requote:
+            self.assertIs(self.execute(), confirmed)
+        confirm.assert_called_once_with("1", "me")
+        requote.assert_not_called()
+
+    def test_expired_quotes_are_requoted(self):
+        with patch.object(self.client, "create", return_value=quote(100)), patch.object(
+            self.client, "confirm", side_effect=[expired(), response(state="done")]
+        ), patch.object(self.client, "requote", return_value=quote(100.5)) as requote:
+            self.assertEqual(self.execute().data, {"state": "done"})
+        requote.assert_called_once_with("1", "me")
+
+    def test_requotes_beyond_the_slippage_are_rejected(self):
+        with patch.object(self.client, "create", return_value=quote(100)), patch.object(
+            self.client, "confirm", return_value=expired()
+        ), patch.object(self.client, "requote", return_value=quote(90)):
+            with self.assertRaises(SlippageExceededException) as raised:
+                self.execute(type=OrderType.SELL, max_slippage=0.05)
+        self.assertEqual(raised.exception.order_id, "1")
+
+    def test_favourable_requotes_are_accepted(self):
+        with patch.object(self.client, "create", return_value=quote(100)), patch.object(
+            self.client, "confirm", side_effect=[expired(), response(state="done")]
+        ), patch.object(self.client, "requote", return_value=quote(90)):
+            self.assertEqual(self.execute(max_slippage=0).data, {"state": "done"})
+
+    def test_failures_are_raised(self):
+        with patch.object(self.client, "create", return_value=response(400)):
+            with self.assertRaises(APIResponseException):
+                self.execute()
+
+    def test_other_confirmation_failures_are_raised_without_requote(self):
+        with patch.object(self.client, "create", return_value=quote(100)), patch.object(
+            self.client,
+            "confirm",
+            return_value=response(422, error="Insufficient funds"),
+        ), patch.object(self.client, "requote") as requote:
+            with self.assertRaises(APIResponseException):
+                self.execute()
+        requote.assert_not_called()
+
+    def test_quotes_without_a_price_are_rejected(self):
+        with patch.object(self.client, "create", return_value=response(id="1")):
+            with self.assertRaises(APIResponseException):
+                self.execute()
+        with patch.object(self.client, "create", return_value=quote(100)), patch.object(
+            self.client, "confirm", return_value=expired()
+        ), patch.object(self.client, "requote", return_value=response(id="1")):
+            with self.assertRaises(APIResponseException):
+                self.execute()
+
+    def test_deadline(self):
+        with patch.object(self.client, "create", return_value=quote(100)), patch.object(
+            self.client, "confirm", return_value=expired()
+        ), patch.object(self.client, "requote") as requote:
+            with self.assertRaises(QuoteDeadlineExceededException) as raised:
+                self.execute(deadline=0)
+        requote.assert_not_called()
+        self.assertIsInstance(raised.exception, TimeoutError)
+        self.assertEqual(raised.exception.order_id, "1")
+
+
+class AsyncExecuteTestCase(MockedAsyncAPICallTestCase):
+    async def test_expired_quotes_are_requoted(self):
+        client = AsyncInstantOrderClient(self.secret_key)
+        confirmations = iter([expired(), response(state="done")])
+
+        async def create(*args, **kwargs):
+            return quote(100)
+
+        async def confirm(*args):
+            return next(confirmations)
+
+        async def requote(*args):
+            return quote(99)
+
+        with patch.object(client, "create", side_effect=create), patch.object(
+            client, "confirm", side_effect=confirm
+        ), patch.object(client, "requote", side_effect=requote):
+            result = await client.execute(
+                Currency.NAIRA, Currency.BITCOIN, OrderType.BUY, 1, "ngn"
+            )
+        self.assertEqual(result.data, {"state": "done"})
@@ -0,0 +1,112 @@
+import json
+import time
+from contextlib import nullcontext
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import patch
+
+import httpx
+
+from pyquidax.clients.trades import TradeClient
+from pyquidax.exceptions import APIResponseException
+from pyquidax.json_stream import JSONArrayParser, aiter_json_items, iter_json_items
+
+DOCUMENT = json.dumps(
+    {
+        "status": "success",
+        "message": "Successful",
+        "data": [
+            {"id": 1, "price": {"amount": "1.5"}, "note": "naïra ₦"},
+            12345,
+            [1, [2, "]"]],
+            None,
+            True,
+            "a, b",
+        ],
+        "meta": {"total": 6},
+    }
+).encode()
+
+
+def split(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class JSONArrayParserTestCase(TestCase):
+    def test_items_are_parsed_whatever_the_chunk_size(self):
+        expected = json.loads(DOCUMENT)["data"]
+        for size in (1, 2, 7, 64, len(DOCUMENT)):
+            self.assertEqual(list(iter_json_items(split(DOCUMENT, size))), expected)
+
+    def test_items_are_yielded_as_soon_as_they_are_complete(self):
+        parser = JSONArrayParser()
+        self.assertEqual(parser.feed('{"status": "success", "data": [{"id": 1}'), [])
+        self.assertEqual(parser.feed(', {"id": 2}, 3'), [{"id": 1}, {"id": 2}])
+        self.assertEqual(parser.feed("4]"), [34])
+        parser.feed("}")
+        parser.close()
+        self.assertEqual(parser.fields, {"status": "success"})
+
+    def test_other_fields_are_kept(self):
+        parser = JSONArrayParser()
+        parser.feed(DOCUMENT.decode())
+        self.assertEqual(
+            parser.fields,
+            {"status": "success", "message": "Successful", "meta": {"total": 6}},
+        )
+
+    def test_missing_or_empty_arrays_yield_nothing(self):
+        for document in (b'{"data": []}', b'{"data": null}', b"{}"):
+            self.assertEqual(list(iter_json_items([document])), [])
+
+    def test_invalid_documents_raise(self):
+        for document in (b"[1, 2]", b'{"data": [1 2]}', b'{"data": [1]} x'):
+            with self.assertRaises(json.JSONDecodeError):
+                list(iter_json_items([document]))
+
+    def test_large_parts_are_parsed_in_linear_time(self):
+        items = [
+            {"id": i, "price": "20000000.00", "volume": "0.0015"} for i in range(32_000)
+        ]
+        parser = JSONArrayParser()
+        started = time.perf_counter()
+        parsed = parser.feed(json.dumps({"status": "success", "data": items}))
+        elapsed = time.perf_counter() - started
+        parser.close()
+        self.assertEqual(parsed, items)
+        self.assertLess(elapsed, 2)
+
+    def test_truncated_documents_raise(self):
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_items([DOCUMENT[:-10]]))
+
+
+class StreamAPICallTestCase(TestCase):
+    def test_client_streams_items(self):
+        response = httpx.Response(200, content=iter(split(DOCUMENT, 16)))
+        with patch(
+            "httpx.Client.stream", return_value=nullcontext(response)
+        ) as mock_stream:
+            trades = list(TradeClient("qwerty").stream_all("me", per_page=6))
+        self.assertEqual(trades, json.loads(DOCUMENT)["data"])
+        method, *_ = mock_stream.call_args.args
+        self.assertEqual(method, "GET")
+        self.assertTrue(mock_stream.call_args.kwargs["url"].endswith("per_page=6"))
+
+    def test_failed_requests_raise(self):
+        response = httpx.Response(
+            401, content=iter([b'{"status": "error", "message": "Unauthorized"}'])
+        )
+        with patch("httpx.Client.stream", return_value=nullcontext(response)):
+            with self.assertRaises(APIResponseException) as context:
+                list(TradeClient("qwerty").stream_all("me"))
+        self.assertEqual(context.exception.response.message, "Unauthorized")
+
+
+class AsyncJSONArrayParserTestCase(IsolatedAsyncioTestCase):
+    async def test_items_are_parsed_from_async_chunks(self):
+        async def chunks():
+            for chunk in split(DOCUMENT, 5):
+                yield chunk
+
+        items = [item async for item in aiter_json_items(chunks())]
+        self.assertEqual(items, json.loads(DOCUMENT)["data"])
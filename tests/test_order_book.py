@@ -0,0 +1,78 @@
+from unittest import TestCase
+
+from pyquidax.order_book import OrderBookDiffer, OrderBookSnapshot, parse_levels
+from pyquidax.utils import APIResponse, CurrencyPair
+
+
+class OrderBookDifferTestCase(TestCase):
+    def setUp(self) -> None:
+        self.differ = OrderBookDiffer()
+        self.pair = CurrencyPair.BTC_NGN
+
+    def test_parse_levels_aggregates_orders_by_price(self):
+        levels = parse_levels(
+            [
+                {
+                    "price": {"unit": "ngn", "amount": "100.0"},
+                    "volume": {"amount": "1"},
+                },
+                {
+                    "price": {"unit": "ngn", "amount": "100.0"},
+                    "volume": {"amount": "2"},
+                },
+                ["101.5", "0.5"],
+            ]
+        )
+        self.assertDictEqual(levels, {100.0: 3.0, 101.5: 0.5})
+
+    def test_first_snapshot_yields_every_level(self):
+        delta = self.differ.update(
+            self.pair, {"bids": [["99", "1"]], "asks": [["101", "2"]]}
+        )
+        self.assertEqual(delta.bids, [(99.0, 1.0)])
+        self.assertEqual(delta.asks, [(101.0, 2.0)])
+
+    def test_update_yields_only_changed_levels(self):
+        self.differ.update(
+            self.pair,
+            {"bids": [["99", "1"], ["98", "1"]], "asks": [["101", "2"], ["102", "1"]]},
+        )
+        delta = self.differ.update(
+            self.pair,
+            APIResponse(
+                status_code=200,
+                status="success",
+                message=None,
+                data={
+                    "bids": [["99", "1"], ["97", "4"]],
+                    "asks": [["101", "3"], ["102", "1"]],
+                },
+            ),
+        )
+        self.assertEqual(delta.bids, [(97.0, 4.0), (98.0, None)])
+        self.assertEqual(delta.asks, [(101.0, 3.0)])
+
+    def test_levels_without_a_volume_are_skipped(self):
+        book = {"bids": [["99", None], ["98", "1"]], "asks": [["101", "0"]]}
+        first = self.differ.update(self.pair, book)
+        self.assertEqual(first.bids, [(98.0, 1.0)])
+        self.assertEqual(first.asks, [])
+        self.assertFalse(self.differ.update(self.pair, book))
+
+    def test_levels_emptied_are_removed(self):
+        self.differ.update(self.pair, {"bids": [["99", "1"]]})
+        delta = self.differ.update(self.pair, {"bids": [["99", "0"]]})
+        self.assertEqual(delta.bids, [(99.0, None)])
+
+    def test_diff_skips_unchanged_snapshots(self):
+        book = {"bids": [["99", "1"]], "asks": [["101", "2"]]}
+        deltas = list(self.differ.diff(self.pair, [book, book, book]))
+        self.assertEqual(len(deltas), 1)
+
+    def test_delta_applied_to_previous_snapshot_yields_current(self):
+        previous = {"bids": [["99", "1"], ["98", "1"]], "asks": [["101", "2"]]}
+        current = {"bids": [["99", "2"]], "asks": [["101", "2"], ["103", "1"]]}
+        self.differ.update(self.pair, previous)
+        delta = self.differ.update(self.pair, current)
+        rebuilt = delta.apply(OrderBookSnapshot.from_response(self.pair, previous))
+        self.assertEqual(rebuilt, OrderBookSnapshot.from_response(self.pair, current))
@@ -0,0 +1,85 @@
+import json
+from decimal import Decimal
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+import httpx
+
+from pyquidax.order_lane import AsyncOrderLane, OrderLane
+from pyquidax.utils import CurrencyPair, OrderType
+
+
+class RecordingTransport:
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(201, json={"status": "success", "data": {"id": "1"}})
+
+
+class OrderLaneTestCase(TestCase):
+    def setUp(self) -> None:
+        self.transport = RecordingTransport()
+        self.lane = OrderLane("qwerty")
+        self.lane._http_client = httpx.Client(
+            transport=httpx.MockTransport(self.transport),
+            headers=self.lane._lane_headers,
+        )
+
+    def tearDown(self) -> None:
+        self.lane.close()
+
+    def test_orders_are_sent_like_order_client_create(self):
+        buy = self.lane.bind(CurrencyPair.BTC_NGN, OrderType.BUY)
+        response = buy.submit(price=100, volume=Decimal("0.5"))
+        self.assertEqual(response.status_code, 201)
+        (request,) = self.transport.requests
+        self.assertEqual(
+            str(request.url), "https://www.quidax.com/api/v1/users/me/orders"
+        )
+        self.assertEqual(request.headers["authorization"], "Bearer qwerty")
+        self.assertEqual(request.headers["content-type"], "application/json")
+        self.assertEqual(
+            json.loads(request.content),
+            {
+                "market": "btcngn",
+                "side": "buy",
+                "ord_type": "limit",
+                "price": 100,
+                "volume": 0.5,
+            },
+        )
+
+    def test_market_orders_have_no_price(self):
+        self.lane.create(CurrencyPair.ETH_NGN, OrderType.SELL, None, 1.25, "market")
+        body = json.loads(self.transport.requests[0].content)
+        self.assertNotIn("price", body)
+        self.assertEqual(body["volume"], 1.25)
+
+    def test_tickets_are_reused(self):
+        self.assertIs(
+            self.lane.bind(CurrencyPair.BTC_NGN, OrderType.BUY),
+            self.lane.bind("btcngn", "buy"),
+        )
+
+    def test_invalid_numbers_are_rejected(self):
+        ticket = self.lane.bind(CurrencyPair.BTC_NGN, OrderType.BUY)
+        with self.assertRaises(ValueError):
+            ticket.body(float("nan"), 1)
+        with self.assertRaises(TypeError):
+            ticket.body(True, 1)
+        self.assertEqual(json.loads(ticket.body("1.5", 2))["price"], "1.5")
+
+
+class AsyncOrderLaneTestCase(IsolatedAsyncioTestCase):
+    async def test_orders_are_sent(self):
+        transport = RecordingTransport()
+        async with AsyncOrderLane("qwerty", user_id="42") as lane:
+            lane._http_client = httpx.AsyncClient(
+                transport=httpx.MockTransport(transport), headers=lane._lane_headers
+            )
+            response = await lane.create(CurrencyPair.BTC_NGN, OrderType.BUY, 10, 2)
+        self.assertEqual(response.data, {"id": "1"})
+        (request,) = transport.requests
+        self.assertTrue(str(request.url).endswith("/users/42/orders"))
+        self.assertEqual(json.loads(request.content)["price"], 10)
@@ -0,0 +1,144 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pyquidax.order_tracker import AsyncOrderTracker, OrderTracker
+from pyquidax.utils import APIResponse, CurrencyPair
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeOrders:
+    def __init__(self, orders):
+        self.orders = orders
+        self.listed = []
+        self.fetched = []
+
+    def _open(self, pair):
+        return [
+            order
+            for order in self.orders.values()
+            if order["market"]["id"] == pair and order["state"] == "wait"
+        ]
+
+    def iter_all(self, pair, state, user_id="me", per_page=100):
+        self.listed.append(pair)
+        return iter(self._open(pair))
+
+    def get(self, id, user_id="me"):
+        self.fetched.append(id)
+        return APIResponse(
+            status_code=200, status="success", message=None, data=self.orders[id]
+        )
+
+
+class AsyncFakeOrders(FakeOrders):
+    def iter_all(self, pair, state, user_id="me", per_page=100):
+        self.listed.append(pair)
+        orders = self._open(pair)
+
+        async def iterate():
+            for order in orders:
+                yield order
+
+        return iterate()
+
+    async def get(self, id, user_id="me"):
+        return super().get(id, user_id)
+
+
+def order(id, state="wait", pair="btcngn"):
+    return {"id": id, "state": state, "market": {"id": pair}}
+
+
+class OrderTrackerTestCase(TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.orders = FakeOrders({str(i): order(str(i)) for i in range(5)})
+        self.tracker = OrderTracker(
+            self.orders, interval=1, max_interval=10, per_page=2, clock=self.clock
+        )
+        for i in range(5):
+            self.tracker.watch(str(i), CurrencyPair.BTC_NGN)
+
+    def test_orders_are_refreshed_by_listing_their_market(self):
+        self.orders.orders["1"]["state"] = "done"
+        self.orders.orders["2"]["state"] = "cancel"
+        self.clock.now = 1
+        events = self.tracker.poll()
+        self.assertEqual(self.orders.listed, ["btcngn"])
+        self.assertEqual(sorted(self.orders.fetched), ["1", "2"])
+        self.assertEqual(
+            sorted((event.order_id, event.state) for event in events),
+            [("1", "done"), ("2", "cancel")],
+        )
+        self.assertEqual(len(self.tracker), 3)
+        self.assertNotIn("1", self.tracker)
+
+    def test_orders_are_fetched_one_by_one_when_cheaper(self):
+        tracker = OrderTracker(self.orders, interval=1, clock=self.clock)
+        tracker.watch("0")
+        self.clock.now = 1
+        self.assertEqual(tracker.poll(), [])
+        self.assertEqual(self.orders.fetched, ["0"])
+        self.assertEqual(self.orders.listed, [])
+
+    def test_listing_costs_count_unwatched_open_orders(self):
+        for i in range(20):
+            self.orders.orders[f"other-{i}"] = order(f"other-{i}")
+        self.clock.now = 1
+        self.tracker.poll()
+        self.assertEqual(self.orders.listed, ["btcngn"])
+        self.orders.listed.clear()
+        self.clock.now = 3
+        self.tracker.poll()
+        self.assertEqual(self.orders.listed, [])
+        self.assertEqual(sorted(self.orders.fetched), [str(i) for i in range(5)])
+
+    def test_orders_are_polled_less_often_as_they_age(self):
+        self.clock.now = 1
+        self.tracker.poll()
+        self.orders.listed.clear()
+        self.clock.now = 2
+        self.tracker.poll()
+        self.assertEqual(self.orders.listed, ["btcngn"])
+
+        self.orders.listed.clear()
+        self.tracker.watch("old", CurrencyPair.BTC_NGN, age=100)
+        self.orders.orders["old"] = order("old")
+        self.clock.now = 100
+        self.tracker.poll()
+        self.clock.now = 105
+        listings, gets = self.tracker._tracked.plan()
+        self.assertNotIn("old", listings.get("btcngn", []) + gets)
+
+    def test_subscribers_receive_events(self):
+        events = self.tracker.queue()
+        self.orders.orders["3"]["state"] = "done"
+        self.clock.now = 1
+        self.tracker.poll()
+        event = events.get_nowait()
+        self.assertEqual(
+            (event.order_id, event.previous_state, event.state), ("3", "wait", "done")
+        )
+
+
+class AsyncOrderTrackerTestCase(IsolatedAsyncioTestCase):
+    async def test_orders_are_refreshed(self):
+        clock = FakeClock()
+        orders = AsyncFakeOrders({str(i): order(str(i)) for i in range(3)})
+        tracker = AsyncOrderTracker(orders, interval=1, per_page=2, clock=clock)
+        for i in range(3):
+            tracker.watch(str(i), CurrencyPair.BTC_NGN)
+        tracker.watch("x")
+        orders.orders["x"] = order("x", state="done", pair="ethngn")
+        orders.orders["0"]["state"] = "done"
+        clock.now = 1
+        events = await tracker.poll()
+        self.assertEqual(orders.listed, ["btcngn"])
+        self.assertEqual(sorted(event.order_id for event in events), ["0", "x"])
+        self.assertEqual(len(tracker), 2)
@@ -0,0 +1,133 @@
+import threading
+from collections import defaultdict
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import Mock, patch
+
+from pyquidax.clients.deposits import DepositClient
+from pyquidax.exceptions import APIResponseException
+from pyquidax.pagination import apaginate, paginate
+from pyquidax.utils import APIResponse
+
+
+def page_response(items, status_code=200, meta=None):
+    return APIResponse(
+        status_code=status_code, status="success", message=None, data=items, meta=meta
+    )
+
+
+class FakePages:
+    def __init__(self, total, per_page, failing_page=None):
+        self.items = list(range(total))
+        self.per_page = per_page
+        self.failing_page = failing_page
+        self.requested = []
+        self.fetched = defaultdict(threading.Event)
+
+    def __call__(self, page):
+        self.requested.append(page)
+        if page == self.failing_page:
+            return page_response(None, status_code=500)
+        start = (page - 1) * self.per_page
+        self.fetched[page].set()
+        return page_response(self.items[start : start + self.per_page])
+
+
+class PaginateTestCase(TestCase):
+    def test_every_item_is_yielded_in_order(self):
+        pages = FakePages(total=25, per_page=10)
+        self.assertEqual(list(paginate(pages, per_page=10)), pages.items)
+        self.assertEqual(pages.requested, [1, 2, 3])
+
+    def test_a_full_last_page_is_followed_by_an_empty_one(self):
+        pages = FakePages(total=20, per_page=10)
+        self.assertEqual(list(paginate(pages, per_page=10)), pages.items)
+        self.assertEqual(pages.requested, [1, 2, 3])
+
+    def test_the_next_page_is_prefetched(self):
+        pages = FakePages(total=25, per_page=10)
+        items = paginate(pages, per_page=10)
+        self.assertEqual(next(items), 0)
+        self.assertTrue(pages.fetched[2].wait(timeout=5))
+        self.assertNotIn(3, pages.requested)
+        items.close()
+
+    def test_failed_pages_raise(self):
+        pages = FakePages(total=25, per_page=10, failing_page=2)
+        items = paginate(pages, per_page=10)
+        self.assertEqual([next(items) for _ in range(10)], list(range(10)))
+        with self.assertRaises(APIResponseException) as context:
+            next(items)
+        self.assertEqual(context.exception.response.status_code, 500)
+
+    def test_repeated_pages_end_iteration(self):
+        requested = []
+
+        def fetch_page(page):
+            requested.append(page)
+            return page_response([{"id": 1}, {"id": 2}])
+
+        self.assertEqual(list(paginate(fetch_page, per_page=2)), [{"id": 1}, {"id": 2}])
+        self.assertEqual(requested, [1, 2])
+
+    def test_pages_stop_at_max_pages(self):
+        pages = FakePages(total=100, per_page=10)
+        self.assertEqual(
+            list(paginate(pages, per_page=10, max_pages=3)), list(range(30))
+        )
+        self.assertEqual(pages.requested, [1, 2, 3])
+
+    def test_pagination_metadata_is_followed(self):
+        def fetch_page(page):
+            requested.append(page)
+            return page_response([page] * 10, meta={"total_pages": 2})
+
+        requested = []
+        self.assertEqual(len(list(paginate(fetch_page, per_page=5))), 20)
+        self.assertEqual(requested, [1, 2])
+
+        requested = []
+        items = paginate(lambda page: page_response([page], meta={"total": 3}), 1)
+        self.assertEqual(list(items), [1, 2, 3])
+
+    def test_client_iterators_request_successive_pages(self):
+        response = Mock(status_code=200)
+        response.json.side_effect = [
+            {"status": "success", "data": [{"id": 1}, {"id": 2}]},
+            {"status": "success", "data": [{"id": 3}]},
+        ]
+        with patch("httpx.Client.get", return_value=response) as mock_get:
+            deposits = list(DepositClient("qwerty").iter_all(per_page=2))
+        self.assertEqual([deposit["id"] for deposit in deposits], [1, 2, 3])
+        urls = sorted(call.kwargs["url"] for call in mock_get.call_args_list)
+        self.assertEqual(len(urls), 2)
+        self.assertIn("page=1&per_page=2", urls[0])
+        self.assertIn("page=2&per_page=2", urls[1])
+
+
+class AsyncPaginateTestCase(IsolatedAsyncioTestCase):
+    async def test_every_item_is_yielded_in_order(self):
+        pages = FakePages(total=25, per_page=10)
+
+        async def fetch_page(page):
+            return pages(page)
+
+        items = [item async for item in apaginate(fetch_page, per_page=10)]
+        self.assertEqual(items, pages.items)
+        self.assertEqual(pages.requested, [1, 2, 3])
+
+    async def test_failed_pages_raise(self):
+        pages = FakePages(total=25, per_page=10, failing_page=1)
+
+        async def fetch_page(page):
+            return pages(page)
+
+        with self.assertRaises(APIResponseException):
+            async for _ in apaginate(fetch_page, per_page=10):
+                pass
+
+    async def test_repeated_pages_end_iteration(self):
+        async def fetch_page(page):
+            return page_response([{"id": 1}, {"id": 2}])
+
+        items = [item async for item in apaginate(fetch_page, per_page=2)]
+        self.assertEqual(items, [{"id": 1}, {"id": 2}])
@@ -0,0 +1,256 @@
+import os
+import pickle
+import tempfile
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import patch
+
+from pyquidax.clients.instant_orders import InstantOrderClient
+from pyquidax.clients.orders import OrderClient, OrderRequest
+from pyquidax.exceptions import APIResponseException, InvalidOrderException
+from pyquidax.quidax import QuidaxClient
+from pyquidax.registry import MarketInfo, MarketRegistry
+from pyquidax.utils import APIResponse, Currency, CurrencyPair, OrderType
+from tests.utils import MockedAPICallTestCase
+
+MARKETS = [
+    {
+        "id": "btcngn",
+        "name": "BTC/NGN",
+        "base_unit": "btc",
+        "quote_unit": "ngn",
+        "trading_rules": {
+            "tick_size": "100",
+            "min_volume": "0.0001",
+            "volume_precision": 6,
+            "price_precision": 2,
+        },
+    },
+    {"id": "ethngn", "name": "ETH/NGN", "base_unit": "eth", "quote_unit": "ngn"},
+]
+
+
+def markets_response(status_code=200, data=MARKETS):
+    return APIResponse(status_code=status_code, status=None, message=None, data=data)
+
+
+class MarketRegistryTestCase(TestCase):
+    def setUp(self) -> None:
+        self.registry = MarketRegistry.from_response(markets_response())
+
+    def test_rules_are_read_from_markets(self):
+        self.assertEqual(
+            self.registry.get(CurrencyPair.BTC_NGN),
+            MarketInfo(
+                id="btcngn",
+                base_unit="btc",
+                quote_unit="ngn",
+                tick_size=Decimal("100"),
+                min_volume=Decimal("0.0001"),
+                price_precision=2,
+                volume_precision=6,
+            ),
+        )
+        self.assertIn("ethngn", self.registry)
+        self.assertEqual(len(self.registry), 2)
+
+    def test_precisions_sent_as_decimal_strings_are_read(self):
+        market = MarketInfo.from_market(
+            {
+                "id": "btcngn",
+                "price_precision": "2.0",
+                "volume_precision": "8.0",
+            }
+        )
+        self.assertEqual(market.price_precision, 2)
+        self.assertEqual(market.volume_precision, 8)
+
+    def test_failed_responses_are_raised(self):
+        with self.assertRaises(APIResponseException):
+            MarketRegistry.from_response(markets_response(500, None))
+
+    def test_orders_are_rounded_to_never_get_a_worse_price(self):
+        self.assertEqual(
+            self.registry.prepare_order(
+                CurrencyPair.BTC_NGN, OrderType.BUY, 20_000_050, 0.12345678
+            ),
+            (20_000_000.0, 0.123456),
+        )
+        self.assertEqual(
+            self.registry.prepare_order("btcngn", OrderType.SELL, "20000050", "1"),
+            ("20000100", "1"),
+        )
+
+    def test_unchanged_amounts_are_returned_as_given(self):
+        self.assertEqual(
+            self.registry.prepare_order("btcngn", OrderType.BUY, 100, 2), (100, 2)
+        )
+
+    def test_orders_below_the_minimum_are_rejected(self):
+        with self.assertRaises(InvalidOrderException) as context:
+            self.registry.prepare_order("btcngn", OrderType.BUY, 100, 0.00005)
+        self.assertIn("below the minimum", context.exception.errors[0][0])
+
+    def test_markets_without_rules_are_not_checked(self):
+        self.assertEqual(
+            self.registry.prepare_order("ethngn", OrderType.BUY, 1.234, 0.0000001),
+            (1.234, 0.0000001),
+        )
+        self.assertEqual(
+            self.registry.prepare_order("usdtngn", OrderType.BUY, 1, 1), (1, 1)
+        )
+
+    def test_instant_order_volumes_are_rounded_to_their_unit(self):
+        prepare = self.registry.prepare_instant_order
+        self.assertEqual(
+            prepare(Currency.NAIRA, Currency.BITCOIN, 0.1234567, "btc"), 0.123456
+        )
+        self.assertEqual(
+            prepare(Currency.BITCOIN, Currency.NAIRA, "1000.129", "ngn"), "1000.12"
+        )
+        with self.assertRaises(InvalidOrderException):
+            prepare(Currency.NAIRA, Currency.BITCOIN, 0.00001, "btc")
+
+
+class RegistryClientsTestCase(MockedAPICallTestCase):
+    def setUp(self) -> None:
+        self.registry = MarketRegistry.from_response(markets_response())
+
+    def test_invalid_orders_are_not_sent(self):
+        client = OrderClient(self.secret_key)
+        client.registry = self.registry
+        with patch.object(client, "_api_call") as api_call:
+            with self.assertRaises(InvalidOrderException):
+                client.create(CurrencyPair.BTC_NGN, OrderType.BUY, 100, 0.00001)
+            client.create(CurrencyPair.BTC_NGN, OrderType.BUY, 150, 1)
+        api_call.assert_called_once()
+        self.assertEqual(api_call.call_args.kwargs["data"]["price"], 100.0)
+        client.close()
+
+    def test_create_many_validates_with_the_registry(self):
+        client = OrderClient(self.secret_key)
+        client.registry = self.registry
+        orders = [
+            OrderRequest(CurrencyPair.BTC_NGN, OrderType.BUY, 1, price=100),
+            OrderRequest(CurrencyPair.BTC_NGN, OrderType.BUY, 0.00001, price=100),
+        ]
+        with patch.object(client, "create") as create:
+            with self.assertRaises(InvalidOrderException) as context:
+                client.create_many(orders)
+        create.assert_not_called()
+        self.assertEqual(list(context.exception.errors), [1])
+        client.close()
+
+    def test_orders_on_markets_missing_from_the_enum_are_accepted(self):
+        registry = MarketRegistry.from_response(
+            markets_response(
+                data=MARKETS
+                + [{"id": "newngn", "base_unit": "new", "quote_unit": "ngn"}]
+            )
+        )
+        order = OrderRequest(registry.pair("newngn"), OrderType.BUY, 1, price=100)
+        self.assertEqual(order.errors(), [])
+        self.assertEqual(
+            OrderRequest("newngn", OrderType.BUY, 1, price=100).errors(registry), []
+        )
+        self.assertEqual(
+            len(OrderRequest("newngn", OrderType.BUY, 1, price=100).errors()), 1
+        )
+        unlisted = OrderRequest(registry.pair("oldngn"), OrderType.BUY, 1, price=100)
+        self.assertEqual(len(unlisted.errors(registry)), 1)
+
+    def test_instant_orders_are_rounded(self):
+        client = InstantOrderClient(self.secret_key)
+        client.registry = self.registry
+        with patch.object(client, "_api_call") as api_call:
+            client.create(
+                Currency.NAIRA, Currency.BITCOIN, OrderType.BUY, 0.1234567, "btc"
+            )
+        self.assertEqual(api_call.call_args.kwargs["data"]["volume"], 0.123456)
+        client.close()
+
+    def test_quidax_client_binds_the_registry(self):
+        with QuidaxClient(self.secret_key, market_registry=self.registry) as client:
+            self.assertIs(client.orders.registry, self.registry)
+            self.assertIs(client.instant_orders.registry, self.registry)
+
+
+class SymbolsTestCase(TestCase):
+    def setUp(self) -> None:
+        self.registry = MarketRegistry.from_response(markets_response())
+
+    def test_symbols_are_interned_with_ids(self):
+        pair = self.registry.pair(CurrencyPair.BTC_NGN)
+        self.assertIs(self.registry.pair("btcngn"), pair)
+        self.assertEqual(pair.id, 0)
+        self.assertIs(self.registry.pairs[pair.id], pair)
+        self.assertIs(pair.base, self.registry.currency(Currency.BITCOIN))
+        self.assertEqual(
+            [str(currency) for currency in self.registry.currencies],
+            ["btc", "ngn", "eth"],
+        )
+
+    def test_symbols_are_compatible_with_enums(self):
+        pair = self.registry.pair("btcngn")
+        self.assertEqual(pair, CurrencyPair.BTC_NGN)
+        self.assertIs(pair.enum, CurrencyPair.BTC_NGN)
+        self.assertEqual(f"/markets/tickers/{pair}", "/markets/tickers/btcngn")
+        self.assertIs(self.registry.get(pair), self.registry.get(CurrencyPair.BTC_NGN))
+
+    def test_unlisted_markets_are_interned_on_first_use(self):
+        pair = self.registry.pair("newngn")
+        self.assertEqual(pair.id, 2)
+        self.assertIsNone(pair.enum)
+        self.assertIsNone(pair.base)
+
+    def test_symbols_can_be_pickled(self):
+        pair = pickle.loads(pickle.dumps(self.registry.pair("btcngn")))
+        self.assertEqual((pair, pair.id, pair.quote), ("btcngn", 0, "ngn"))
+
+
+class FakeMarkets:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def all(self):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+class CacheTestCase(TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "markets.json")
+
+    def test_markets_are_fetched_once(self):
+        markets = FakeMarkets(markets_response())
+        MarketRegistry.load(markets, cache_path=self.path)
+        registry = MarketRegistry.load(markets, cache_path=self.path)
+        self.assertEqual(markets.calls, 1)
+        self.assertEqual(registry.pair("btcngn").quote, "ngn")
+
+    def test_stale_caches_are_refreshed(self):
+        MarketRegistry.load(FakeMarkets(markets_response()), cache_path=self.path)
+        markets = FakeMarkets(markets_response(data=MARKETS[1:]))
+        registry = MarketRegistry.load(markets, cache_path=self.path, max_age=-1)
+        self.assertEqual(markets.calls, 1)
+        self.assertNotIn("btcngn", registry)
+
+    def test_stale_caches_are_used_when_fetching_fails(self):
+        MarketRegistry.load(FakeMarkets(markets_response()), cache_path=self.path)
+        registry = MarketRegistry.load(
+            FakeMarkets(markets_response(500, None)), cache_path=self.path, max_age=-1
+        )
+        self.assertIn("btcngn", registry)
+        with self.assertRaises(APIResponseException):
+            MarketRegistry.load(
+                FakeMarkets(markets_response(500, None)), cache_path=self.path + "x"
+            )
+
+    def test_unwritable_caches_are_ignored(self):
+        path = os.path.join(self.path, "missing", "markets.json")
+        registry = MarketRegistry.load(FakeMarkets(markets_response()), cache_path=path)
+        self.assertIn("btcngn", registry)
+        self.assertFalse(os.path.exists(os.path.dirname(path)))
@@ -0,0 +1,101 @@
+import math
+from unittest import TestCase, skipIf
+from unittest.mock import Mock, patch
+
+from pyquidax import slippage
+from pyquidax.registry import MarketInfo, MarketRegistry
+from pyquidax.slippage import SlippageEstimator
+from pyquidax.utils import APIResponse, Currency, CurrencyPair, Kind
+
+
+class SlippageEstimatorTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.estimator = SlippageEstimator.from_response(
+            CurrencyPair.BTC_NGN,
+            {
+                "asks": [["101", "1"], ["102", "2"]],
+                "bids": [["99", "1"], ["98", "2"]],
+            },
+        )
+
+    def test_estimate_buy_volumes(self):
+        within_best, across_levels = self.estimator.estimate(Kind.BID, [0.5, 2])
+        self.assertEqual(within_best.vwap, 101.0)
+        self.assertEqual(within_best.slippage, 0.0)
+        self.assertEqual(across_levels.total, 101.0 + 102.0)
+        self.assertEqual(across_levels.vwap, 101.5)
+        self.assertEqual(across_levels.worst_price, 102.0)
+
+    def test_estimate_sell_volume(self):
+        (estimate,) = self.estimator.estimate(Kind.ASK, [3])
+        self.assertEqual(estimate.total, 99.0 + 2 * 98.0)
+        self.assertEqual(estimate.worst_price, 98.0)
+
+    def test_estimate_in_quote_currency(self):
+        (estimate,) = self.estimator.estimate(Kind.BID, [101.0 + 51.0], in_total=True)
+        self.assertEqual(estimate.filled, 1.5)
+
+    def test_estimate_beyond_book_depth_is_partial(self):
+        (estimate,) = self.estimator.estimate(Kind.BID, [10])
+        self.assertEqual(estimate.filled, 3.0)
+        self.assertEqual(estimate.volume, 10)
+
+    def test_estimate_on_empty_side(self):
+        estimator = SlippageEstimator.from_response(CurrencyPair.BTC_NGN, {})
+        (estimate,) = estimator.estimate(Kind.BID, [1])
+        self.assertEqual(estimate.filled, 0.0)
+        self.assertTrue(math.isnan(estimate.vwap))
+
+    @skipIf(slippage.numpy is None, "NumPy is not installed")
+    def test_large_batches_match_the_pure_python_estimates(self):
+        volumes = [0.0, 0.5, 1.0, 1.5, 3.0, 10.0] * 20
+        for kind, in_total in ((Kind.BID, False), (Kind.BID, True), (Kind.ASK, False)):
+            vectorized = self.estimator.estimate(kind, volumes, in_total=in_total)
+            with patch.object(slippage, "numpy", None):
+                expected = self.estimator.estimate(kind, volumes, in_total=in_total)
+            for name in ("filled", "vwap", "worst_price", "total", "slippage"):
+                slippage.numpy.testing.assert_allclose(
+                    [getattr(estimate, name) for estimate in vectorized],
+                    [getattr(estimate, name) for estimate in expected],
+                )
+
+    def test_verify_against_quote(self):
+        client = Mock()
+        client.orders.registry = MarketRegistry(
+            [MarketInfo(id="btcngn", base_unit="btc", quote_unit="ngn")]
+        )
+        client.quotes.return_value = APIResponse(
+            status_code=200,
+            status="success",
+            message=None,
+            data={"price": {"unit": "ngn", "amount": "101.5"}},
+        )
+        verification = self.estimator.verify(client, Currency.BITCOIN, Kind.BID, 2)
+        client.quotes.assert_called_once_with(
+            CurrencyPair.BTC_NGN, Currency.BITCOIN, Kind.BID, 2
+        )
+        self.assertEqual(verification.deviation, 0.0)
+
+    def test_verify_in_quote_currency(self):
+        registry = MarketRegistry(
+            [MarketInfo(id="btcngn", base_unit="btc", quote_unit="ngn")]
+        )
+        estimator = SlippageEstimator.from_response(
+            CurrencyPair.BTC_NGN, {"asks": [["101", "1"]]}, registry
+        )
+        client = Mock()
+        client.quotes.return_value = APIResponse(
+            status_code=200,
+            status="success",
+            message=None,
+            data={"price": {"unit": "ngn", "amount": "101"}},
+        )
+        verification = estimator.verify(client, Currency.NAIRA, Kind.BID, 50.5)
+        self.assertEqual(verification.estimate.filled, 0.5)
+
+    def test_verify_requires_a_known_quote_currency(self):
+        client = Mock()
+        client.orders.registry = None
+        with self.assertRaises(ValueError):
+            self.estimator.verify(client, Currency.BITCOIN, Kind.BID, 2)
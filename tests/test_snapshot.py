@@ -0,0 +1,52 @@
+import math
+from unittest import TestCase
+
+from pyquidax.snapshot import MarketSnapshot, PAIRS, pair_index
+from pyquidax.utils import APIResponse, CurrencyPair
+
+
+class MarketSnapshotTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.snapshot = MarketSnapshot.from_tickers(
+            APIResponse(
+                status_code=200,
+                status="success",
+                message=None,
+                data={
+                    "btcngn": {
+                        "at": 1700000000,
+                        "ticker": {
+                            "buy": "99",
+                            "sell": "101",
+                            "last": "100",
+                            "vol": "5",
+                        },
+                    },
+                    "notamarket": {"at": 1700000001, "ticker": {"last": "1"}},
+                },
+            )
+        )
+
+    def test_pair_indexes_are_fixed_and_dense(self):
+        self.assertEqual(
+            sorted(pair_index(pair) for pair in CurrencyPair), list(range(len(PAIRS)))
+        )
+        self.assertEqual(pair_index("btcngn"), pair_index(CurrencyPair.BTC_NGN))
+
+    def test_lookup_by_pair(self):
+        ticker = self.snapshot[CurrencyPair.BTC_NGN]
+        self.assertEqual(
+            (ticker.last, ticker.bid, ticker.ask, ticker.volume), (100, 99, 101, 5)
+        )
+        self.assertEqual(self.snapshot.last[pair_index(CurrencyPair.BTC_NGN)], 100)
+        self.assertEqual(self.snapshot.at, 1700000000)
+
+    def test_missing_markets_are_nan(self):
+        self.assertTrue(math.isnan(self.snapshot[CurrencyPair.ETH_NGN].last))
+
+    def test_whole_market_computations(self):
+        index = pair_index(CurrencyPair.BTC_NGN)
+        self.assertEqual(self.snapshot.mid()[index], 100)
+        self.assertEqual(self.snapshot.spread()[index], 0.02)
+        self.assertEqual(len(self.snapshot.spread()), len(PAIRS))
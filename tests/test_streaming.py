@@ -0,0 +1,171 @@
+import asyncio
+import socket
+import threading
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import patch
+
+from pyquidax import streaming
+from pyquidax.exceptions import ConnectionException
+from pyquidax.streaming import (
+    AsyncMarketStream,
+    MarketStream,
+    _FrameDecoder,
+    _encode_frame,
+    order_book_channel,
+    ticker_channel,
+)
+from pyquidax.testing import LocalStreamServer
+from pyquidax.utils import CurrencyPair
+
+
+class FrameTestCase(TestCase):
+    def test_masked_frames_round_trip(self):
+        decoder = _FrameDecoder()
+        for payload in (b"", b"short", b"x" * 300, b"y" * 70_000):
+            frame = _encode_frame(0x1, payload, mask=True)
+            self.assertEqual(decoder.feed(frame[:3]), [])
+            self.assertEqual(decoder.feed(frame[3:]), [(0x1, payload)])
+
+    def test_fragmented_messages_are_reassembled(self):
+        decoder = _FrameDecoder()
+        first = bytearray(_encode_frame(0x1, b"hello ", mask=False))
+        first[0] &= 0x7F
+        last = bytearray(_encode_frame(0x0, b"world", mask=False))
+        self.assertEqual(decoder.feed(bytes(first + last)), [(0x1, b"hello world")])
+
+
+class MarketStreamTestCase(TestCase):
+    def setUp(self) -> None:
+        self.server = LocalStreamServer()
+        self.server.start()
+        self.stream = MarketStream(
+            self.server.url, reconnect_delay=0.01, read_timeout=5
+        )
+        self.messages = iter(self.stream)
+
+    def tearDown(self) -> None:
+        self.stream.close()
+        self.server.stop()
+
+    def next_message(self):
+        result = []
+        thread = threading.Thread(target=lambda: result.append(next(self.messages)))
+        thread.start()
+        return thread, result
+
+    def test_stream_receives_subscribed_channels(self):
+        channel = self.stream.subscribe_ticker(CurrencyPair.BTC_NGN)
+        thread, result = self.next_message()
+        self.assertTrue(self.server.wait_for_subscribers(channel))
+        self.server.publish(order_book_channel(CurrencyPair.BTC_NGN), {"asks": []})
+        self.server.publish(channel, {"last": "100"})
+        thread.join(timeout=5)
+        (message,) = result
+        self.assertEqual(message.channel, "ticker:btcngn")
+        self.assertEqual(message.data, {"last": "100"})
+        self.assertEqual(message.sequence, 1)
+        self.assertFalse(message.gap)
+
+    def test_sequence_gaps_are_flagged(self):
+        channel = self.stream.subscribe_ticker(CurrencyPair.BTC_NGN)
+        thread, result = self.next_message()
+        self.assertTrue(self.server.wait_for_subscribers(channel))
+        self.server.publish(channel, {"last": "100"})
+        thread.join(timeout=5)
+        self.server.skip(channel, 2)
+        self.server.publish(channel, {"last": "101"})
+        message = next(self.messages)
+        self.assertEqual(message.sequence, 4)
+        self.assertTrue(message.gap)
+
+    def test_stream_reconnects_and_resubscribes(self):
+        channel = self.stream.subscribe_ticker(CurrencyPair.ETH_NGN)
+        thread, result = self.next_message()
+        self.assertTrue(self.server.wait_for_subscribers(channel))
+        self.server.publish(channel, {"last": "10"})
+        thread.join(timeout=5)
+
+        thread, result = self.next_message()
+        self.server.disconnect_all()
+        self.assertTrue(self.server.wait_for_subscribers(channel))
+        self.server.skip(channel)
+        self.server.publish(channel, {"last": "11"})
+        thread.join(timeout=5)
+        (message,) = result
+        self.assertEqual(message.data, {"last": "11"})
+        self.assertTrue(message.gap)
+
+
+class DroppingStreamServer(LocalStreamServer):
+    """Accepts the handshake, then drops the connection on the first subscription."""
+
+    def _handle(self, connection, payload):
+        connection.close()
+
+
+def unreachable_url() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"ws://127.0.0.1:{port}"
+
+
+class ReconnectTestCase(TestCase):
+    def test_reconnection_attempts_are_bounded_by_default(self):
+        stream = MarketStream(unreachable_url(), reconnect_delay=0.001)
+        with self.assertRaises(ConnectionException):
+            next(iter(stream))
+
+    def test_connections_dropped_before_any_data_are_bounded(self):
+        with DroppingStreamServer() as server:
+            connections = []
+            original = streaming._WebSocket.__init__
+
+            def counting_init(websocket, *args):
+                connections.append(websocket)
+                original(websocket, *args)
+
+            stream = MarketStream(
+                server.url, reconnect_delay=0.001, max_reconnect_attempts=3
+            )
+            stream.subscribe_ticker(CurrencyPair.BTC_NGN)
+            with patch.object(streaming._WebSocket, "__init__", counting_init):
+                with self.assertRaises(ConnectionException):
+                    next(iter(stream))
+            self.assertEqual(len(connections), 4)
+
+    def test_close_interrupts_the_backoff(self):
+        stream = MarketStream(unreachable_url(), reconnect_delay=60)
+        thread = threading.Thread(target=lambda: list(stream))
+        thread.start()
+        stream.close()
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+
+
+class AsyncMarketStreamTestCase(IsolatedAsyncioTestCase):
+    async def test_stream_receives_subscribed_channels(self):
+        with LocalStreamServer() as server:
+            stream = AsyncMarketStream(server.url, reconnect_delay=0.01)
+            channel = await stream.subscribe(ticker_channel(CurrencyPair.BTC_NGN))
+            messages = stream.__aiter__()
+            next_message = asyncio.ensure_future(messages.__anext__())
+            subscribed = await asyncio.get_running_loop().run_in_executor(
+                None, server.wait_for_subscribers, channel
+            )
+            self.assertTrue(subscribed)
+            server.publish(channel, {"last": "100"})
+            message = await asyncio.wait_for(next_message, 5)
+            self.assertEqual(message.data, {"last": "100"})
+
+            server.disconnect_all()
+            next_message = asyncio.ensure_future(messages.__anext__())
+            await asyncio.get_running_loop().run_in_executor(
+                None, server.wait_for_subscribers, channel
+            )
+            server.publish(channel, {"last": "101"})
+            message = await asyncio.wait_for(next_message, 5)
+            self.assertEqual(message.sequence, 2)
+            self.assertFalse(message.gap)
+            await stream.close()
+            await messages.aclose()
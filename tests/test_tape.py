@@ -0,0 +1,119 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, Mock
+
+from pyquidax.tape import AsyncTradeTape, TradeTape, TradeWindow
+from pyquidax.utils import APIResponse, CurrencyPair
+
+
+def trade(id, created_at: str) -> dict:
+    return {
+        "id": id,
+        "price": {"unit": "ngn", "amount": "100.5"},
+        "volume": {"unit": "btc", "amount": "0.1"},
+        "side": "buy",
+        "created_at": created_at,
+    }
+
+
+def trades_response(*trades: dict) -> APIResponse:
+    return APIResponse(
+        status_code=200, status="success", message=None, data=list(trades)
+    )
+
+
+class TradeWindowTestCase(TestCase):
+    def test_window_forgets_oldest_ids(self):
+        window = TradeWindow(size=2)
+        self.assertTrue(window.add(1))
+        self.assertFalse(window.add(1))
+        window.add(2)
+        window.add(3)
+        self.assertNotIn(1, window)
+        self.assertIn(3, window)
+        self.assertEqual(len(window), 2)
+
+
+class TradeTapeTestCase(TestCase):
+    def test_only_new_trades_are_emitted_oldest_first(self):
+        trades = Mock()
+        trades.get.side_effect = [
+            trades_response(
+                trade(2, "2024-01-01T00:00:02Z"), trade(1, "2024-01-01T00:00:01Z")
+            ),
+            trades_response(
+                trade(3, "2024-01-01T00:00:03+00:00"),
+                trade(2, "2024-01-01T00:00:02Z"),
+            ),
+        ]
+        tape = TradeTape(trades, [CurrencyPair.BTC_NGN])
+
+        first = tape.poll(CurrencyPair.BTC_NGN)
+        second = tape.poll(CurrencyPair.BTC_NGN)
+
+        self.assertEqual([t.id for t in first], [1, 2])
+        self.assertEqual([t.id for t in second], [3])
+        self.assertEqual(second[0].price, 100.5)
+        self.assertEqual(second[0].timestamp, 1704067203)
+        self.assertEqual(second[0].pair, "btcngn")
+
+    def test_trades_of_the_same_second_are_ordered_by_id(self):
+        trades = Mock()
+        same_second = "2024-01-01T00:00:01Z"
+        trades.get.side_effect = [
+            trades_response(
+                trade(None, same_second),
+                trade(12, same_second),
+                trade(11, same_second),
+            ),
+            trades_response(trade(None, same_second), trade(12, same_second)),
+        ]
+        tape = TradeTape(trades, [CurrencyPair.BTC_NGN])
+
+        first = tape.poll(CurrencyPair.BTC_NGN)
+        second = tape.poll(CurrencyPair.BTC_NGN)
+
+        self.assertEqual([t.id for t in first], [11, 12, None])
+        self.assertEqual(second, [])
+
+    def test_trades_without_an_id_are_deduplicated_by_content(self):
+        trades = Mock()
+        same_second = "2024-01-01T00:00:01Z"
+        bigger = {**trade(None, same_second), "volume": {"unit": "btc", "amount": "1"}}
+        trades.get.side_effect = [
+            trades_response(trade(None, same_second)),
+            trades_response(trade(None, same_second), bigger),
+        ]
+        tape = TradeTape(trades, [CurrencyPair.BTC_NGN])
+
+        tape.poll(CurrencyPair.BTC_NGN)
+        second = tape.poll(CurrencyPair.BTC_NGN)
+
+        self.assertEqual([t.volume for t in second], [1.0])
+
+    def test_iteration_polls_every_pair(self):
+        trades = Mock()
+        trades.get.return_value = trades_response(trade(1, "2024-01-01T00:00:01Z"))
+        tape = TradeTape(trades, [CurrencyPair.BTC_NGN, CurrencyPair.ETH_NGN])
+        emitted = iter(tape)
+        self.assertEqual(next(emitted).pair, "btcngn")
+        self.assertEqual(next(emitted).pair, "ethngn")
+
+
+class AsyncTradeTapeTestCase(IsolatedAsyncioTestCase):
+    async def test_only_new_trades_are_emitted(self):
+        trades = Mock()
+        trades.get = AsyncMock(
+            side_effect=[
+                trades_response(trade(1, "2024-01-01T00:00:01Z")),
+                trades_response(
+                    trade(2, "2024-01-01T00:00:02Z"), trade(1, "2024-01-01T00:00:01Z")
+                ),
+            ]
+        )
+        tape = AsyncTradeTape(trades, [CurrencyPair.BTC_NGN], interval=0)
+        emitted = []
+        async for new_trade in tape:
+            emitted.append(new_trade.id)
+            if len(emitted) == 2:
+                tape.close()
+        self.assertEqual(emitted, [1, 2])
@@ -0,0 +1,116 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import AsyncMock, Mock
+
+from pyquidax.tickers import AsyncTickerHub, TickerHub
+from pyquidax.utils import APIResponse, CurrencyPair
+
+
+def tickers_response(btc_last: str, eth_last: str) -> APIResponse:
+    return APIResponse(
+        status_code=200,
+        status="success",
+        message=None,
+        data={
+            "btcngn": {"at": 1, "ticker": {"last": btc_last}},
+            "ethngn": {"at": 1, "ticker": {"last": eth_last}},
+        },
+    )
+
+
+class TickerHubTestCase(TestCase):
+    def test_subscribers_are_only_notified_on_change(self):
+        markets = Mock()
+        markets.tickers.side_effect = [
+            tickers_response("100", "10"),
+            tickers_response("101", "10"),
+        ]
+        hub = TickerHub(markets)
+        btc_callback, eth_callback = Mock(), Mock()
+        hub.subscribe(CurrencyPair.BTC_NGN, btc_callback)
+        hub.subscribe(CurrencyPair.ETH_NGN, eth_callback)
+
+        hub.poll()
+        hub.poll()
+
+        self.assertEqual(markets.tickers.call_count, 2)
+        self.assertEqual(btc_callback.call_count, 2)
+        eth_callback.assert_called_once_with(
+            "ethngn", {"at": 1, "ticker": {"last": "10"}}
+        )
+
+    def test_queue_and_unsubscribe(self):
+        markets = Mock()
+        markets.tickers.side_effect = [
+            tickers_response("100", "10"),
+            tickers_response("101", "11"),
+        ]
+        hub = TickerHub(markets)
+        updates = hub.queue(CurrencyPair.BTC_NGN)
+        callback = Mock()
+        unsubscribe = hub.subscribe(CurrencyPair.ETH_NGN, callback)
+
+        hub.poll()
+        unsubscribe()
+        hub.poll()
+
+        self.assertEqual(updates.qsize(), 2)
+        callback.assert_called_once()
+
+    def test_full_queues_drop_their_oldest_update(self):
+        markets = Mock()
+        markets.tickers.side_effect = [
+            tickers_response(str(last), "10") for last in range(100, 103)
+        ]
+        hub = TickerHub(markets)
+        updates = hub.queue(CurrencyPair.BTC_NGN, maxsize=2)
+        for _ in range(3):
+            hub.poll()
+        self.assertEqual(
+            [updates.get_nowait()["ticker"]["last"] for _ in range(2)], ["101", "102"]
+        )
+
+    def test_background_polling(self):
+        markets = Mock()
+        markets.tickers.return_value = tickers_response("100", "10")
+        hub = TickerHub(markets, interval=0.01)
+        updates = hub.queue(CurrencyPair.BTC_NGN)
+        with hub:
+            self.assertEqual(updates.get(timeout=1)["ticker"]["last"], "100")
+
+
+class AsyncTickerHubTestCase(IsolatedAsyncioTestCase):
+    async def test_stream_yields_changed_tickers(self):
+        markets = Mock()
+        markets.tickers = AsyncMock(
+            side_effect=[
+                tickers_response("100", "10"),
+                tickers_response("100", "11"),
+                tickers_response("101", "11"),
+            ]
+        )
+        hub = AsyncTickerHub(markets)
+        stream = hub.stream(CurrencyPair.BTC_NGN)
+        self.assertEqual(hub._callbacks, {})
+        first = asyncio.ensure_future(stream.__anext__())
+        await asyncio.sleep(0)
+        callback = AsyncMock()
+        hub.subscribe(CurrencyPair.ETH_NGN, callback)
+        for _ in range(3):
+            await hub.poll()
+        self.assertEqual((await first)["ticker"]["last"], "100")
+        self.assertEqual((await stream.__anext__())["ticker"]["last"], "101")
+        self.assertEqual(callback.await_count, 2)
+        await stream.aclose()
+        self.assertEqual(hub._callbacks["btcngn"], [])
+
+    async def test_full_queues_do_not_block_polling(self):
+        markets = Mock()
+        markets.tickers = AsyncMock(
+            side_effect=[tickers_response(str(last), "10") for last in range(100, 103)]
+        )
+        hub = AsyncTickerHub(markets)
+        updates = hub.queue(CurrencyPair.BTC_NGN, maxsize=1)
+        for _ in range(3):
+            await asyncio.wait_for(hub.poll(), 1)
+        self.assertEqual(updates.get_nowait()["ticker"]["last"], "102")
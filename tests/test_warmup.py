@@ -0,0 +1,111 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pyquidax.base import BaseAPIWrapper, BaseAsyncAPIWrapper
+from pyquidax.order_lane import OrderLane
+from pyquidax.utils import HTTPMethod
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.connections.add(self.client_address)
+        self.server.paths.append(self.path)
+        time.sleep(0.05)
+        body = b'{"status": "success", "data": {}}'
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class LocalServerMixin:
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), CountingHandler)
+        self.server.connections = set()
+        self.server.paths = []
+        self.server.daemon_threads = True
+        threading.Thread(
+            target=self.server.serve_forever, args=(0.01,), daemon=True
+        ).start()
+        host, port = self.server.server_address
+        self.base_url = f"http://{host}:{port}/api/v1"
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class LocalWrapper(BaseAPIWrapper):
+    base_url = None
+
+
+class AsyncLocalWrapper(BaseAsyncAPIWrapper):
+    base_url = None
+
+
+class LocalOrderLane(OrderLane):
+    base_url = None
+
+
+class WarmupTestCase(LocalServerMixin, TestCase):
+    def test_warmup_opens_reusable_connections(self):
+        wrapper = LocalWrapper("qwerty")
+        wrapper.base_url = self.base_url
+        with wrapper:
+            self.assertEqual(wrapper.warmup(connections=3), 3)
+            self.assertEqual(len(self.server.connections), 3)
+            wrapper._api_call(f"{self.base_url}/markets", HTTPMethod.GET)
+            self.assertEqual(len(self.server.connections), 3)
+
+    def test_keepalive_warms_up_periodically(self):
+        wrapper = LocalWrapper("qwerty")
+        wrapper.base_url = self.base_url
+        with wrapper:
+            wrapper.start_keepalive(interval=0.01)
+            time.sleep(0.2)
+            wrapper.stop_keepalive()
+        self.assertEqual(len(self.server.connections), 1)
+
+    def test_stopping_the_keepalive_waits_for_its_thread(self):
+        errors = []
+        excepthook, threading.excepthook = threading.excepthook, errors.append
+        self.addCleanup(setattr, threading, "excepthook", excepthook)
+        wrapper = LocalWrapper("qwerty")
+        wrapper.base_url = self.base_url
+        wrapper.start_keepalive(interval=0.01)
+        thread = wrapper._keepalive_thread
+        time.sleep(0.02)
+        wrapper.close()
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(errors, [])
+
+    def test_warmups_fetch_the_user_of_the_wrapper(self):
+        with LocalOrderLane("qwerty", user_id="42") as lane:
+            lane.base_url = self.base_url
+            self.assertEqual(lane.warmup(), 1)
+        self.assertEqual(self.server.paths, ["/api/v1/users/42"])
+
+    def test_failed_warmups_are_counted(self):
+        wrapper = LocalWrapper("qwerty")
+        wrapper.base_url = "http://127.0.0.1:1/api/v1"
+        with wrapper:
+            self.assertEqual(wrapper.warmup(connections=2), 0)
+
+
+class AsyncWarmupTestCase(LocalServerMixin, IsolatedAsyncioTestCase):
+    async def test_warmup_opens_reusable_connections(self):
+        wrapper = AsyncLocalWrapper("qwerty")
+        wrapper.base_url = self.base_url
+        async with wrapper:
+            self.assertEqual(await wrapper.warmup(connections=2), 2)
+            self.assertEqual(len(self.server.connections), 2)
+            await wrapper._api_call(f"{self.base_url}/markets", HTTPMethod.GET)
+            self.assertEqual(len(self.server.connections), 2)
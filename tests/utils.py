@@ -19,13 +19,13 @@ class MockedAPICallTestCase(DummyDataMixin, TestCase):
     @classmethod
     def setUpClass(cls) -> None:
         super().setUpClass()
-        cls.get_patcher = patch("httpx.get")
-        cls.post_patcher = patch("httpx.post")
-        cls.put_patcher = patch("httpx.put")
-        cls.patch_patcher = patch("httpx.patch")
-        cls.delete_patcher = patch("httpx.delete")
-        cls.options_patcher = patch("httpx.options")
-        cls.head_patcher = patch("httpx.head")
+        cls.get_patcher = patch("httpx.Client.get")
+        cls.post_patcher = patch("httpx.Client.post")
+        cls.put_patcher = patch("httpx.Client.put")
+        cls.patch_patcher = patch("httpx.Client.patch")
+        cls.delete_patcher = patch("httpx.Client.delete")
+        cls.options_patcher = patch("httpx.Client.options")
+        cls.head_patcher = patch("httpx.Client.head")
 
         mock_get = cls.get_patcher.start()
         mock_get.return_value = cls.mocked_api_response